@@ -14,8 +14,12 @@ import matplotlib.patches as mpatches
 
 from core.models import BuildingInput, RoomCountInput, CompassDirection
 from core.building_codes import BuildingCodes
-from core.genetic import generate_plans
+from core.building_layout import compute_building_layout
+from core.feasibility import check_feasibility
+from core.genetic import generate_plans, WarmStart
+from core.raster import compute_egress
 from export.svg_renderer import render_plan
+from export.takeoff import compute_takeoff, takeoff_to_csv, takeoff_to_json
 
 try:
     from export.dxf_exporter import export_to_dxf
@@ -156,7 +160,6 @@ if st.button("🏗️  Planları Üret", type="primary", use_container_width=Tru
         )
 
         # PAİY uyumluluk kontrolleri
-        from core.building_layout import compute_building_layout
         zones = compute_building_layout(building, codes)
         if zones.warnings:
             for w in zones.warnings:
@@ -165,8 +168,27 @@ if st.button("🏗️  Planları Üret", type="primary", use_container_width=Tru
                 else:
                     st.info(w)
 
-        with st.spinner("Planlar üretiliyor..."):
-            plans = generate_plans(building, room_counts, codes, n_alternatives=4)
+        # Yerleşimden önce analitik uygulanabilirlik kontrolü
+        report = check_feasibility(building, room_counts, codes, zones=zones)
+
+        if not report.feasible:
+            plans = []
+            for msg in report.summary()[:5]:
+                st.error(f"⛔ {msg}")
+        else:
+            with st.spinner("Planlar üretiliyor..."):
+                # Küçük girdi değişikliklerinde önceki sonuçlardan devam et;
+                # yönetmelik ayarları değişirse önceki sonuçlar geçersiz
+                codes_key = repr(sorted(codes.raw.items()))
+                if st.session_state.get("warm_start_codes") != codes_key:
+                    st.session_state["warm_start"] = WarmStart()
+                    st.session_state["warm_start_codes"] = codes_key
+                warm = st.session_state["warm_start"]
+                # Uygulanabilirlik yukarıda kontrol edildi; generate_plans tekrarlamasın
+                plans = generate_plans(
+                    building, room_counts, codes, n_alternatives=4, warm_start=warm,
+                    precheck=False,
+                )
 
         if not plans:
             st.error("Plan üretilemedi. Farklı boyutlar deneyin.")
@@ -219,15 +241,49 @@ if "plans" in st.session_state:
                         key=f"png_{i}",
                     )
 
+    # Metraj: tüm alternatifler ve katlar (normal kat tekrarı)
+    takeoff = compute_takeoff(plans[:4], codes, floors=range(num_floors))
+    col_csv, col_json = st.columns(2)
+    with col_csv:
+        st.download_button(
+            "📊 Metraj CSV",
+            data=takeoff_to_csv(takeoff),
+            file_name="metraj.csv",
+            mime="text/csv",
+            key="takeoff_csv",
+        )
+    with col_json:
+        st.download_button(
+            "📊 Metraj JSON",
+            data=takeoff_to_json(takeoff),
+            file_name="metraj.json",
+            mime="application/json",
+            key="takeoff_json",
+        )
+
     if "zoomed_plan" in st.session_state:
         idx = st.session_state["zoomed_plan"]
         if idx < len(plans):
             st.divider()
             st.subheader(f"Detaylı Görünüm: {plans[idx].plan_id}")
-            fig_big = render_plan(plans[idx], figsize=(16, 12))
+            show_egress = st.checkbox("Kaçış mesafesi katmanı", key="egress_layer")
+            egress = compute_egress(plans[idx], codes) if show_egress else None
+            fig_big = render_plan(plans[idx], figsize=(16, 12), egress=egress)
             st.pyplot(fig_big, use_container_width=True)
             plt.close(fig_big)
 
+            if egress is not None:
+                st.markdown(f"**Daire girişinden merdivene mesafe** (sınır {egress.limit:.0f} m):")
+                st.table([
+                    {
+                        "Daire": f"Daire {apt + 1}",
+                        "Girişten (m)": f"{dist:.1f}",
+                        "En uzak nokta (m)": f"{egress.farthest.get(apt, dist):.1f}",
+                        "Durum": "✅" if dist <= egress.limit else "⚠️ Aşıyor",
+                    }
+                    for apt, dist in egress.per_apartment.items()
+                ])
+
             st.markdown("**Oda Detayları:**")
             room_data = []
             for room in plans[idx].rooms:
@@ -51,14 +51,22 @@ FILES_TO_EMBED = [
     ("core/room_defaults.py", "core/room_defaults.py"),
     ("core/corridor.py", "core/corridor.py"),
     ("core/envelope.py", "core/envelope.py"),
+    ("core/assignment.py", "core/assignment.py"),
+    ("core/unit_mix.py", "core/unit_mix.py"),
+    ("core/feasibility.py", "core/feasibility.py"),
+    ("core/design_space.py", "core/design_space.py"),
+    ("core/editing.py", "core/editing.py"),
+    ("core/raster.py", "core/raster.py"),
 
     # Export modulleri
     ("export/__init__.py", "export/__init__.py"),
     ("export/svg_renderer.py", "export/svg_renderer.py"),
     ("export/dxf_exporter.py", "export/dxf_exporter.py"),
+    ("export/takeoff.py", "export/takeoff.py"),
 
     # Sayfalar
     ("pages/admin.py", "pages/admin.py"),
+    ("pages/design_space.py", "pages/design_space.py"),
 
     # Config
     ("config/building_codes_tr.json", "config/building_codes_tr.json"),
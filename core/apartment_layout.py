@@ -24,13 +24,23 @@ Strateji:
 
 from __future__ import annotations
 
+import itertools
 import random
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
 
 from .models import (
-    Rect, RoomType, PlacedRoom, DoorPlacement, WindowPlacement,
+    Rect, RoomType, PlacedRoom, DoorPlacement, CompassDirection,
 )
 from .building_codes import BuildingCodes
+from .corridor import WALL_GAP
+from .fitness import facade_contact, orientation_scores, ROOM_TYPE_INDEX
+
+if TYPE_CHECKING:
+    from .genetic import ConvergenceTrace
+    from .slicing_tree import SlicingGenome
 
 
 @dataclass
@@ -40,31 +50,73 @@ class ApartmentPlan:
     corridor: PlacedRoom
     entry: PlacedRoom  # Antre
     score: float = 0.0
+    search_trace: Optional["ConvergenceTrace"] = None  # Yalnızca genetik aramada
+    genome: Optional["SlicingGenome"] = None           # Yalnızca genetik aramada (warm start)
 
 
-def layout_apartment(
+def translate_plan(plan: ApartmentPlan, dx: float, dy: float, apartment_id: int) -> ApartmentPlan:
+    """
+    Daire planını (dx, dy) kadar kaydırıp apartment_id'sini değiştir.
+    Aynı şekilli bölgeler için önbellekteki varyantları yeniden kullanmaya yarar.
+    """
+    def _move(room: PlacedRoom) -> PlacedRoom:
+        r = room.rect
+        room_id = room.room_id
+        if room.room_type in (RoomType.ANTRE, RoomType.KORIDOR_DAIRE):
+            room_id = f"{room.room_type.value}_{apartment_id}"
+        return room.model_copy(update={
+            "room_id": room_id,
+            "apartment_id": apartment_id,
+            "rect": Rect(x=r.x + dx, y=r.y + dy, w=r.w, h=r.h),
+            "doors": [
+                d.model_copy(update={
+                    "position": d.position + (dx if d.wall_side in ("north", "south") else dy),
+                })
+                for d in room.doors
+            ],
+            "windows": [
+                w.model_copy(update={
+                    "position": w.position + (dx if w.wall_side in ("north", "south") else dy),
+                })
+                for w in room.windows
+            ],
+        })
+
+    return ApartmentPlan(
+        rooms=[_move(r) for r in plan.rooms],
+        corridor=_move(plan.corridor),
+        entry=_move(plan.entry),
+        score=plan.score,
+        search_trace=plan.search_trace,
+        genome=plan.genome,
+    )
+
+
+@dataclass
+class _StripSetup:
+    """Koridor ve iki şeridin yatay geometrisi + şerit oda atamaları."""
+    left_x: float
+    left_w: float
+    corr_x: float
+    right_x: float
+    right_w: float
+    left_types: list[RoomType]
+    right_types: list[RoomType]
+
+
+def _strip_setup(
     zone: Rect,
     room_types: list[RoomType],
-    building_rect: Rect,
-    corridor_side: str,
-    apartment_id: int,
     codes: BuildingCodes,
-    variant: int = 0,
-) -> ApartmentPlan:
-    """
-    Daire bölgesi içinde odaları yerleştir.
-
-    zone: dairenin sınır dikdörtgeni
-    corridor_side: bina koridorunun daire sınırına göre yönü ("north"/"south")
-      - "north" ise giriş kapısı dairenin güney kenarında (koridora bakan)
-      - "south" ise giriş kapısı dairenin kuzey kenarında
-    """
+    variant: int,
+) -> _StripSetup:
+    """Varyanta göre koridor konumunu ve şerit oda listelerini belirle."""
     iw = codes.inner_wall  # iç duvar kalınlığı
     corr_w = codes.raw.get("apartment_corridor", {}).get("min_width", 1.20)
 
     # Daire iç boyutları (dış duvarlar building_layout'ta zaten hesaplandı)
-    ax, ay = zone.x, zone.y
-    aw, ah = zone.w, zone.h
+    ax = zone.x
+    aw = zone.w
 
     # Giriş yönüne göre düzenleme
     # Koridor dairenin uzun ekseni boyunca uzanır
@@ -123,19 +175,177 @@ def layout_apartment(
     while len(right_rooms_types) > len(left_rooms_types) + 2 and right_rooms_types:
         left_rooms_types.append(right_rooms_types.pop())
 
-    # Antre alanı: giriş tarafında, koridorun başında
-    antre_h = max(1.5, min(2.5, ah * 0.12))
+    return _StripSetup(
+        left_x=left_x, left_w=left_w, corr_x=corr_x,
+        right_x=right_x, right_w=right_w,
+        left_types=left_rooms_types, right_types=right_rooms_types,
+    )
 
-    if corridor_side == "north":
-        # Giriş güneyde
-        entry_y = ay
-        rooms_start_y = ay + antre_h + iw
+
+def strip_height_problem(
+    strip_rooms: list[RoomType],
+    strip_w: float,
+    avail_h: float,
+    codes: BuildingCodes,
+) -> tuple[list[float], list[float], float]:
+    """
+    Bir şeridin yükseklik dağıtım problemi: (hedef yükseklikler,
+    PAİY minimum yükseklikleri, oda yüksekliklerinin toplamı).
+    Toplam, şerit uzunluğundan iç duvar boşlukları düşülerek bulunur.
+    """
+    iw = codes.inner_wall
+    n = len(strip_rooms)
+
+    # Her odaya alan hesapla
+    total_wall = iw * max(0, n - 1)
+    usable_h = avail_h - total_wall
+    if usable_h < 2.0:
+        usable_h = avail_h  # Çok sıkışıksa duvar payını yoksay
+
+    target_areas = []
+    for rt in strip_rooms:
+        min_a = codes.min_area(rt)
+        ratio = codes.preferred_area_ratio(rt)
+        target = max(min_a, usable_h * strip_w * ratio)
+        target_areas.append(target)
+
+    total_target = sum(target_areas)
+    if total_target <= 0:
+        total_target = 1
+    targets = [usable_h * (a / total_target) for a in target_areas]
+
+    # PAİY minimum yükseklikler (altına düşülemez)
+    min_heights = []
+    for rt in strip_rooms:
+        min_h_area = codes.min_area(rt) / strip_w if strip_w > 0 else 1.5
+        min_h_width = codes.min_width(rt) if strip_w >= codes.min_width(rt) else 1.0
+        min_heights.append(max(min_h_area, min_h_width))
+
+    return targets, min_heights, avail_h - total_wall
+
+
+def allocate_strip_heights(
+    targets: np.ndarray,
+    minimums: np.ndarray,
+    lengths: np.ndarray,
+    mask: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Şerit oda yüksekliklerini tam (kesin) olarak dağıt, tüm şeritler için tek seferde.
+
+    Her satır (şerit) için:  min Σ (h_i - t_i)²  s.t.  h_i >= m_i,  Σ h_i = L
+    Kapalı çözüm (izdüşümlü en küçük kareler): h_i = max(m_i, t_i + λ).
+    λ, kırılma noktaları b_i = m_i - t_i sıralanarak bulunur; serbest oda
+    sayısı k için λ_k = (L - Σ_sabit m - Σ_serbest t) / k ve geçerli k, λ_k'nin
+    [b_(k), b_(k+1)] aralığına düştüğü parçadır. Minimumlar sığmıyorsa
+    (Σ m > L) odalar minimumlarda bırakılır (taşma kabul).
+
+    targets, minimums: (S, n) — kısa şeritler mask=False ile doldurulur.
+    lengths: (S,)
+    """
+    t = np.atleast_2d(np.asarray(targets, dtype=float))
+    m = np.atleast_2d(np.asarray(minimums, dtype=float))
+    L = np.asarray(lengths, dtype=float).reshape(-1)
+    if mask is None:
+        mask = np.ones(t.shape, dtype=bool)
+    n_strips, n = t.shape
+    if n == 0:
+        return np.zeros((n_strips, 0))
+
+    t = np.where(mask, t, 0.0)
+    m = np.where(mask, m, 0.0)
+    breaks = np.where(mask, m - t, np.inf)
+
+    order = np.argsort(breaks, axis=1, kind="stable")
+    b_sorted = np.take_along_axis(breaks, order, axis=1)
+    t_sorted = np.take_along_axis(t, order, axis=1)
+    m_sorted = np.take_along_axis(m, order, axis=1)
+
+    k = np.arange(1, n + 1)
+    fixed_m = m.sum(axis=1, keepdims=True) - np.cumsum(m_sorted, axis=1)
+    lam = (L[:, None] - fixed_m - np.cumsum(t_sorted, axis=1)) / k
+    upper = np.concatenate([b_sorted[:, 1:], np.full((n_strips, 1), np.inf)], axis=1)
+    eps = 1e-9
+    valid = np.isfinite(b_sorted) & (lam >= b_sorted - eps) & (lam <= upper + eps)
+
+    rows = np.arange(n_strips)
+    lam_row = lam[rows, np.argmax(valid, axis=1)]
+    heights = np.maximum(m, t + lam_row[:, None])
+
+    overflow = (m.sum(axis=1) > L + 0.01) | ~valid.any(axis=1)
+    heights[overflow] = m[overflow]
+    return np.where(mask, heights, 0.0)
+
+
+def _strip_slot(
+    current_y: float,
+    room_h: float,
+    start_y: float,
+    avail_h: float,
+    going_up: bool,
+    iw: float,
+) -> tuple[float, float, float]:
+    """Şeritteki sıradaki odanın (y, yükseklik) değeri ve bir sonraki imleç."""
+    if not going_up:
+        ry = current_y
     else:
-        # Giriş kuzeyde
-        entry_y = ay + ah - antre_h
-        rooms_start_y = ay
+        ry = start_y + avail_h - (current_y - start_y) - room_h
+    next_y = current_y + room_h + iw
+
+    # Sınır koruması: oda daire bölgesini aşmasın
+    if not going_up:
+        max_y2 = start_y + avail_h
+        if ry + room_h > max_y2 + 0.01:
+            room_h = max(1.0, max_y2 - ry)
+    else:
+        if ry < start_y - 0.01:
+            excess = start_y - ry
+            ry = start_y
+            room_h = max(1.0, room_h - excess)
 
-    rooms_available_h = ah - antre_h - iw
+    return ry, room_h, next_y
+
+
+def layout_apartment(
+    zone: Rect,
+    room_types: list[RoomType],
+    building_rect: Rect,
+    corridor_side: str,
+    apartment_id: int,
+    codes: BuildingCodes,
+    variant: int = 0,
+    strip_heights: tuple[list[float], list[float]] | None = None,
+    strips: tuple[list[RoomType], list[RoomType]] | None = None,
+) -> ApartmentPlan:
+    """
+    Daire bölgesi içinde odaları yerleştir.
+
+    zone: dairenin sınır dikdörtgeni
+    corridor_side: bina koridorunun daire sınırına göre yönü ("north"/"south")
+      - "north" ise giriş kapısı dairenin güney kenarında (koridora bakan)
+      - "south" ise giriş kapısı dairenin kuzey kenarında
+    strip_heights: (sol, sağ) şerit oda yükseklikleri önceden toplu
+      hesaplandıysa (generate_apartment_variants) yeniden hesaplanmaz.
+    strips: (sol, sağ) şerit oda sıraları verilirse varyant kuralları yerine
+      bunlar kullanılır (enumerate_strip_layouts); varyant yalnızca koridor
+      konumunu belirler.
+    """
+    iw = codes.inner_wall  # iç duvar kalınlığı
+    corr_w = codes.raw.get("apartment_corridor", {}).get("min_width", 1.20)
+
+    setup = _strip_setup(zone, room_types, codes, variant)
+    left_x, left_w = setup.left_x, setup.left_w
+    right_x, right_w = setup.right_x, setup.right_w
+    corr_x = setup.corr_x
+    left_rooms_types = setup.left_types
+    right_rooms_types = setup.right_types
+    if strips is not None:
+        left_rooms_types, right_rooms_types = list(strips[0]), list(strips[1])
+
+    # Antre alanı: giriş tarafında, koridorun başında
+    entry, rooms_block = make_entry(zone, corridor_side, apartment_id, codes)
+    rooms_start_y = rooms_block.y
+    rooms_available_h = rooms_block.h
 
     # Sol şerit odaları yerleştir
     placed_rooms: list[PlacedRoom] = []
@@ -153,65 +363,24 @@ def layout_apartment(
         start_y: float,
         avail_h: float,
         going_up: bool,
+        room_heights: list[float] | None = None,
     ) -> list[PlacedRoom]:
         """Şerit içinde odaları sırala (overflow korumalı, boşluk dolduran)."""
         if not strip_rooms:
             return []
 
         results = []
-        n = len(strip_rooms)
-
-        # Her odaya alan hesapla
-        total_wall = iw * max(0, n - 1)
-        usable_h = avail_h - total_wall
-        if usable_h < 2.0:
-            usable_h = avail_h  # Çok sıkışıksa duvar payını yoksay
-
-        target_areas = []
-        for rt in strip_rooms:
-            min_a = codes.min_area(rt)
-            ratio = codes.preferred_area_ratio(rt)
-            target = max(min_a, usable_h * strip_w * ratio)
-            target_areas.append(target)
-
-        total_target = sum(target_areas)
-        if total_target <= 0:
-            total_target = 1
-
-        # PAİY minimum yükseklikler (altına düşülemez)
-        min_heights = []
-        for i, rt in enumerate(strip_rooms):
-            min_h_area = codes.min_area(rt) / strip_w if strip_w > 0 else 1.5
-            min_h_width = codes.min_width(rt) if strip_w >= codes.min_width(rt) else 1.0
-            min_heights.append(max(min_h_area, min_h_width))
-
-        total_min = sum(min_heights) + total_wall
+        total_wall = iw * max(0, len(strip_rooms) - 1)
 
-        if total_min > avail_h + 0.01:
-            # Minimumlar bile sığmıyor - yine de minimumlarda kal (taşma kabul)
-            room_heights = min_heights[:]
+        if room_heights is None:
+            targets, min_heights, length = strip_height_problem(
+                strip_rooms, strip_w, avail_h, codes,
+            )
+            room_heights = allocate_strip_heights(
+                np.array([targets]), np.array([min_heights]), np.array([length]),
+            )[0].tolist()
         else:
-            # Minimum üstü alanı orantılı dağıt
-            extra_space = avail_h - total_min
-            target_extras = []
-            for i, rt in enumerate(strip_rooms):
-                desired = usable_h * (target_areas[i] / total_target)
-                extra_for_room = max(0, desired - min_heights[i])
-                target_extras.append(extra_for_room)
-
-            total_target_extra = sum(target_extras)
-            if total_target_extra > 0:
-                extra_scale = min(1.0, extra_space / total_target_extra)
-                room_heights = [
-                    min_heights[i] + target_extras[i] * extra_scale
-                    for i in range(n)
-                ]
-            else:
-                # Tüm odalar zaten minimum boyutta, kalan alanı eşit dağıt
-                room_heights = min_heights[:]
-                if n > 0 and extra_space > 0:
-                    per_room = extra_space / n
-                    room_heights = [h + per_room for h in room_heights]
+            room_heights = list(room_heights)
 
         # Son odayı kalan alana genişlet (boşluk bırakma)
         remaining = avail_h - (sum(room_heights) + total_wall)
@@ -221,25 +390,9 @@ def layout_apartment(
         # Odaları yerleştir
         current_y = start_y
         for i, rt in enumerate(strip_rooms):
-            room_h = room_heights[i]
-
-            if not going_up:
-                ry = current_y
-                current_y += room_h + iw
-            else:
-                ry = start_y + avail_h - (current_y - start_y) - room_h
-                current_y += room_h + iw
-
-            # Sınır koruması: oda daire bölgesini aşmasın
-            if not going_up:
-                max_y2 = start_y + avail_h
-                if ry + room_h > max_y2 + 0.01:
-                    room_h = max(1.0, max_y2 - ry)
-            else:
-                if ry < start_y - 0.01:
-                    excess = start_y - ry
-                    ry = start_y
-                    room_h = max(1.0, room_h - excess)
+            ry, room_h, current_y = _strip_slot(
+                current_y, room_heights[i], start_y, avail_h, going_up, iw,
+            )
 
             # Net alan (duvar kalınlığı düşülmüş)
             net_area = max(0, (strip_w - iw) * (room_h - iw))
@@ -252,47 +405,21 @@ def layout_apartment(
                 net_area=round(net_area, 1),
             )
 
-            # Kapı: koridora açılır
-            door_side = "east" if strip_x < corr_x else "west"
-            door_y = ry + room_h / 2
-            room.doors.append(DoorPlacement(
-                wall_side=door_side,
-                position=door_y,
-                width=codes.door_width(rt),
-                swing_inside=True,
-                connects_to="koridor",
-            ))
-
-            # Pencere: dış duvara değiyorsa (dış duvar kalınlığı kadar tolerans)
-            exterior = room.rect.touches_edge(building_rect, tol=0.5)
-            if codes.needs_window(rt):
-                for side, touching in exterior.items():
-                    if touching and side != door_side:
-                        if side in ("north", "south"):
-                            pos = room.rect.cx
-                        else:
-                            pos = room.rect.cy
-                        room.windows.append(WindowPlacement(
-                            wall_side=side,
-                            position=pos,
-                            width=codes.raw.get("windows", {}).get("standard_width", 1.20),
-                            height=codes.raw.get("windows", {}).get("standard_height", 1.20),
-                        ))
-                        break
-
             results.append(room)
 
         return results
 
     going_up = (corridor_side == "north")
 
+    left_heights, right_heights = strip_heights or (None, None)
+
     left_placed = _place_strip(
         left_rooms_types, left_x, left_w,
-        rooms_start_y, rooms_available_h, going_up,
+        rooms_start_y, rooms_available_h, going_up, left_heights,
     )
     right_placed = _place_strip(
         right_rooms_types, right_x, right_w,
-        rooms_start_y, rooms_available_h, going_up,
+        rooms_start_y, rooms_available_h, going_up, right_heights,
     )
 
     placed_rooms.extend(left_placed)
@@ -306,8 +433,46 @@ def layout_apartment(
         apartment_id=apartment_id,
     )
 
-    # Antre: daire genişliğinde (strip boşluklarını kapatır)
-    # Giriş seviyesinde tüm daire genişliğini kaplar
+    # Skor hesapla
+    score = score_apartment(placed_rooms, building_rect, codes)
+
+    return ApartmentPlan(
+        rooms=placed_rooms,
+        corridor=corridor,
+        entry=entry,
+        score=score,
+    )
+
+
+def make_entry(
+    zone: Rect,
+    corridor_side: str,
+    apartment_id: int,
+    codes: BuildingCodes,
+) -> tuple[PlacedRoom, Rect]:
+    """
+    Antreyi giriş tarafına yerleştir, odalar için kalan bloğu döndür.
+
+    Antre daire genişliğinde (strip boşluklarını kapatır) ve giriş
+    seviyesinde tüm daire genişliğini kaplar.
+    """
+    iw = codes.inner_wall
+    ax, ay = zone.x, zone.y
+    aw, ah = zone.w, zone.h
+
+    antre_h = max(1.5, min(2.5, ah * 0.12))
+
+    if corridor_side == "north":
+        # Giriş güneyde
+        entry_y = ay
+        rooms_start_y = ay + antre_h + iw
+    else:
+        # Giriş kuzeyde
+        entry_y = ay + ah - antre_h
+        rooms_start_y = ay
+
+    rooms_available_h = ah - antre_h - iw
+
     entry = PlacedRoom(
         room_type=RoomType.ANTRE,
         room_id=f"antre_{apartment_id}",
@@ -326,18 +491,11 @@ def layout_apartment(
         connects_to="bina_koridoru",
     ))
 
-    # Skor hesapla
-    score = _score_apartment(placed_rooms, building_rect, codes)
-
-    return ApartmentPlan(
-        rooms=placed_rooms,
-        corridor=corridor,
-        entry=entry,
-        score=score,
-    )
+    rooms_block = Rect(x=ax, y=rooms_start_y, w=aw, h=rooms_available_h)
+    return entry, rooms_block
 
 
-def _score_apartment(
+def score_apartment(
     rooms: list[PlacedRoom],
     building_rect: Rect,
     codes: BuildingCodes,
@@ -376,6 +534,293 @@ def _score_apartment(
     return min(1.0, score)
 
 
+# evaluate_fitness'taki yönlenme ağırlığı (diğer bileşenlerin toplamı 1.0)
+ORIENTATION_WEIGHT = 0.10
+
+
+def _add_orientation(
+    variants: list[ApartmentPlan],
+    building_rect: Rect,
+    north_facing: CompassDirection,
+) -> None:
+    """
+    Varyant skorlarına yönlenme bileşenini ekle (yerinde): tüm varyantlar
+    tek orientation_scores çağrısıyla puanlanır, skor evaluate_fitness gibi
+    ağırlıklar toplamına bölünerek 0-1 aralığında kalır.
+    """
+    if not variants or not variants[0].rooms:
+        return
+    # Varyantlar aynı oda kümesini farklı sırada tutar: tipe göre hizala
+    ordered = [
+        sorted(v.rooms, key=lambda r: ROOM_TYPE_INDEX[r.room_type]) for v in variants
+    ]
+    type_idx = np.array([ROOM_TYPE_INDEX[r.room_type] for r in ordered[0]])
+    bounds = np.array([[(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms] for rooms in ordered])
+    orientation = orientation_scores(facade_contact(bounds, building_rect), type_idx, north_facing)
+    for plan, orient in zip(variants, orientation.tolist()):
+        plan.score = (plan.score + ORIENTATION_WEIGHT * orient) / (1.0 + ORIENTATION_WEIGHT)
+
+
+# ── Dal-Sınır ile Tam Şerit Araması ──────────────────────────────────────────
+
+EXHAUSTIVE_MAX_ROOMS = 8
+
+# Koridor konumu varyantları (_strip_setup: variant % 3)
+_CORRIDOR_VARIANTS = (0, 1, 2)
+
+
+def _touches_any(x: float, y: float, w: float, h: float, br: Rect, tol: float) -> bool:
+    """Rect.touches_edge(...) değerlerinden herhangi biri True mu (nesnesiz)."""
+    return (
+        abs(y - br.y) < tol or abs(y + h - br.y2) < tol
+        or abs(x - br.x) < tol or abs(x + w - br.x2) < tol
+    )
+
+
+def enumerate_strip_layouts(
+    zone: Rect,
+    room_types: list[RoomType],
+    building_rect: Rect,
+    corridor_side: str,
+    apartment_id: int,
+    codes: BuildingCodes,
+    top_k: int = 8,
+) -> list[ApartmentPlan]:
+    """
+    Şerit atamalarını ve şerit içi sıraları dal-sınır ile tam olarak tara.
+
+    score_apartment skoru odalar üzerinden toplanabilir olduğundan
+    (0.5 + dış duvar payı + min alan payı) her şeridin katkısı ayrı
+    hesaplanır. Her (koridor konumu, sol/sağ bölüşüm) için üst sınır:
+    tahsis edilen yükseklikle alanı yeten odalar + cepheye değebilecek
+    konumlardaki (_y_slots) dış duvar isteyen odalar. Bölüşümler sınıra göre sıralanır; sınır k. en iyi skorun
+    altına düştüğünde kalan bölüşümler kesilir. Şerit içi sıralar da aynı
+    şekilde önek sınırıyla budanır. Eşit skorlarda hedef alanlardan sapması
+    küçük olan önce gelir. Sonuç, skora göre kanıtlanmış en iyi top_k düzendir.
+
+    Girişten ulaşılamayacak oda (daire koridoruna ya da antreye en az
+    0.7 m kenar vermeyen, ör. taşıp antreye binen) içeren sıralar aramada
+    budanır (door_adjacency ile aynı kural). Bölgeye hiç ulaşılabilir düzen
+    sığmıyorsa arama bu kural olmadan tekrarlanır; doğrulama o odaları
+    "girişten ulaşılamıyor" olarak raporlar.
+    """
+    if not room_types:
+        return [layout_apartment(
+            zone, room_types, building_rect, corridor_side, apartment_id, codes,
+        )]
+
+    iw = codes.inner_wall
+    entry, block = make_entry(zone, corridor_side, apartment_id, codes)
+    start_y, avail_h = block.y, block.h
+    going_up = (corridor_side == "north")
+    entry_edge = entry.rect.y2 if going_up else entry.rect.y
+
+    types = list(dict.fromkeys(room_types))
+    counts = tuple(room_types.count(rt) for rt in types)
+    need_ext = sum(1 for rt in room_types if codes.needs_exterior_wall(rt))
+    need_area = sum(1 for rt in room_types if codes.min_area(rt) > 0)
+    w_ext = {rt: (0.3 / need_ext if need_ext and codes.needs_exterior_wall(rt) else 0.0)
+             for rt in types}
+    w_area = {rt: (0.2 / need_area if need_area and codes.min_area(rt) > 0 else 0.0)
+              for rt in types}
+    eps = 1e-9
+
+    min_a = {rt: codes.min_area(rt) * 0.85 for rt in types}
+
+    def _area_ok(rt: RoomType, strip_w: float, room_h: float) -> bool:
+        return round(max(0, (strip_w - iw) * (room_h - iw)), 1) >= min_a[rt]
+
+    strip_cache: dict[tuple, tuple] = {}
+
+    def _strip_problem(strip_counts: tuple[int, ...], strip_w: float) -> tuple:
+        """(tipe göre yükseklik, son oda uzatması, sapma, alan üst sınırı, taşma)"""
+        key = (strip_counts, strip_w)
+        if key in strip_cache:
+            return strip_cache[key]
+        strip_types = [rt for rt, c in zip(types, strip_counts) for _ in range(c)]
+        if not strip_types:
+            strip_cache[key] = ({}, 0.0, 0.0, 0.0, False)
+            return strip_cache[key]
+        targets, mins, length = strip_height_problem(strip_types, strip_w, avail_h, codes)
+        heights = allocate_strip_heights(
+            np.array([targets]), np.array([mins]), np.array([length]),
+        )[0]
+        h_by_type = dict(zip(strip_types, heights.tolist()))
+        total_wall = iw * (len(strip_types) - 1)
+        remaining = avail_h - (float(heights.sum()) + total_wall)
+        extend = remaining if remaining > 0.05 else 0.0
+        overflow = remaining < -0.01
+        deviation = float((((heights - np.array(targets)) * strip_w) ** 2).sum())
+        # Kırpma yalnızca yüksekliği azaltır, uzatma yalnızca son odaya eklenir
+        area_ub = sum(
+            w_area[rt] for rt in strip_types
+            if _area_ok(rt, strip_w, h_by_type[rt] + extend)
+        )
+        strip_cache[key] = (h_by_type, extend, deviation, area_ub, overflow)
+        return strip_cache[key]
+
+    ext_unit = 0.3 / need_ext if need_ext else 0.0
+
+    def _y_slots(strip_counts: tuple[int, ...], strip_x: float, strip_w: float) -> int:
+        """
+        Şeritte dış duvara değebilecek oda sayısı üst sınırı.
+
+        Yan cepheye değen şeritte tüm odalar değebilir. Aksi halde odalar
+        [start_y, start_y + avail_h] aralığında kalır; alt/üst kenara yalnızca
+        aralık ucu cepheye yakınsa en fazla birer oda değer. Yukarı dizilimde
+        alta kırpılan ya da taşan (min 1.0 m) odalar birden çok olabileceğinden
+        o uç sınırsız sayılır.
+        """
+        br = building_rect
+        n = len(room_types)
+        if abs(strip_x - br.x) < 0.1 or abs(strip_x + strip_w - br.x2) < 0.1:
+            return n
+        overflow = _strip_problem(strip_counts, strip_w)[4]
+        slots = 0
+        if start_y - br.y < 0.11:
+            slots += n if going_up else 1
+        if overflow and not going_up:
+            slots += n
+        elif br.y2 - (start_y + avail_h) < 0.11:
+            slots += 1
+        return slots
+
+    def _reachable(ry: float, room_h: float, strip_w: float) -> bool:
+        """
+        Kapısız oda dolaşım alanına açılabilir mi? Şeritler daire koridoruna
+        iç duvar aralığıyla bitişik (koridor bloğun tüm boyunca uzanır);
+        antre ise giriş ucunda tüm daire genişliğinde.
+        """
+        corr_share = min(ry + room_h, start_y + avail_h) - max(ry, start_y)
+        near_edge = ry if going_up else ry + room_h
+        return corr_share >= 0.7 or (abs(near_edge - entry_edge) < WALL_GAP and strip_w >= 0.7)
+
+    def _ext_bound(n_need: int, slots: int) -> float:
+        return ext_unit * min(n_need, max(0, slots))
+
+    def _n_need(strip_counts) -> int:
+        return sum(c for rt, c in zip(types, strip_counts) if w_ext[rt])
+
+    order_cache: dict[tuple, tuple[float, list]] = {}
+
+    def _best_orders(
+        strip_counts: tuple[int, ...], strip_x: float, strip_w: float, floor: float,
+        require_reach: bool,
+    ) -> list:
+        """
+        Şerit için katkısı floor'dan küçük olmayan en iyi top_k sıra:
+        [(katkı, tip sırası)]. Daha düşük eşikle bulunmuş sonuç yeniden kullanılır.
+        """
+        key = (strip_counts, strip_x, strip_w, require_reach)
+        cached = order_cache.get(key)
+        if cached is not None and cached[0] <= floor + eps:
+            return [item for item in cached[1] if item[0] >= floor - eps]
+        h_by_type, extend = _strip_problem(strip_counts, strip_w)[:2]
+        n = sum(strip_counts)
+        if n == 0:
+            order_cache[key] = (float("-inf"), [(0.0, ())])
+            return order_cache[key][1]
+
+        area_ub = {
+            rt: (w_area[rt] if _area_ok(rt, strip_w, h_by_type[rt] + extend) else 0.0)
+            for rt in h_by_type
+        }
+        slots = _y_slots(strip_counts, strip_x, strip_w)
+        best: list[tuple[float, tuple]] = []   # küçükten büyüğe sıralı
+        remaining = list(strip_counts)
+        seq: list[RoomType] = []
+
+        def _dfs(current_y: float, value: float, used: int) -> None:
+            if len(seq) == n:
+                best.append((value, tuple(seq)))
+                best.sort(key=lambda item: item[0])
+                if len(best) > top_k:
+                    best.pop(0)
+                return
+            bound = value + _ext_bound(_n_need(remaining), slots - used) + sum(
+                area_ub[rt] * c for rt, c in zip(types, remaining) if c
+            )
+            if bound < floor - eps or (len(best) >= top_k and bound <= best[0][0] + eps):
+                return
+            last = len(seq) == n - 1
+            for ti, rt in enumerate(types):
+                if remaining[ti] == 0:
+                    continue
+                room_h = h_by_type[rt] + (extend if last else 0.0)
+                ry, room_h, next_y = _strip_slot(
+                    current_y, room_h, start_y, avail_h, going_up, iw,
+                )
+                if require_reach and not _reachable(ry, room_h, strip_w):
+                    continue
+                gain = w_area[rt] if _area_ok(rt, strip_w, room_h) else 0.0
+                touches = _touches_any(strip_x, ry, strip_w, room_h, building_rect, 0.1)
+                if w_ext[rt] and touches:
+                    gain += w_ext[rt]
+                remaining[ti] -= 1
+                seq.append(rt)
+                _dfs(next_y, value + gain, used + touches)
+                seq.pop()
+                remaining[ti] += 1
+
+        _dfs(start_y, 0.0, 0)
+        best.reverse()
+        order_cache[key] = (floor, best)
+        return best
+
+    # Tüm (koridor konumu, bölüşüm) adaylarını üst sınırlarıyla topla
+    candidates = []
+    for variant in _CORRIDOR_VARIANTS:
+        geom = _strip_setup(zone, room_types, codes, variant)
+        for left_counts in itertools.product(*(range(c + 1) for c in counts)):
+            right_counts = tuple(c - l for c, l in zip(counts, left_counts))
+            _, _, dev_l, ub_l, _ = _strip_problem(left_counts, geom.left_w)
+            _, _, dev_r, ub_r, _ = _strip_problem(right_counts, geom.right_w)
+            ub_l += _ext_bound(
+                _n_need(left_counts), _y_slots(left_counts, geom.left_x, geom.left_w),
+            )
+            ub_r += _ext_bound(
+                _n_need(right_counts), _y_slots(right_counts, geom.right_x, geom.right_w),
+            )
+            candidates.append((0.5 + ub_l + ub_r, -(dev_l + dev_r), variant,
+                               geom, left_counts, right_counts, ub_r))
+    candidates.sort(key=lambda c: (c[0], c[1]), reverse=True)
+
+    def _search(require_reach: bool) -> list[tuple]:
+        top: list[tuple] = []   # (skor, -sapma, variant, sol sıra, sağ sıra)
+        for ub, neg_dev, variant, geom, left_counts, right_counts, ub_r in candidates:
+            if len(top) >= top_k:
+                kth = top[-1]
+                if ub < kth[0] - eps or (ub <= kth[0] + eps and neg_dev <= kth[1]):
+                    break
+            # Global k. skor şerit aramalarına eşik olarak iner
+            kth_score = top[-1][0] if len(top) >= top_k else float("-inf")
+            left_orders = _best_orders(
+                left_counts, geom.left_x, geom.left_w, kth_score - 0.5 - ub_r, require_reach,
+            )
+            if not left_orders:
+                continue
+            right_orders = _best_orders(
+                right_counts, geom.right_x, geom.right_w,
+                kth_score - 0.5 - left_orders[0][0], require_reach,
+            )
+            for lv, lseq in left_orders:
+                for rv, rseq in right_orders:
+                    top.append((0.5 + lv + rv, neg_dev, variant, lseq, rseq))
+            top.sort(key=lambda t: (round(t[0], 9), t[1]), reverse=True)
+            del top[top_k:]
+        return top
+
+    top = _search(require_reach=True) or _search(require_reach=False)
+
+    return [
+        layout_apartment(
+            zone, room_types, building_rect, corridor_side, apartment_id, codes,
+            variant=variant, strips=(list(lseq), list(rseq)),
+        )
+        for _, _, variant, lseq, rseq in top
+    ]
+
+
 def generate_apartment_variants(
     zone: Rect,
     room_types: list[RoomType],
@@ -384,15 +829,61 @@ def generate_apartment_variants(
     apartment_id: int,
     codes: BuildingCodes,
     n_variants: int = 8,
+    exhaustive: bool = True,
+    north_facing: CompassDirection | None = None,
 ) -> list[ApartmentPlan]:
-    """Birden fazla daire düzeni varyantı üret."""
+    """
+    Birden fazla daire düzeni varyantı üret.
+
+    Küçük dairelerde (≤ EXHAUSTIVE_MAX_ROOMS oda) kanıtlanmış en iyi düzenler
+    enumerate_strip_layouts ile bulunur. Büyüklerde sabit kurallı varyantlar
+    üretilir; tüm varyantların şerit yükseklikleri tek vektörel çağrıda dağıtılır.
+    north_facing verilirse skorlara yönlenme eklenir (bkz. _add_orientation)
+    ve varyantlar yeniden sıralanır; kat seçimi bu skoru kullanır.
+    """
+    if exhaustive and 0 < len(room_types) <= EXHAUSTIVE_MAX_ROOMS:
+        variants = enumerate_strip_layouts(
+            zone, room_types, building_rect, corridor_side, apartment_id, codes,
+            top_k=n_variants,
+        )
+        if north_facing is not None:
+            _add_orientation(variants, building_rect, north_facing)
+            variants.sort(key=lambda p: p.score, reverse=True)
+        return variants
+
+    _, rooms_block = make_entry(zone, corridor_side, apartment_id, codes)
+    setups = [_strip_setup(zone, room_types, codes, v) for v in range(n_variants)]
+
+    problems = []
+    for setup in setups:
+        problems.append(strip_height_problem(
+            setup.left_types, setup.left_w, rooms_block.h, codes))
+        problems.append(strip_height_problem(
+            setup.right_types, setup.right_w, rooms_block.h, codes))
+
+    width = max((len(targets) for targets, _, _ in problems), default=0)
+    targets = np.zeros((len(problems), width))
+    minimums = np.zeros((len(problems), width))
+    mask = np.zeros((len(problems), width), dtype=bool)
+    for i, (t, m, _) in enumerate(problems):
+        targets[i, :len(t)] = t
+        minimums[i, :len(m)] = m
+        mask[i, :len(t)] = True
+    lengths = np.array([length for _, _, length in problems])
+    heights = allocate_strip_heights(targets, minimums, lengths, mask)
+
     variants = []
     for v in range(n_variants):
+        left_h = heights[2 * v, mask[2 * v]].tolist()
+        right_h = heights[2 * v + 1, mask[2 * v + 1]].tolist()
         plan = layout_apartment(
             zone, room_types, building_rect,
             corridor_side, apartment_id, codes, variant=v,
+            strip_heights=(left_h, right_h),
         )
         variants.append(plan)
 
+    if north_facing is not None:
+        _add_orientation(variants, building_rect, north_facing)
     variants.sort(key=lambda p: p.score, reverse=True)
     return variants
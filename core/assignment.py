@@ -0,0 +1,88 @@
+"""
+Atama problemi (Macar algoritması).
+
+scipy.optimize.linear_sum_assignment ile aynı arayüz: n×m maliyet
+matrisinde her satırı farklı bir sütuna atayıp toplam maliyeti en küçük
+yapar. Kısa artırma yolu + potansiyeller, O(n²·m); iç döngü NumPy ile
+vektörel. Tarayıcı (stlite) paketinde scipy olmadığından ayrı tutulur.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def solve_assignment(
+    cost: np.ndarray,
+    maximize: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Dikdörtgen atama problemini çöz.
+
+    cost: (n, m) maliyet matrisi. n > m ise devrik çözülür; min(n, m)
+      çift atanır. Sonsuz maliyet yasak atama demektir; uygun tam atama
+      yoksa ValueError.
+    Dönüş: (satır indisleri, sütun indisleri) — satıra göre sıralı.
+    """
+    c = np.asarray(cost, dtype=float)
+    if c.ndim != 2:
+        raise ValueError("Maliyet matrisi iki boyutlu olmalı")
+    if maximize:
+        c = -c
+    if c.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    transposed = c.shape[0] > c.shape[1]
+    if transposed:
+        c = c.T
+    n, m = c.shape
+
+    # Yasak atamaları çok büyük ama sonlu bir maliyetle temsil et
+    finite = np.isfinite(c)
+    big = (np.abs(c[finite]).max() + 1.0) * (n + 1) if finite.any() else 1.0
+    work = np.where(finite, c, big)
+
+    u = np.zeros(n + 1)               # satır potansiyelleri
+    v = np.zeros(m + 1)               # sütun potansiyelleri (0: sanal)
+    owner = np.zeros(m + 1, dtype=np.int64)   # sütunu tutan satır (1 tabanlı)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        min_v = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used[1:]
+            cur = work[i0 - 1] - u[i0] - v[1:]
+            better = free & (cur < min_v[1:])
+            min_v[1:][better] = cur[better]
+            way[1:][better] = j0
+            cand = np.where(free, min_v[1:], np.inf)
+            j1 = int(np.argmin(cand)) + 1
+            delta = cand[j1 - 1]
+            # Potansiyel güncelle
+            used_cols = np.flatnonzero(used)
+            u[owner[used_cols]] += delta
+            v[used_cols] -= delta
+            min_v[1:][free] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        # Artırma yolunu çevir
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(owner[1:])
+    rows = owner[1:][cols] - 1
+    if not finite[rows, cols].all():
+        raise ValueError("Uygun atama yok (yasak maliyetler)")
+
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order].astype(np.int64), cols[order].astype(np.int64)
@@ -5,6 +5,7 @@ Madde referansları: 5, 23, 28, 29, 30, 31, 32, 34, 38, 39.
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Optional
@@ -32,6 +33,12 @@ class BuildingCodes:
     def raw(self) -> dict:
         return self._data
 
+    @property
+    def fingerprint(self) -> str:
+        """Yönetmelik değerlerinin özeti (önbellek anahtarları için; raw düzenlemelerini izler)."""
+        blob = json.dumps(self._data, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(blob.encode("utf-8"), digest_size=8).hexdigest()
+
     # ── A) Oda / Piyes Minimumları (Madde 29) ────────────────────────
 
     def min_area(self, room_type: RoomType) -> float:
@@ -171,6 +178,13 @@ class BuildingCodes:
             return doors[key].get("width", 0.90)
         return doors.get("standard", {}).get("width", 0.90)
 
+    def door_height(self, room_type: RoomType) -> float:
+        doors = self._data.get("doors", {})
+        key = room_type.value
+        if key in doors and isinstance(doors[key], dict):
+            return doors[key].get("height", 2.10)
+        return doors.get("standard", {}).get("height", 2.10)
+
     @property
     def building_entry_door_width(self) -> float:
         """Madde 39(1b): Bina giriş kapısı min 1.50m."""
@@ -181,6 +195,23 @@ class BuildingCodes:
         """Madde 39(1c): Daire giriş kapısı min 1.00m."""
         return self._data.get("doors", {}).get("giris", {}).get("width", 1.00)
 
+    @property
+    def window_min_area_ratio(self) -> float:
+        """Madde 39(5): Pencere alanı, oda net alanının min 1/10'u."""
+        return self._data.get("windows", {}).get("min_area_ratio", 0.10)
+
+    @property
+    def window_min_width(self) -> float:
+        return self._data.get("windows", {}).get("min_width", 0.80)
+
+    @property
+    def window_standard_width(self) -> float:
+        return self._data.get("windows", {}).get("standard_width", 1.20)
+
+    @property
+    def window_standard_height(self) -> float:
+        return self._data.get("windows", {}).get("standard_height", 1.20)
+
     # ── F) Duvar ve Kat Yükseklikleri (Madde 28) ────────────────────
 
     @property
@@ -281,6 +312,11 @@ class BuildingCodes:
             RoomType.SALON, RoomType.YATAK_ODASI, RoomType.ODA, RoomType.MUTFAK,
         )
 
+    @property
+    def max_escape_distance(self) -> float:
+        """Yangın Yönetmeliği: daire giriş kapısından merdivene kaçış mesafesi (~30m)."""
+        return self._data.get("fire_safety", {}).get("max_escape_distance", 30.0)
+
     @property
     def requires_separate_stairs_mixed_use(self) -> bool:
         """Madde 31(5): Karma kullanımda ayrı merdiven evi zorunlu."""
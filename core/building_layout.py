@@ -15,15 +15,29 @@ Yerleşim stratejisi (çift yüklü koridor):
   +-----+----+---------+---------+---------+
 
   Merdiven ve asansör tüm kat yüksekliğini kaplar (şaft/kuyu).
+
+Daire genişlikleri her koridor kenarında 1-B DP ile seçilir
+(partition_zone_widths): hedef alanlara yakınlık, min genişlik, kolon aksı.
+
+Yukarıdaki uç çekirdek düzeni, LAYOUT_STRATEGIES kayıt defterindeki
+tipolojilerden biridir (end_core, central_core, point_block,
+single_loaded); evaluate_layout_strategies hepsini paralel üretip daire
+yerleşiminden önce net/brüt verimliliğe göre sıralar.
 """
 
 from __future__ import annotations
 
+import itertools
 import math
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
 
 from .models import Rect, RoomType, PlacedRoom, FloorPlan, BuildingInput
 from .building_codes import BuildingCodes
+from .core_placer import place_core
 
 
 @dataclass
@@ -37,32 +51,140 @@ class BuildingZones:
     apartment_zones: list[Rect]        # Her dairenin sınır dikdörtgeni
     apartment_corridor_sides: list[str]  # Her daire koridorun hangi tarafında
     warnings: list[str]                # PAİY uyarıları
+    # En iyi N bölümleme (ilki apartment_zones), aşağı akış araması için
+    zone_alternatives: list[list[Rect]] = field(default_factory=list)
+    strategy: str = "end_core"         # LAYOUT_STRATEGIES anahtarı
+    extra_corridor_rects: list[Rect] = field(default_factory=list)  # Çekirdeğin öbür yanı
 
 
-def compute_building_layout(
-    building: BuildingInput,
-    codes: BuildingCodes,
-) -> BuildingZones:
-    """
-    Bina katı düzenini hesapla.
-    Dış duvar kalınlığı dahil - kullanıcının girdiği boyutlar dış ölçüdür.
-    Merdiven ve asansör şaftı/kuyusu binanın tam iç yüksekliğini kaplar.
-    PAİY uyumluluk kontrolü yapar ve uyarıları döndürür.
-    """
-    ow = codes.outer_wall
-    W = building.width
-    H = building.height
-    warnings: list[str] = []
+@dataclass
+class ZonePartition:
+    """Bir koridor kenarının daire bölgelerine bölünmesi."""
+    cuts: list[float]      # Bölge sınırlarının x koordinatları (başlangıç ve bitiş dahil)
+    cost: float            # Hedef genişliklerden göreli kare sapma toplamı
 
-    building_rect = Rect(x=0, y=0, w=W, h=H)
+    @property
+    def widths(self) -> list[float]:
+        return [b - a for a, b in zip(self.cuts, self.cuts[1:])]
 
-    # İç alan (dış duvarlar çıkarılmış)
-    inner_x = ow
-    inner_y = ow
-    inner_w = W - 2 * ow
-    inner_h = H - 2 * ow
 
-    # ── PAİY uyumluluk kontrolleri ────────────────────────────────────
+# ── Daire Bölgesi Genişlikleri ────────────────────────────────────────────────
+
+def min_zone_width(room_types: list[RoomType], codes: BuildingCodes) -> float:
+    """
+    Koridor-şerit yerleşimi için daire bölgesinin en küçük genişliği:
+    iki şeridin en geniş iki odası + daire koridoru + iki iç duvar.
+    """
+    widths = sorted((codes.min_width(rt) for rt in room_types), reverse=True)
+    widths += [0.0, 0.0]
+    corr_w = codes.apartment_corridor_width
+    return widths[0] + widths[1] + corr_w + 2 * codes.inner_wall
+
+
+def partition_zone_widths(
+    start: float,
+    end: float,
+    targets: list[float],
+    min_widths: list[float],
+    step: float = 0.05,
+    column_grid: float | None = None,
+    top_n: int = 1,
+) -> list[ZonePartition]:
+    """
+    [start, end] aralığını sırayla len(targets) bölgeye böl (1-B DP).
+
+    Amaç: Σ ((w_i - t_i) / t_i)² en küçük, w_i >= min_widths[i].
+    Kesim adayları step aralıklı ızgara + hedef genişliklerin kümülatif
+    konumlarıdır (eşit hedeflerde sonuç eski eşit bölmeyle aynı kalır).
+    column_grid verilirse kesimler yalnızca aks çizgilerine (x = k·grid)
+    düşer. Her kesim konumunda en iyi top_n kısmi çözüm tutulur (k-en-iyi
+    DP); artan maliyetle en fazla top_n bölümleme döner. Uygun bölümleme
+    yoksa boş liste döner.
+    """
+    n = len(targets)
+    if n == 0:
+        return []
+    if n == 1:
+        width = end - start
+        if width < min_widths[0] - 1e-9:
+            return []
+        return [ZonePartition([start, end], ((width - targets[0]) / targets[0]) ** 2)]
+
+    # Aday kesim konumları
+    if column_grid:
+        first = math.ceil((start + 1e-9) / column_grid)
+        last = math.floor((end - 1e-9) / column_grid)
+        inner = np.arange(first, last + 1) * column_grid
+    else:
+        grid = start + np.arange(1, int((end - start) / step) + 1) * step
+        cumulative = start + np.cumsum(targets)[:-1]
+        inner = np.concatenate([grid, cumulative])
+    inner = inner[(inner > start + 1e-9) & (inner < end - 1e-9)]
+    pos = np.unique(np.round(np.concatenate([[start], inner, [end]]), 6))
+    P = len(pos)
+    k = max(1, top_n)
+
+    # cost[i][j, r]: ilk i+1 bölge, son kesim pos[j]'de, r. en iyi
+    inf = np.inf
+    cost = np.full((P, k), inf)
+    back: list[np.ndarray] = []
+    widths0 = pos - start
+    ok0 = widths0 >= min_widths[0] - 1e-9
+    cost[ok0, 0] = ((widths0[ok0] - targets[0]) / targets[0]) ** 2
+    cost[0, :] = inf
+
+    for i in range(1, n):
+        t, m = targets[i], min_widths[i]
+        new_cost = np.full((P, k), inf)
+        new_back = np.full((P, k, 2), -1, dtype=np.int64)
+        # Son bölge yalnızca bitişte kapanabilir; diğer aşamalar tüm konumlar için vektörel.
+        # Yalnızca ulaşılabilir önceki kesimler (sonlu maliyet) aday olur.
+        js = np.array([P - 1]) if i == n - 1 else np.arange(1, P)
+        prev = np.flatnonzero(np.isfinite(cost[:, 0]))
+        w = pos[js][None, :] - pos[prev][:, None]           # (önceki kesim, kesim)
+        valid = (w >= m - 1e-9) & (w > 1e-9)
+        step_cost = np.where(valid, ((w - t) / t) ** 2, inf)
+        cand = (cost[prev, :, None] + step_cost[:, None, :]).reshape(len(prev) * k, len(js))
+        take = min(k, cand.shape[0])
+        if take == 0:
+            back.append(new_back)
+            cost = new_cost
+            continue
+        if take == 1:
+            idx = np.argmin(cand, axis=0)[None, :]
+        else:
+            idx = np.argpartition(cand, take - 1, axis=0)[:take]
+            order = np.argsort(np.take_along_axis(cand, idx, axis=0), axis=0, kind="stable")
+            idx = np.take_along_axis(idx, order, axis=0)
+        new_cost[js, :take] = np.take_along_axis(cand, idx, axis=0).T
+        new_back[js, :take, 0] = prev[idx // k].T
+        new_back[js, :take, 1] = (idx % k).T
+        back.append(new_back)
+        cost = new_cost
+
+    partitions: list[ZonePartition] = []
+    for r in range(k):
+        total = cost[P - 1, r]
+        if not np.isfinite(total):
+            break
+        cuts = [P - 1]
+        j, rank = P - 1, r
+        for i in range(n - 1, 0, -1):
+            j, rank = back[i - 1][j, rank]
+            cuts.append(int(j))
+        cuts.append(0)
+        partitions.append(ZonePartition(
+            cuts=[float(pos[c]) for c in reversed(cuts)],
+            cost=float(total),
+        ))
+    return partitions
+
+
+# ── PAİY Kontrolleri ve Çekirdek ──────────────────────────────────────────────
+
+def _code_warnings(building: BuildingInput, codes: BuildingCodes) -> tuple[list[str], bool]:
+    """Asansör kuralları (Madde 34) uyarıları ve çift asansör gereği."""
+    warnings: list[str] = []
 
     n_floors = building.num_floors
     total_apartments = building.apartments_per_floor * n_floors
@@ -102,46 +224,207 @@ def compute_building_layout(
             f"(min 1.20×2.10m, 2.52m²) zorunludur."
         )
 
-    # ── Çekirdek: Merdiven şaftı + Asansör kuyusu(ları) ──────────────
+    return warnings, needs_dual
+
 
+def _core_column(
+    x: float,
+    inner_y: float,
+    inner_h: float,
+    building: BuildingInput,
+    codes: BuildingCodes,
+    needs_dual: bool,
+) -> tuple[Rect, Rect | None, Rect | None, float]:
+    """
+    x'ten başlayan tam yükseklik çekirdek: merdiven şaftı + asansör
+    kuyusu(ları). (merdiven, asansör, asansör 2, toplam genişlik) döner.
+    """
     stairs_w = codes.stairs_width
     elev_w = codes.elevator_width
 
-    # Merdiven şaftı: sol tarafta, TAM İÇ YÜKSEKLİK
-    stairs_rect = Rect(
-        x=inner_x,
-        y=inner_y,
-        w=stairs_w,
-        h=inner_h,
-    )
-
-    # Asansör kuyusu(ları)
+    stairs_rect = Rect(x=x, y=inner_y, w=stairs_w, h=inner_h)
     elevator_rect = None
     elevator_rect_2 = None
     core_total_w = stairs_w
 
     if building.has_elevator:
-        elevator_rect = Rect(
-            x=inner_x + stairs_w,
-            y=inner_y,
-            w=elev_w,
-            h=inner_h,
-        )
+        elevator_rect = Rect(x=x + stairs_w, y=inner_y, w=elev_w, h=inner_h)
         core_total_w = stairs_w + elev_w
 
         # Çift asansör: ikinci kuyuyu birincinin yanına koy
         if needs_dual:
-            elevator_rect_2 = Rect(
-                x=inner_x + stairs_w + elev_w,
-                y=inner_y,
-                w=elev_w,
-                h=inner_h,
-            )
+            elevator_rect_2 = Rect(x=x + stairs_w + elev_w, y=inner_y, w=elev_w, h=inner_h)
             core_total_w = stairs_w + 2 * elev_w
 
-    # ── Bina koridoru ─────────────────────────────────────────────────
-    corridor_min_w = codes.building_corridor_width
+    return stairs_rect, elevator_rect, elevator_rect_2, core_total_w
+
+
+@dataclass
+class _Band:
+    """Koridor boyunca daire bölgelerinin dizildiği bir şerit parçası."""
+    x0: float
+    x1: float
+    y: float
+    h: float
+    side: str      # "north" (koridorun üstü) / "south" (altı)
+    count: int
+
+
+def _partition_failure(band: _Band, min_widths: list[float], column_grid: float | None) -> str:
+    """partition_zone_widths'in boş dönme nedeni (uyarı metni için)."""
+    length = band.x1 - band.x0
+    if sum(min_widths) > length + 1e-9:
+        return f"min bölge genişliklerini ({sum(min_widths):.2f}m) karşılamıyor"
+    if column_grid:
+        first = math.ceil((band.x0 + 1e-9) / column_grid)
+        last = math.floor((band.x1 - 1e-9) / column_grid)
+        lines = max(0, last - first + 1)
+        if lines < band.count - 1:
+            return (
+                f"içinde {lines} aks çizgisi var ({column_grid:.2f}m aks), "
+                f"{band.count - 1} kesim gerekli"
+            )
+        return f"üzerindeki aks çizgileri ({column_grid:.2f}m aks) min bölge genişliklerine uyan kesim vermiyor"
+    return "min bölge genişliklerini karşılamıyor"
+
+
+def _zones_from_bands(
+    bands: list[_Band],
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+    top_n: int,
+    warnings: list[str],
+) -> tuple[list[list[Rect]], list[str]]:
+    """
+    Her şeridi partition_zone_widths ile böl; şeritler bağımsız olduğundan
+    toplam maliyete göre en iyi top_n birleşimi döndür.
+    Daire sırası şerit sırasıdır (unit_room_types da bu sırayla verilir).
+    """
+    n_apts = sum(b.count for b in bands)
+    if unit_room_types is not None:
+        weights = [max(sum(codes.min_area(rt) for rt in rts), 1e-6) for rts in unit_room_types]
+        min_ws = [min_zone_width(rts, codes) for rts in unit_room_types]
+    else:
+        weights = [1.0] * n_apts
+        min_ws = [0.0] * n_apts
+
+    band_options: list[list[ZonePartition]] = []
+    lo = 0
+    for band in bands:
+        hi = lo + band.count
+        if band.count == 0:
+            band_options.append([ZonePartition([band.x0, band.x1], 0.0)])
+            continue
+        length = band.x1 - band.x0
+        band_w = sum(weights[lo:hi])
+        targets = [length * w / band_w for w in weights[lo:hi]]
+        options = partition_zone_widths(
+            band.x0, band.x1, targets, min_ws[lo:hi],
+            column_grid=building.column_grid, top_n=top_n,
+        )
+        if not options:
+            reason = _partition_failure(band, min_ws[lo:hi], building.column_grid)
+            warnings.append(f"⚠️ {band.count} daire için koridor boyu ({length:.2f}m) {reason}; eşit bölündü.")
+            even = length / band.count
+            options = [ZonePartition(
+                [band.x0 + i * even for i in range(band.count)] + [band.x1],
+                float("inf"),
+            )]
+        band_options.append(options)
+        lo = hi
+
+    # Şeritlerin bölümlemeleri bağımsız; toplam maliyete göre en iyi N birleşim
+    combos = sorted(
+        (
+            (sum(band_options[b][i].cost for b, i in enumerate(choice)), choice)
+            for choice in itertools.product(*(range(len(o)) for o in band_options))
+        ),
+        key=lambda c: c[0],
+    )[:max(1, top_n)]
+
+    alternatives = []
+    for _, choice in combos:
+        zones: list[Rect] = []
+        for band, options, i in zip(bands, band_options, choice):
+            if band.count == 0:
+                continue
+            cuts = options[i].cuts
+            zones.extend(
+                Rect(x=a, y=band.y, w=b - a, h=band.h) for a, b in zip(cuts, cuts[1:])
+            )
+        alternatives.append(zones)
+    sides = [band.side for band in bands for _ in range(band.count)]
+    return alternatives, sides
+
+
+# ── Yerleşim Stratejileri (Tipolojiler) ───────────────────────────────────────
+
+LayoutStrategy = Callable[
+    [BuildingInput, BuildingCodes, "list[list[RoomType]] | None", int],
+    BuildingZones,
+]
+
+LAYOUT_STRATEGIES: dict[str, LayoutStrategy] = {}
+
+
+def register_layout_strategy(name: str) -> Callable[[LayoutStrategy], LayoutStrategy]:
+    """Bina düzeni stratejisini (tipoloji) isimle kaydet."""
+    def _register(fn: LayoutStrategy) -> LayoutStrategy:
+        LAYOUT_STRATEGIES[name] = fn
+        return fn
+    return _register
+
+
+def compute_building_layout(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None = None,
+    top_n: int = 1,
+    strategy: str = "end_core",
+) -> BuildingZones:
+    """
+    Bina katı düzenini hesapla.
+    Dış duvar kalınlığı dahil - kullanıcının girdiği boyutlar dış ölçüdür.
+    PAİY uyumluluk kontrolü yapar ve uyarıları döndürür.
+
+    unit_room_types: daire bölgesi sırasıyla (önce üst sıra, sonra alt)
+      her dairenin oda listesi. Verilirse bölge genişlikleri odaların min
+      alanlarıyla orantılı hedeflenir ve min_zone_width altına düşmez.
+    top_n: zone_alternatives'te döndürülecek bölümleme sayısı.
+    strategy: LAYOUT_STRATEGIES içindeki tipoloji adı.
+    """
+    if strategy not in LAYOUT_STRATEGIES:
+        raise ValueError(
+            f"Bilinmeyen yerleşim stratejisi: {strategy} "
+            f"(seçenekler: {', '.join(LAYOUT_STRATEGIES)})"
+        )
+    return LAYOUT_STRATEGIES[strategy](building, codes, unit_room_types, top_n)
+
 
+@register_layout_strategy("end_core")
+def _end_core_layout(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+    top_n: int,
+) -> BuildingZones:
+    """
+    Uç çekirdek + çift yüklü koridor (modül başındaki şema).
+    Merdiven ve asansör şaftı/kuyusu binanın tam iç yüksekliğini kaplar.
+    """
+    ow = codes.outer_wall
+    W, H = building.width, building.height
+    building_rect = Rect(x=0, y=0, w=W, h=H)
+    inner_x, inner_y = ow, ow
+    inner_w, inner_h = W - 2 * ow, H - 2 * ow
+
+    warnings, needs_dual = _code_warnings(building, codes)
+    stairs_rect, elevator_rect, elevator_rect_2, core_total_w = _core_column(
+        inner_x, inner_y, inner_h, building, codes, needs_dual,
+    )
+
+    corridor_min_w = codes.building_corridor_width
     corridor_rect = Rect(
         x=inner_x + core_total_w,
         y=inner_y + (inner_h - corridor_min_w) / 2,
@@ -149,43 +432,211 @@ def compute_building_layout(
         h=corridor_min_w,
     )
 
-    # ── Daire bölgeleri ───────────────────────────────────────────────
     n_apts = building.apartments_per_floor
+    n_upper = math.ceil(n_apts / 2)
+    bands = [
+        _Band(corridor_rect.x, corridor_rect.x2, corridor_rect.y2,
+              inner_y + inner_h - corridor_rect.y2, "north", n_upper),
+        _Band(corridor_rect.x, corridor_rect.x2, inner_y,
+              corridor_rect.y - inner_y, "south", n_apts - n_upper),
+    ]
+    alternatives, sides = _zones_from_bands(
+        bands, building, codes, unit_room_types, top_n, warnings,
+    )
+
+    return BuildingZones(
+        building_rect=building_rect,
+        stairs_rect=stairs_rect,
+        elevator_rect=elevator_rect,
+        elevator_rect_2=elevator_rect_2,
+        corridor_rect=corridor_rect,
+        apartment_zones=alternatives[0],
+        apartment_corridor_sides=sides,
+        warnings=warnings,
+        zone_alternatives=alternatives,
+        strategy="end_core",
+    )
+
+
+def _wing_counts(n: int, left_len: float, right_len: float) -> tuple[int, int]:
+    """n daireyi iki kanada uzunlukla orantılı böl."""
+    left = round(n * left_len / max(left_len + right_len, 1e-9))
+    if n >= 2:
+        left = min(max(left, 1), n - 1)
+    return left, n - left
+
+
+@register_layout_strategy("central_core")
+def _central_core_layout(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+    top_n: int,
+) -> BuildingZones:
+    """
+    Orta çekirdek: tam yükseklik çekirdek binanın ortasında, iki kanatta
+    çift yüklü koridor. Uzun binalarda kaçış mesafesini kısaltır.
+    """
+    ow = codes.outer_wall
+    W, H = building.width, building.height
+    building_rect = Rect(x=0, y=0, w=W, h=H)
+    inner_x, inner_y = ow, ow
+    inner_w, inner_h = W - 2 * ow, H - 2 * ow
+
+    warnings, needs_dual = _code_warnings(building, codes)
+    _, _, _, core_w = _core_column(0.0, inner_y, inner_h, building, codes, needs_dual)
+    core_x = inner_x + (inner_w - core_w) / 2
+    stairs_rect, elevator_rect, elevator_rect_2, _ = _core_column(
+        core_x, inner_y, inner_h, building, codes, needs_dual,
+    )
+
+    corridor_min_w = codes.building_corridor_width
+    corr_y = inner_y + (inner_h - corridor_min_w) / 2
+    left_corr = Rect(x=inner_x, y=corr_y, w=core_x - inner_x, h=corridor_min_w)
+    right_corr = Rect(
+        x=core_x + core_w, y=corr_y, w=inner_x + inner_w - core_x - core_w, h=corridor_min_w,
+    )
+
+    n_apts = building.apartments_per_floor
+    n_upper = math.ceil(n_apts / 2)
+    up_l, up_r = _wing_counts(n_upper, left_corr.w, right_corr.w)
+    lo_l, lo_r = _wing_counts(n_apts - n_upper, left_corr.w, right_corr.w)
+    upper_y, upper_h = corr_y + corridor_min_w, inner_y + inner_h - corr_y - corridor_min_w
+    lower_y, lower_h = inner_y, corr_y - inner_y
+    bands = [
+        _Band(left_corr.x, left_corr.x2, upper_y, upper_h, "north", up_l),
+        _Band(right_corr.x, right_corr.x2, upper_y, upper_h, "north", up_r),
+        _Band(left_corr.x, left_corr.x2, lower_y, lower_h, "south", lo_l),
+        _Band(right_corr.x, right_corr.x2, lower_y, lower_h, "south", lo_r),
+    ]
+    alternatives, sides = _zones_from_bands(
+        bands, building, codes, unit_room_types, top_n, warnings,
+    )
+
+    return BuildingZones(
+        building_rect=building_rect,
+        stairs_rect=stairs_rect,
+        elevator_rect=elevator_rect,
+        elevator_rect_2=elevator_rect_2,
+        corridor_rect=right_corr,
+        apartment_zones=alternatives[0],
+        apartment_corridor_sides=sides,
+        warnings=warnings,
+        zone_alternatives=alternatives,
+        strategy="central_core",
+        extra_corridor_rects=[left_corr],
+    )
+
+
+@register_layout_strategy("point_block")
+def _point_block_layout(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+    top_n: int,
+) -> BuildingZones:
+    """
+    Noktasal blok: kompakt çekirdek (place_core) bina merkezinde, en fazla
+    dört daire çekirdeğin dört çeyreğinde. Koridor, çekirdeğin iki yanından
+    dış duvara kadar uzanan enine koridordur (iki parça); her çeyrekteki
+    daire kendi parçasına cephe verir. Çekirdek sütununun çekirdek
+    üstü/altı hiçbir bölgeye atanmaz (şaft/boşluk).
+
+    4'ten fazla daire bu tipolojiye sığmaz: ValueError yükseltilir, böylece
+    evaluate_layout_strategies tipolojiyi sıralamadan çıkarır.
+    """
+    ow = codes.outer_wall
+    W, H = building.width, building.height
+    building_rect = Rect(x=0, y=0, w=W, h=H)
+    inner = Rect(x=ow, y=ow, w=W - 2 * ow, h=H - 2 * ow)
+
+    warnings, needs_dual = _code_warnings(building, codes)
+    core = place_core(inner, codes, has_elevator=building.has_elevator, position="center")
+    stairs_rect = core.stairs_rect
+    elevator_rect = core.elevator_rect
+    elevator_rect_2 = None
+    core_x = stairs_rect.x
+    core_x2 = elevator_rect.x2 if elevator_rect else stairs_rect.x2
+    if building.has_elevator and needs_dual:
+        elevator_rect_2 = Rect(
+            x=core_x2 + codes.inner_wall, y=elevator_rect.y, w=elevator_rect.w, h=elevator_rect.h,
+        )
+        core_x2 = elevator_rect_2.x2
+
+    n_apts = building.apartments_per_floor
+    if n_apts > 4:
+        raise ValueError(f"Noktasal blok en fazla 4 daire alır ({n_apts} istendi)")
+
+    corridor_min_w = codes.building_corridor_width
+    corr_y = inner.cy - corridor_min_w / 2
+    left_corr = Rect(x=inner.x, y=corr_y, w=core_x - inner.x, h=corridor_min_w)
+    right_corr = Rect(x=core_x2, y=corr_y, w=inner.x2 - core_x2, h=corridor_min_w)
 
     n_upper = math.ceil(n_apts / 2)
     n_lower = n_apts - n_upper
+    up_l, up_r = _wing_counts(n_upper, left_corr.w, right_corr.w)
+    lo_l, lo_r = _wing_counts(n_lower, left_corr.w, right_corr.w)
+    upper_y, upper_h = corr_y + corridor_min_w, inner.y2 - corr_y - corridor_min_w
+    lower_y, lower_h = inner.y, corr_y - inner.y
+    bands = [
+        _Band(left_corr.x, left_corr.x2, upper_y, upper_h, "north", up_l),
+        _Band(right_corr.x, right_corr.x2, upper_y, upper_h, "north", up_r),
+        _Band(left_corr.x, left_corr.x2, lower_y, lower_h, "south", lo_l),
+        _Band(right_corr.x, right_corr.x2, lower_y, lower_h, "south", lo_r),
+    ]
+    alternatives, sides = _zones_from_bands(
+        bands, building, codes, unit_room_types, top_n, warnings,
+    )
 
-    upper_y = corridor_rect.y2
-    upper_h = inner_y + inner_h - upper_y
+    return BuildingZones(
+        building_rect=building_rect,
+        stairs_rect=stairs_rect,
+        elevator_rect=elevator_rect,
+        elevator_rect_2=elevator_rect_2,
+        corridor_rect=right_corr,
+        apartment_zones=alternatives[0],
+        apartment_corridor_sides=sides,
+        warnings=warnings,
+        zone_alternatives=alternatives,
+        strategy="point_block",
+        extra_corridor_rects=[left_corr],
+    )
 
-    lower_y = inner_y
-    lower_h = corridor_rect.y - inner_y
 
-    available_w = corridor_rect.w
-    apt_zones: list[Rect] = []
-    apt_sides: list[str] = []
+@register_layout_strategy("single_loaded")
+def _single_loaded_layout(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+    top_n: int,
+) -> BuildingZones:
+    """
+    Tek yüklü koridor: uç çekirdek, koridor güney cephesi boyunca, tüm
+    daireler kuzeyde tam derinlikte. Dar binalarda çift yüklü düzenin
+    sığ dairelerinden kaçınır.
+    """
+    ow = codes.outer_wall
+    W, H = building.width, building.height
+    building_rect = Rect(x=0, y=0, w=W, h=H)
+    inner_x, inner_y = ow, ow
+    inner_w, inner_h = W - 2 * ow, H - 2 * ow
 
-    if n_upper > 0:
-        apt_w = available_w / n_upper
-        for i in range(n_upper):
-            apt_zones.append(Rect(
-                x=corridor_rect.x + i * apt_w,
-                y=upper_y,
-                w=apt_w,
-                h=upper_h,
-            ))
-            apt_sides.append("north")
-
-    if n_lower > 0:
-        apt_w = available_w / n_lower
-        for i in range(n_lower):
-            apt_zones.append(Rect(
-                x=corridor_rect.x + i * apt_w,
-                y=lower_y,
-                w=apt_w,
-                h=lower_h,
-            ))
-            apt_sides.append("south")
+    warnings, needs_dual = _code_warnings(building, codes)
+    stairs_rect, elevator_rect, elevator_rect_2, core_total_w = _core_column(
+        inner_x, inner_y, inner_h, building, codes, needs_dual,
+    )
+
+    corridor_min_w = codes.building_corridor_width
+    corridor_rect = Rect(
+        x=inner_x + core_total_w, y=inner_y, w=inner_w - core_total_w, h=corridor_min_w,
+    )
+    bands = [_Band(
+        corridor_rect.x, corridor_rect.x2, corridor_rect.y2,
+        inner_y + inner_h - corridor_rect.y2, "north", building.apartments_per_floor,
+    )]
+    alternatives, sides = _zones_from_bands(
+        bands, building, codes, unit_room_types, top_n, warnings,
+    )
 
     return BuildingZones(
         building_rect=building_rect,
@@ -193,7 +644,94 @@ def compute_building_layout(
         elevator_rect=elevator_rect,
         elevator_rect_2=elevator_rect_2,
         corridor_rect=corridor_rect,
-        apartment_zones=apt_zones,
-        apartment_corridor_sides=apt_sides,
+        apartment_zones=alternatives[0],
+        apartment_corridor_sides=sides,
         warnings=warnings,
+        zone_alternatives=alternatives,
+        strategy="single_loaded",
     )
+
+
+# ── Strateji Değerlendirme ────────────────────────────────────────────────────
+
+def min_zone_depth(room_types: list[RoomType], codes: BuildingCodes) -> float:
+    """Daire bölgesinin en küçük derinliği: antre + iç duvar + en geniş oda."""
+    widest = max((codes.min_width(rt) for rt in room_types), default=0.0)
+    return 1.5 + codes.inner_wall + widest
+
+
+@dataclass
+class StrategyResult:
+    """Bir tipolojinin daire yerleşiminden önceki değerlendirmesi."""
+    name: str
+    zones: BuildingZones | None
+    net_to_gross: float          # Daire bölgeleri alanı / brüt kat alanı
+    feasible: bool
+    reasons: list[str] = field(default_factory=list)
+    # En uzak daire bölgesi merkezinden merdivene Manhattan uzaklığı (m)
+    stair_distance: float = 0.0
+
+
+def _evaluate_strategy(
+    name: str,
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None,
+) -> StrategyResult:
+    try:
+        zones = compute_building_layout(building, codes, unit_room_types, strategy=name)
+    except (ValueError, ZeroDivisionError) as exc:
+        return StrategyResult(name, None, 0.0, False, [str(exc)])
+
+    reasons: list[str] = []
+    n_apts = building.apartments_per_floor
+    if len(zones.apartment_zones) < n_apts:
+        reasons.append(f"{n_apts} dairenin yalnızca {len(zones.apartment_zones)} tanesi yerleşti")
+    types = unit_room_types or [[]] * len(zones.apartment_zones)
+    for i, (zone, rts) in enumerate(zip(zones.apartment_zones, types)):
+        if zone.w < min_zone_width(rts, codes) - 1e-6:
+            reasons.append(f"Daire {i + 1}: genişlik {zone.w:.2f}m < {min_zone_width(rts, codes):.2f}m")
+        if zone.h < min_zone_depth(rts, codes) - 1e-6:
+            reasons.append(f"Daire {i + 1}: derinlik {zone.h:.2f}m < {min_zone_depth(rts, codes):.2f}m")
+
+    gross = zones.building_rect.area
+    net = sum(z.area for z in zones.apartment_zones)
+    stairs = zones.stairs_rect
+    stair_distance = max(
+        (abs(z.cx - stairs.cx) + abs(z.cy - stairs.cy) for z in zones.apartment_zones),
+        default=0.0,
+    )
+    return StrategyResult(
+        name, zones, net / gross if gross > 0 else 0.0, not reasons, reasons, stair_distance,
+    )
+
+
+def evaluate_layout_strategies(
+    building: BuildingInput,
+    codes: BuildingCodes,
+    unit_room_types: list[list[RoomType]] | None = None,
+    strategies: list[str] | None = None,
+    workers: int = 4,
+) -> list[StrategyResult]:
+    """
+    Kayıtlı tipolojileri paralel üret ve daire yerleşiminden önce
+    net/brüt verimliliğe göre sırala (uygun olanlar önce). Net/brüt
+    (0.1% hassasiyetle) eşitse en uzak dairesi merdivene yakın olan önce
+    gelir; kaçış mesafesi kısalır.
+    Uygun olmayan tipolojiler aşağı akış aramasına hiç girmez; bu binaya
+    hiç uygulanamayan (ValueError yükselten, ör. 4'ten fazla daireli
+    noktasal blok) tipolojiler, en az biri üretilebildiği sürece listeden
+    çıkarılır.
+    """
+    names = strategies or list(LAYOUT_STRATEGIES)
+    if workers > 1 and len(names) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda n: _evaluate_strategy(n, building, codes, unit_room_types), names,
+            ))
+    else:
+        results = [_evaluate_strategy(n, building, codes, unit_room_types) for n in names]
+    if any(r.zones is not None for r in results):
+        results = [r for r in results if r.zones is not None]
+    results.sort(key=lambda r: (not r.feasible, -round(r.net_to_gross, 3), r.stair_distance))
+    return results
@@ -53,6 +53,7 @@ def place_core(
       - "center_right": sağ ortada
       - "top_center": üst ortada
       - "bottom_center": alt ortada
+      - "center": tam ortada (noktasal blok)
     
     Merdiven + asansör yan yana yerleştirilir.
     Kalan alan: çekirdeğin solunda ve sağında (veya üstünde/altında) iki bölge.
@@ -93,6 +94,9 @@ def place_core(
     elif position == "bottom_center":
         core_x = inner_rect.cx - core_w / 2
         core_y = inner_rect.y
+    elif position == "center":
+        core_x = inner_rect.cx - core_w / 2
+        core_y = inner_rect.cy - core_l / 2
     else:
         core_x = inner_rect.x
         core_y = inner_rect.cy - core_l / 2
@@ -171,4 +175,4 @@ def _compute_remaining_area(
 
 
 # Çekirdek pozisyon seçenekleri (GA için)
-CORE_POSITIONS = ["center_left", "center_right", "top_center", "bottom_center"]
+CORE_POSITIONS = ["center_left", "center_right", "top_center", "bottom_center", "center"]
@@ -2,10 +2,18 @@
 Adım 7: Koridor üretimi ve oda erişim bağlantıları.
 MVP'de basit yaklaşım: koridor odası zaten slicing tree'de var,
 ek olarak erişilebilirlik kontrolü yapar.
+
+Gerçek erişilebilirlik: kapı grafiği (kapılar + açık dolaşım geçişleri)
+üzerinde union-find ile bileşenler ve antre / bina koridorundan BFS ile
+oda başına adım (hop) mesafeleri.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import numpy as np
+
 from .models import Rect, RoomType, PlacedRoom
 from .building_codes import BuildingCodes
 
@@ -71,10 +79,193 @@ def compute_corridor_quality(rooms: list[PlacedRoom]) -> float:
     corridor_rooms = [r for r in rooms if r.room_type in (RoomType.KORIDOR_DAIRE, RoomType.KORIDOR_BINA)]
     ratio_score = 1.0
     for cr in corridor_rooms:
-        aspect = cr.rect.max_dim / cr.rect.min_dim if cr.rect.min_dim > 0 else 999
+        aspect = max(cr.rect.w, cr.rect.h) / cr.rect.min_dim if cr.rect.min_dim > 0 else 999
         if aspect > 6:
             ratio_score *= 0.7  # Çok uzun ve dar koridor
         elif aspect > 4:
             ratio_score *= 0.9
 
     return connectivity_score * 0.8 + ratio_score * 0.2
+
+
+# ── Erişilebilirlik Grafiği ──────────────────────────────────────────────────
+
+# Kapısız, açık geçişle birbirine bağlanan yatay dolaşım alanları
+CIRCULATION = (RoomType.ANTRE, RoomType.KORIDOR_DAIRE, RoomType.KORIDOR_BINA)
+# Düşey çekirdek yalnızca bina koridoruna açılır
+CORE = (RoomType.MERDIVEN, RoomType.ASANSOR)
+# BFS kökleri: her dairenin antresi ve bina koridoru
+ROOTS = (RoomType.ANTRE, RoomType.KORIDOR_BINA)
+
+
+class UnionFind:
+    """Dizi tabanlı union-find (yol yarılama + boyuta göre birleştirme)."""
+
+    def __init__(self, n: int):
+        self.parent = np.arange(n, dtype=np.int64)
+        self.size = np.ones(n, dtype=np.int64)
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = int(parent[i])
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+    def labels(self) -> np.ndarray:
+        """Her eleman için bileşen kökü."""
+        return np.array([self.find(i) for i in range(len(self.parent))], dtype=np.int64)
+
+
+@dataclass
+class ReachabilityGraph:
+    """Kapı grafiği ve kökten erişilebilirlik."""
+    edges: np.ndarray        # (m, 2) oda indisi çiftleri
+    component: np.ndarray    # (n,) union-find bileşen kökü
+    hops: np.ndarray         # (n,) en yakın kökten adım sayısı, -1 = erişilemez
+
+    @property
+    def unreachable(self) -> list[int]:
+        return np.flatnonzero(self.hops < 0).tolist()
+
+    @property
+    def all_reachable(self) -> bool:
+        return bool((self.hops >= 0).all())
+
+    @property
+    def n_components(self) -> int:
+        return len(np.unique(self.component))
+
+
+# Duvar boşluğu: şerit motoru odaları iç duvar (0.15) aralıkla yerleştirir
+WALL_GAP = 0.20
+
+
+def shared_edge_matrix(rooms: list[PlacedRoom], tolerance: float = WALL_GAP) -> np.ndarray:
+    """
+    Rect.shared_edge_length'in tüm çiftler için vektörel karşılığı (n×n).
+    Aralarında en fazla `tolerance` kadar (duvar) boşluk olan kenarlar temas sayılır.
+    """
+    x, y, x2, y2 = np.array(
+        [(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float,
+    ).reshape(-1, 4).T
+    x_touch = (np.abs(x2[:, None] - x[None, :]) < tolerance) | (np.abs(x2[None, :] - x[:, None]) < tolerance)
+    y_touch = (np.abs(y2[:, None] - y[None, :]) < tolerance) | (np.abs(y2[None, :] - y[:, None]) < tolerance)
+    ov_h = np.maximum(np.minimum(y2[:, None], y2[None, :]) - np.maximum(y[:, None], y[None, :]), 0)
+    ov_w = np.maximum(np.minimum(x2[:, None], x2[None, :]) - np.maximum(x[:, None], x[None, :]), 0)
+    shared = np.where(x_touch, ov_h, np.where(y_touch, ov_w, 0.0))
+    np.fill_diagonal(shared, 0.0)
+    return shared
+
+
+def _door_target(
+    room: PlacedRoom, door, rooms: list[PlacedRoom], candidates: np.ndarray, tolerance: float,
+) -> int:
+    """Kapının açıldığı komşu: kapının duvarına bakan ve kapı konumunu kapsayan oda."""
+    r = room.rect
+    for j in candidates:
+        o = rooms[j].rect
+        if door.wall_side in ("north", "south"):
+            gap = o.y - r.y2 if door.wall_side == "north" else r.y - o.y2
+            lo, hi = max(r.x, o.x), min(r.x2, o.x2)
+        else:
+            gap = o.x - r.x2 if door.wall_side == "east" else r.x - o.x2
+            lo, hi = max(r.y, o.y), min(r.y2, o.y2)
+        if abs(gap) < tolerance and lo <= door.position <= hi:
+            return int(j)
+    return -1
+
+
+def door_adjacency(
+    rooms: list[PlacedRoom],
+    min_shared: float = 0.7,
+    tolerance: float = WALL_GAP,
+) -> np.ndarray:
+    """
+    Kapı grafiğinin simetrik komşuluk matrisi (n×n, bool).
+
+    - Dolaşım alanları (CIRCULATION) arasında en az min_shared paylaşılan
+      kenar kapısız açık geçiştir; merdiven/asansör yalnızca bina
+      koridoruna bağlanır.
+    - Kapısı olan oda yalnızca kapılarıyla bağlanır; kapı, duvarına bakan
+      ve konumunu kapsayan komşuya çözülür (connects_to bir etikettir).
+    - Henüz kapısı olmayan oda (arama bireyleri) min_shared kadar kenar
+      paylaştığı her dolaşım alanına kapı açabilir.
+    Daireler arası geçiş yoktur: iki uç aynı dairede olmalı ya da biri
+    ortak alan (apartment_id < 0) olmalıdır.
+    """
+    n = len(rooms)
+    shared = shared_edge_matrix(rooms, tolerance)
+    types = [r.room_type for r in rooms]
+    circ = np.array([t in CIRCULATION for t in types], dtype=bool)
+    core = np.array([t in CORE for t in types], dtype=bool)
+    hall = np.array([t == RoomType.KORIDOR_BINA for t in types], dtype=bool)
+    doorless = np.array([not r.doors for r in rooms], dtype=bool)
+    apt = np.array([r.apartment_id for r in rooms])
+    allowed = (apt[:, None] == apt[None, :]) | (apt[:, None] < 0) | (apt[None, :] < 0)
+
+    passage = circ[:, None] & circ[None, :]
+    passage |= core[:, None] & (hall | core)[None, :]
+    passage |= (doorless & ~circ & ~core)[:, None] & circ[None, :]
+    adj = (shared >= min_shared) & allowed & (passage | passage.T)
+
+    for i in np.flatnonzero(~doorless).tolist():
+        candidates = np.flatnonzero((shared[i] > 0) & allowed[i])
+        for door in rooms[i].doors:
+            j = _door_target(rooms[i], door, rooms, candidates, tolerance)
+            if j >= 0:
+                adj[i, j] = adj[j, i] = True
+    return adj.reshape(n, n)
+
+
+def hop_distances(adj: np.ndarray, roots: np.ndarray) -> np.ndarray:
+    """Köklerden seviye eşzamanlı BFS; erişilemeyen odalar -1."""
+    hops = np.full(len(adj), -1, dtype=np.int64)
+    frontier = roots.copy()
+    level = 0
+    while frontier.any():
+        hops[frontier] = level
+        level += 1
+        frontier = adj[frontier].any(axis=0) & (hops < 0)
+    return hops
+
+
+def _roots(rooms: list[PlacedRoom]) -> np.ndarray:
+    return np.array([r.room_type in ROOTS for r in rooms], dtype=bool)
+
+
+def compute_reachability(rooms: list[PlacedRoom], min_shared: float = 0.7) -> ReachabilityGraph:
+    """
+    Kapı grafiğini bir kez kur; union-find ile bağlı bileşenler, antre ve
+    bina koridorundan çok kaynaklı BFS ile oda başına adım sayısı.
+    """
+    if not rooms:
+        empty = np.zeros(0, dtype=np.int64)
+        return ReachabilityGraph(edges=np.zeros((0, 2), dtype=np.int64), component=empty, hops=empty)
+    adj = door_adjacency(rooms, min_shared=min_shared)
+    edges = np.argwhere(np.triu(adj, 1))
+    uf = UnionFind(len(rooms))
+    for a, b in edges.tolist():
+        uf.union(a, b)
+    return ReachabilityGraph(
+        edges=edges,
+        component=uf.labels(),
+        hops=hop_distances(adj, _roots(rooms)),
+    )
+
+
+def count_unreachable(rooms: list[PlacedRoom], min_shared: float = 0.7) -> int:
+    """Arama döngüsü için hızlı yol: yalnızca BFS, girişten ulaşılamayan oda sayısı."""
+    if not rooms:
+        return 0
+    hops = hop_distances(door_adjacency(rooms, min_shared=min_shared), _roots(rooms))
+    return int((hops < 0).sum())
@@ -0,0 +1,137 @@
+"""
+Tasarım uzayı taraması: bina düzeyi metrikleri ayak izi ızgarasında.
+
+compute_building_layout'un uç çekirdek (end_core) geometrisi ve
+check_feasibility alt sınırları (long_side, short_side,
+apartments_per_floor) ızgarası üzerinde NumPy yayınlamasıyla hesaplanır;
+tek tek BuildingInput kurulmaz. Erken kütle çalışmaları için saniyede
+10⁵+ konfigürasyon.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .models import RoomCountInput
+from .building_codes import BuildingCodes
+from .building_layout import min_zone_width
+from .feasibility import STRIP_MIN_WIDTH, TOLERANCE
+
+
+@dataclass
+class DesignSpace:
+    """Izgara sonuçları; tüm diziler (len(long), len(short), len(apts)) şeklinde."""
+    long_sides: np.ndarray
+    short_sides: np.ndarray
+    apartments_per_floor: np.ndarray
+    net_to_gross: np.ndarray       # Daire bölgeleri / brüt kat alanı
+    apartment_area: np.ndarray     # Ortalama daire bölgesi alanı (m²)
+    corridor_share: np.ndarray     # Bina koridoru / brüt
+    core_share: np.ndarray         # Merdiven + asansör / brüt
+    feasible: np.ndarray           # check_feasibility (strip) alt sınırları sağlanıyor mu
+
+    @property
+    def size(self) -> int:
+        return self.net_to_gross.size
+
+    def best(self, n: int = 10) -> list[tuple[float, float, int, float]]:
+        """Uygun konfigürasyonlar arasında net/brüt en yüksek n tanesi."""
+        score = np.where(self.feasible, self.net_to_gross, -np.inf)
+        flat = np.argsort(-score, axis=None, kind="stable")[:n]
+        out = []
+        for i, j, k in zip(*np.unravel_index(flat, score.shape)):
+            if not np.isfinite(score[i, j, k]):
+                break
+            out.append((
+                float(self.long_sides[i]), float(self.short_sides[j]),
+                int(self.apartments_per_floor[k]), float(score[i, j, k]),
+            ))
+        return out
+
+
+def explore_design_space(
+    long_sides: np.ndarray | list[float],
+    short_sides: np.ndarray | list[float],
+    apartments_per_floor: np.ndarray | list[int],
+    codes: BuildingCodes,
+    room_counts: RoomCountInput | None = None,
+    num_floors: int = 1,
+    has_elevator: bool = True,
+) -> DesignSpace:
+    """
+    Izgaradaki her (uzun kenar, kısa kenar, kat başı daire) için metrikleri hesapla.
+
+    Geometri _end_core_layout ile aynıdır (tam yükseklik çekirdek solda,
+    ortada çift yüklü koridor, her kenarda eşit daire genişlikleri);
+    uygunluk, tüm daireler room_counts programındayken check_feasibility'nin
+    şerit motoru kontrolleridir.
+    """
+    room_types = (room_counts or RoomCountInput()).to_room_list()
+    L = np.asarray(long_sides, dtype=float)
+    S = np.asarray(short_sides, dtype=float)
+    N = np.asarray(apartments_per_floor, dtype=np.int64)
+    W = L[:, None, None]
+    H = S[None, :, None]
+    n = N[None, None, :]
+
+    ow, iw = codes.outer_wall, codes.inner_wall
+    inner_w = W - 2 * ow
+    inner_h = H - 2 * ow
+
+    # Çekirdek: merdiven + asansör(ler), Madde 34(4) çift asansör
+    needs_dual = (num_floors >= codes.dual_elevator_floors) | (
+        n * num_floors >= codes.dual_elevator_apartments
+    )
+    core_w = codes.stairs_width + (
+        codes.elevator_width * (1 + needs_dual) if has_elevator else 0.0
+    )
+
+    corr_w = codes.building_corridor_width
+    corr_len = inner_w - core_w
+    zone_h = (inner_h - corr_w) / 2
+    n_upper = (n + 1) // 2
+    n_lower = n - n_upper
+    bands = 1 + (n_lower > 0)
+    apt_total = np.maximum(corr_len, 0) * np.maximum(zone_h, 0) * bands
+
+    gross = W * H
+    net_to_gross = apt_total / gross
+    apartment_area = apt_total / n
+    corridor_share = np.maximum(corr_len, 0) * corr_w / gross
+    core_share = core_w * inner_h / gross
+
+    # ── Uygunluk (feasibility._zone_checks, strip motoru) ───────────────
+    # En dar bölge belirleyicidir: üst sırada daha çok daire var
+    zone_w = corr_len / n_upper
+    min_areas = np.array([codes.min_area(rt) for rt in room_types]) * TOLERANCE
+    need_area = min_areas.sum()
+    widest = max((codes.min_width(rt) for rt in room_types), default=0.0)
+    antre_h = np.clip(zone_h * 0.12, 1.5, 2.5)
+    avail_h = zone_h - antre_h - iw
+    strips_w = zone_w - codes.apartment_corridor_width - 2 * iw
+
+    shape = np.broadcast_shapes(W.shape, H.shape, n.shape)
+    feasible = np.broadcast_to(corr_len >= corr_w, shape).copy()
+    feasible &= zone_w >= min_zone_width(room_types, codes) - 1e-6
+    feasible &= np.maximum(strips_w, 0) * np.maximum(avail_h, 0) >= need_area - 1e-6
+    widest_strip = strips_w - STRIP_MIN_WIDTH
+    inv_strip = 1.0 / np.where(widest_strip > 0, widest_strip, np.inf)
+    need_len = sum(
+        np.maximum(a * inv_strip, codes.min_width(rt) * TOLERANCE)
+        for a, rt in zip(min_areas, room_types)
+    ) + iw * max(0, len(room_types) - 2)
+    feasible &= (widest_strip <= 0) | (2 * avail_h >= need_len - 1e-6)
+    feasible &= zone_h >= antre_h + iw + widest * TOLERANCE - 1e-6
+
+    return DesignSpace(
+        long_sides=L,
+        short_sides=S,
+        apartments_per_floor=N,
+        net_to_gross=np.broadcast_to(net_to_gross, shape),
+        apartment_area=np.broadcast_to(apartment_area, shape),
+        corridor_share=np.broadcast_to(corridor_share, shape),
+        core_share=np.broadcast_to(core_share, shape),
+        feasible=feasible,
+    )
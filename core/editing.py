@@ -0,0 +1,377 @@
+"""
+Artımlı plan düzenleme: iç duvar taşıma.
+
+PlanEditor bir FloorPlan'ı sarar ve komşuluk indeksini (kenar çizgisi →
+odalar) tutar. Bir duvar taşındığında yalnızca o duvar çizgisindeki odalar
+yeniden boyutlanır; duvarlar, kapılar, pencereler, doğrulama sonuçları ve
+daire skorları yalnızca etkilenen odalar/daireler için yeniden hesaplanır.
+Plan yerinde güncellenir; yeniden üretim gerekmez.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .models import Rect, RoomType, PlacedRoom, FloorPlan, WallSegment, DoorPlacement
+from .building_codes import BuildingCodes
+from .corridor import WALL_GAP, compute_reachability
+from .apartment_layout import score_apartment
+from .validator import (
+    ValidationResult, validate_room, overlap_error, gap_warnings, egress_errors,
+)
+from .walls import _partition_wall_pairs, _place_windows, merge_walls, SNAP, EXTERIOR_TOL
+
+# Kenar çizgisi eşleme toleransı (find_neighbors ile aynı); bölme duvarları WALL_GAP ile
+TOL = 0.05
+
+# Skora katılmayan daire içi dolaşım alanları (score_apartment girdisi gibi)
+_UNSCORED = (RoomType.ANTRE, RoomType.KORIDOR_DAIRE)
+
+Scorer = Callable[[list[PlacedRoom], Rect, BuildingCodes], float]
+
+
+@dataclass
+class EditResult:
+    """Bir düzenlemenin etkisi."""
+    moved: list[str] = field(default_factory=list)      # Boyutu değişen odalar
+    dirty: list[str] = field(default_factory=list)      # Kapı/doğrulaması yenilenen odalar
+    apartments: list[int] = field(default_factory=list) # Skoru yenilenen daireler
+    fitness_score: float = 0.0
+
+
+class PlanEditor:
+    """
+    FloorPlan üzerinde artımlı düzenleme.
+
+    İndeksler:
+      - _lines: (eksen, kova) → o çizgide dikey ("x") / yatay ("y") kenarı
+        olan odalar; kova = round(koordinat / TOL)
+      - _walls: oda çifti → bölme duvarı (walls.partition_walls kuralı)
+      - _issues / _overlaps: oda ve çift başına doğrulama sonuçları
+      - _scores: daire başına skor (scorer, varsayılan score_apartment)
+    """
+
+    def __init__(self, plan: FloorPlan, codes: BuildingCodes, scorer: Scorer = score_apartment):
+        self.plan = plan
+        self.codes = codes
+        self.scorer = scorer
+        rooms = plan.rooms
+
+        self._lines: dict[tuple[str, int], set[int]] = {}
+        for i in range(len(rooms)):
+            self._index(i)
+
+        self._exterior_walls = [w for w in plan.walls if w.is_exterior]
+        self._walls: dict[tuple[int, int], WallSegment] = {
+            (a, b): wall for a, b, wall in _partition_wall_pairs(rooms, codes)
+        }
+        self._issues: dict[int, ValidationResult] = {}
+        self._overlaps: dict[tuple[int, int], str] = {}
+        for i in range(len(rooms)):
+            self._issues[i] = self._validate(i)
+            for j in range(i + 1, len(rooms)):
+                msg = overlap_error(rooms[i], rooms[j])
+                if msg:
+                    self._overlaps[(i, j)] = msg
+
+        self._scores: dict[int, float] = {}
+        for apt in {r.apartment_id for r in rooms if r.apartment_id >= 0}:
+            self._scores[apt] = self._score(apt)
+
+    # ── Komşuluk indeksi ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _edges(rect: Rect) -> list[tuple[str, float]]:
+        return [("x", rect.x), ("x", rect.x2), ("y", rect.y), ("y", rect.y2)]
+
+    def _index(self, i: int) -> None:
+        for axis, coord in self._edges(self.plan.rooms[i].rect):
+            self._lines.setdefault((axis, round(coord / TOL)), set()).add(i)
+
+    def _unindex(self, i: int) -> None:
+        for axis, coord in self._edges(self.plan.rooms[i].rect):
+            self._lines.get((axis, round(coord / TOL)), set()).discard(i)
+
+    def _on_line(self, axis: str, coord: float, tol: float = TOL) -> set[int]:
+        """Kenarı (axis, coord) çizgisinin tol yakınında olan odalar."""
+        bucket = round(coord / TOL)
+        reach = math.ceil(tol / TOL)
+        found: set[int] = set()
+        for b in range(bucket - reach, bucket + reach + 1):
+            found |= self._lines.get((axis, b), set())
+        rooms = self.plan.rooms
+        return {
+            i for i in found
+            if any(a == axis and abs(c - coord) < tol for a, c in self._edges(rooms[i].rect))
+        }
+
+    def candidates(self, i: int, tol: float = TOL) -> set[int]:
+        """i ile kenar paylaşabilecek odalar (kenar çizgilerinden, tol yakınında)."""
+        found: set[int] = set()
+        for axis, coord in self._edges(self.plan.rooms[i].rect):
+            found |= self._on_line(axis, coord, tol)
+        found.discard(i)
+        return found
+
+    def neighbors(self, i: int, min_shared: float = 0.3) -> list[int]:
+        """find_neighbors ile aynı komşuluk, yalnızca i için."""
+        rect = self.plan.rooms[i].rect
+        return sorted(
+            j for j in self.candidates(i)
+            if rect.shared_edge_length(self.plan.rooms[j].rect, TOL) >= min_shared
+        )
+
+    # ── Duvar taşıma ─────────────────────────────────────────────────────
+
+    def _wall_rooms(self, axis: str, coord: float, lo: float, hi: float) -> tuple[set[int], set[int]]:
+        """
+        Duvar ekseninin iki yanındaki odalar: eksen iç duvar boşluğunun
+        ortasında olduğundan alt taraf uzak kenarı (x2 / y2), üst taraf yakın
+        kenarı (x / y) eksenden en fazla boşluğun yarısı uzakta olanlardır.
+        [lo, hi] aralığıyla örtüşen odalar, aralık bulunan odaların
+        kapsamıyla genişletilerek toplanır (koridor gibi uzun odalar
+        zincirdeki diğer odaları da taşır). (alt taraf, üst taraf) döndürür.
+        """
+        rooms = self.plan.rooms
+        half = WALL_GAP / 2 + SNAP
+        on_line = self._on_line(axis, coord, half)
+        below: set[int] = set()
+        above: set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for i in on_line - below - above:
+                r = rooms[i].rect
+                s0, s1 = (r.y, r.y2) if axis == "x" else (r.x, r.x2)
+                if min(s1, hi) - max(s0, lo) <= TOL:
+                    continue
+                near, far = (r.x, r.x2) if axis == "x" else (r.y, r.y2)
+                if abs(far - coord) < half:
+                    below.add(i)
+                elif abs(near - coord) < half:
+                    above.add(i)
+                else:
+                    continue
+                lo, hi = min(lo, s0), max(hi, s1)
+                changed = True
+        return below, above
+
+    def move_wall(self, wall: WallSegment, delta: float) -> EditResult:
+        """
+        İç duvarı dik doğrultuda delta (m) kadar taşı (+ doğu/kuzey).
+
+        Duvarın iki yanındaki odalar (_wall_rooms) birlikte büyür/küçülür;
+        aradaki iç duvar boşluğu korunur. Dış duvarlar ve ortak alanlara
+        değen duvarlar taşınamaz; bir oda iç duvar kalınlığından daralacaksa
+        ya da zincir dışındaki bir odaya binecekse ValueError (plan
+        değiştirilmez).
+        """
+        rooms = self.plan.rooms
+        br = self.plan.building_rect
+        if abs(wall.start.x - wall.end.x) < 1e-9:
+            axis, coord = "x", wall.start.x
+            lo, hi = sorted((wall.start.y, wall.end.y))
+            bounds = (br.x, br.x2)
+        elif abs(wall.start.y - wall.end.y) < 1e-9:
+            axis, coord = "y", wall.start.y
+            lo, hi = sorted((wall.start.x, wall.end.x))
+            bounds = (br.y, br.y2)
+        else:
+            raise ValueError("Yalnızca eksene paralel duvarlar taşınabilir")
+        if wall.is_exterior or any(abs(coord - b) < TOL for b in bounds):
+            raise ValueError("Dış duvar taşınamaz")
+
+        below, above = self._wall_rooms(axis, coord, lo, hi)
+        if not below and not above:
+            raise ValueError(f"{axis}={coord:.2f} çizgisinde taşınabilir duvar yok")
+        if any(rooms[i].apartment_id < 0 for i in below | above):
+            raise ValueError("Ortak alan (çekirdek, bina koridoru) duvarı taşınamaz")
+
+        # Önce tüm yeni dikdörtgenleri hesapla; geçersizse plan değişmez
+        iw = self.codes.inner_wall
+        new_rects: dict[int, Rect] = {}
+        for i in below | above:
+            r = rooms[i].rect
+            if axis == "x":
+                new = (Rect(x=r.x, y=r.y, w=r.w + delta, h=r.h) if i in below
+                       else Rect(x=r.x + delta, y=r.y, w=r.w - delta, h=r.h))
+            else:
+                new = (Rect(x=r.x, y=r.y, w=r.w, h=r.h + delta) if i in below
+                       else Rect(x=r.x, y=r.y + delta, w=r.w, h=r.h - delta))
+            if new.min_dim <= iw:
+                raise ValueError(f"{rooms[i].room_id} duvar kalınlığından daralıyor")
+            new_rects[i] = new
+        # Zincir dışındaki odalara (ör. boşluğu farklı komşular) binmemeli
+        for i, new in new_rects.items():
+            for j, other in enumerate(rooms):
+                if j in new_rects or not new.overlaps(other.rect) or overlap_error(rooms[i], other):
+                    continue
+                if overlap_error(rooms[i].model_copy(update={"rect": new}), other):
+                    raise ValueError(f"{rooms[i].room_id}, {other.room_id} ile çakışıyor")
+
+        moved = sorted(new_rects)
+        old_neighbors = {j for i in moved for j in self.neighbors(i)}
+        for i in moved:
+            self._unindex(i)
+            self._resize(rooms[i], new_rects[i], axis)
+            self._index(i)
+        dirty = sorted(set(moved) | old_neighbors | {j for i in moved for j in self.neighbors(i)})
+
+        for i in moved:
+            self._update_walls(i)
+            self._update_windows(rooms[i])
+            for j in range(len(rooms)):
+                if j != i:
+                    key = (min(i, j), max(i, j))
+                    msg = overlap_error(rooms[key[0]], rooms[key[1]])
+                    if msg:
+                        self._overlaps[key] = msg
+                    else:
+                        self._overlaps.pop(key, None)
+        for i in dirty:
+            self._update_doors(i)
+            self._issues[i] = self._validate(i)
+
+        apartments = sorted({rooms[i].apartment_id for i in moved if rooms[i].apartment_id >= 0})
+        for apt in apartments:
+            self._scores[apt] = self._score(apt)
+
+        self.plan.walls = merge_walls(self._exterior_walls + list(self._walls.values()))
+        self.plan.fitness_score = self.fitness_score
+        return EditResult(
+            moved=[rooms[i].room_id for i in moved],
+            dirty=[rooms[i].room_id for i in dirty],
+            apartments=apartments,
+            fitness_score=self.plan.fitness_score,
+        )
+
+    def _resize(self, room: PlacedRoom, rect: Rect, axis: str) -> None:
+        """Dikdörtgeni değiştir; net alan taşınan eksende orantılı güncellenir."""
+        if room.net_area is not None:
+            iw = self.codes.inner_wall
+            old_len, new_len = (room.rect.w, rect.w) if axis == "x" else (room.rect.h, rect.h)
+            if old_len - iw > 0:
+                room.net_area = round(room.net_area * (new_len - iw) / (old_len - iw), 1)
+        room.rect = rect
+
+    # ── Duvar, kapı, pencere ─────────────────────────────────────────────
+
+    def _update_walls(self, i: int) -> None:
+        """i'nin bölme duvarlarını yeniden kur (walls.partition_walls kuralı)."""
+        rooms = self.plan.rooms
+        for key in [k for k in self._walls if i in k]:
+            del self._walls[key]
+        # İç duvar boşluğunun karşısındaki odalar da aday
+        near = sorted(self.candidates(i, WALL_GAP))
+        local = [i] + near
+        for a, b, wall in _partition_wall_pairs([rooms[k] for k in local], self.codes):
+            if a == 0:
+                self._walls[tuple(sorted((i, local[b])))] = wall
+
+    def _update_doors(self, i: int) -> None:
+        """
+        Kapıları kenarlarında tut: kapı, duvarındaki komşuyla paylaşılan
+        (kapıya en yakın) aralığa, komşu yoksa odanın kenarına kaydırılır;
+        sığmıyorsa kaldırılır. connects_to oda kimliği ya da etiket
+        ("koridor") olabildiğinden komşu geometriden bulunur.
+        """
+        room = self.plan.rooms[i]
+        others = [self.plan.rooms[j] for j in self.candidates(i)]
+        doors: list[DoorPlacement] = []
+        for door in room.doors:
+            lo, hi = _side_span(room.rect, door.wall_side)
+            spans = [_shared_span(room.rect, o.rect, door.wall_side) for o in others]
+            spans = [sp for sp in spans if sp is not None and sp[1] - sp[0] >= door.width]
+            if spans:
+                # Kapının bulunduğu (ya da en yakın) paylaşılan aralık
+                lo, hi = min(spans, key=lambda sp: max(0.0, sp[0] - door.position, door.position - sp[1]))
+            if hi - lo < door.width:
+                continue
+            pos = min(max(door.position, lo + door.width / 2), hi - door.width / 2)
+            doors.append(door if pos == door.position else door.model_copy(update={"position": pos}))
+        room.doors = doors
+
+    def _update_windows(self, room: PlacedRoom) -> None:
+        """
+        Pencereleri kenarlarında tut: dış cepheden kopan pencere kaldırılır,
+        kenarına sığmayan ortalanıp daraltılır; yeni dış cephe kazanan ve
+        penceresi olmayan odaya _place_windows ile pencere eklenir.
+        """
+        touches = room.rect.touches_edge(self.plan.building_rect, tol=EXTERIOR_TOL)
+        margin = 0.3
+        windows = []
+        for w in room.windows:
+            if not touches.get(w.wall_side, False):
+                continue
+            lo, hi = _side_span(room.rect, w.wall_side)
+            if lo - 1e-6 <= w.position - w.width / 2 and w.position + w.width / 2 <= hi + 1e-6:
+                windows.append(w)
+                continue
+            width = min(w.width, max(self.codes.window_min_width, hi - lo - 2 * margin))
+            windows.append(w.model_copy(update={"position": (lo + hi) / 2, "width": width}))
+        if not windows and any(touches.values()):
+            windows = _place_windows(room, self.plan.building_rect, self.codes)
+        room.windows = windows
+
+    # ── Doğrulama ve skor ────────────────────────────────────────────────
+
+    def _validate(self, i: int) -> ValidationResult:
+        rooms = self.plan.rooms
+        return validate_room(
+            rooms[i], self.plan.building_rect, self.codes,
+            [rooms[j] for j in self.candidates(i)],
+        )
+
+    def _score(self, apt: int) -> float:
+        rooms = [
+            r for r in self.plan.rooms
+            if r.apartment_id == apt and r.room_type not in _UNSCORED
+        ]
+        return self.scorer(rooms, self.plan.building_rect, self.codes)
+
+    @property
+    def fitness_score(self) -> float:
+        """generate_plans ile aynı: daire skorlarının ortalaması."""
+        return sum(self._scores.values()) / max(1, len(self._scores))
+
+    @property
+    def validation(self) -> ValidationResult:
+        """Güncel doğrulama sonucu (validate_plan ile aynı mesajlar)."""
+        result = ValidationResult()
+        for msg in self._overlaps.values():
+            result.add_error(msg)
+        for i in range(len(self.plan.rooms)):
+            issues = self._issues[i]
+            for msg in issues.errors:
+                result.add_error(msg)
+            result.warnings.extend(issues.warnings)
+        # Kapı grafiği küçük; her sorguda baştan kurulur
+        reach = compute_reachability(self.plan.rooms)
+        for i in reach.unreachable:
+            result.add_error(f"{self.plan.rooms[i].room_id}: girişten ulaşılamıyor")
+        result.warnings.extend(gap_warnings(self.plan, self.codes))
+        for msg in egress_errors(self.plan, self.codes):
+            result.add_error(msg)
+        return result
+
+
+def _side_span(rect: Rect, side: str) -> tuple[float, float]:
+    """Kenar boyunca koordinat aralığı (kapı/pencere konumu bu eksende)."""
+    return (rect.x, rect.x2) if side in ("north", "south") else (rect.y, rect.y2)
+
+
+def _shared_span(rect: Rect, other: Rect, side: str) -> tuple[float, float] | None:
+    """rect'in `side` kenarının other ile paylaşılan aralığı (yoksa None)."""
+    if side in ("north", "south"):
+        edge = rect.y2 if side == "north" else rect.y
+        opposite = other.y if side == "north" else other.y2
+        lo, hi = max(rect.x, other.x), min(rect.x2, other.x2)
+    else:
+        edge = rect.x2 if side == "east" else rect.x
+        opposite = other.x if side == "east" else other.x2
+        lo, hi = max(rect.y, other.y), min(rect.y2, other.y2)
+    if abs(edge - opposite) >= TOL or hi <= lo:
+        return None
+    return lo, hi
@@ -0,0 +1,182 @@
+"""
+Yerleşimden önce kapalı form uygulanabilirlik ön kontrolü.
+
+Her daire bölgesinin ölçüleri, istenen odaların PAİY minimumlarından
+türetilen alt sınırlarla karşılaştırılır (min alan toplamı, şerit
+genişlikleri, şerit boyu, koridor/antre payı). Hiçbir yerleşim
+çalıştırılmaz; ihlal edilen (bağlayıcı) kısıtlar yapılandırılmış bir
+raporda döner, generate_plans uygun olmayan girdilerde erken çıkar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .models import BuildingInput, RoomCountInput, RoomType, UnitTypeInput
+from .building_codes import BuildingCodes
+from .building_layout import (
+    BuildingZones, compute_building_layout, min_zone_width,
+)
+from .unit_mix import as_unit_types, resolve_unit_counts
+
+# _strip_setup'taki şerit alt sınırı (yatak odası/oda dar kenarı)
+STRIP_MIN_WIDTH = 2.50
+
+# validator ile aynı tolerans: min alan/genişliğin %85'i ihlal sayılmaz
+TOLERANCE = 0.85
+
+
+@dataclass
+class ConstraintCheck:
+    """Tek bir alt sınır kontrolü: value >= limit olmalı."""
+    code: str            # "zone_width", "zone_depth", "net_area", "strip_length", ...
+    apartment: int       # Daire indisi (-1 = bina düzeyi)
+    value: float
+    limit: float
+    message: str
+
+    @property
+    def violated(self) -> bool:
+        return self.value < self.limit - 1e-6
+
+    @property
+    def deficit(self) -> float:
+        """Göreli eksiklik (0 = sınırda, >0 = ihlal)."""
+        return (self.limit - self.value) / max(abs(self.limit), 1e-9)
+
+
+@dataclass
+class FeasibilityReport:
+    """Ön kontrol sonucu."""
+    checks: list[ConstraintCheck] = field(default_factory=list)
+
+    @property
+    def feasible(self) -> bool:
+        return not any(c.violated for c in self.checks)
+
+    @property
+    def binding(self) -> list[ConstraintCheck]:
+        """İhlal edilen kısıtlar, en büyük göreli eksiklikten başlayarak."""
+        return sorted((c for c in self.checks if c.violated), key=lambda c: -c.deficit)
+
+    def summary(self) -> list[str]:
+        return [c.message for c in self.binding]
+
+
+def _antre_height(zone_h: float) -> float:
+    """make_entry ile aynı antre derinliği."""
+    return max(1.5, min(2.5, zone_h * 0.12))
+
+
+def _zone_checks(
+    apt_idx: int,
+    zone_w: float,
+    zone_h: float,
+    room_types: list[RoomType],
+    codes: BuildingCodes,
+    engine: str,
+) -> list[ConstraintCheck]:
+    iw = codes.inner_wall
+    label = f"Daire {apt_idx + 1}"
+    min_areas = [codes.min_area(rt) * TOLERANCE for rt in room_types]
+    need_area = sum(min_areas)
+    avail_h = zone_h - _antre_height(zone_h) - iw
+    checks: list[ConstraintCheck] = []
+
+    if engine == "strip":
+        corr_w = codes.apartment_corridor_width
+        min_w = min_zone_width(room_types, codes)
+        strips_w = zone_w - corr_w - 2 * iw
+        checks.append(ConstraintCheck(
+            "zone_width", apt_idx, zone_w, min_w,
+            f"{label}: genişlik {zone_w:.2f}m < {min_w:.2f}m (iki şerit + daire koridoru)",
+        ))
+        # Odalar koridorun iki yanındaki şeritlerde, antrenin arkasında
+        usable = max(0.0, strips_w) * max(0.0, avail_h)
+        checks.append(ConstraintCheck(
+            "net_area", apt_idx, usable, need_area,
+            f"{label}: şerit alanı {usable:.1f}m² < min oda alanları toplamı {need_area:.1f}m²",
+        ))
+        # Her oda en geniş şeritte bile min_area / genişlik kadar, dar
+        # kenarı şerit boyunca kalırsa en az min_width kadar boy ister;
+        # iki şeridin toplam boyu buna ve ara duvarlara yetmeli.
+        widest_strip = strips_w - STRIP_MIN_WIDTH
+        if widest_strip > 0 and room_types:
+            min_lens = [codes.min_width(rt) * TOLERANCE for rt in room_types]
+            need_len = (
+                sum(max(a / widest_strip, w) for a, w in zip(min_areas, min_lens))
+                + iw * max(0, len(room_types) - 2)
+            )
+            checks.append(ConstraintCheck(
+                "strip_length", apt_idx, 2 * avail_h, need_len,
+                f"{label}: şerit boyu 2×{avail_h:.2f}m < gereken {need_len:.2f}m",
+            ))
+    else:
+        widest = max((codes.min_width(rt) for rt in room_types), default=0.0) * TOLERANCE
+        checks.append(ConstraintCheck(
+            "zone_width", apt_idx, zone_w, widest,
+            f"{label}: genişlik {zone_w:.2f}m < en geniş oda min genişliği {widest:.2f}m",
+        ))
+        usable = zone_w * max(0.0, avail_h)
+        checks.append(ConstraintCheck(
+            "net_area", apt_idx, usable, need_area,
+            f"{label}: kullanılabilir alan {usable:.1f}m² < min oda alanları toplamı {need_area:.1f}m²",
+        ))
+
+    widest = max((codes.min_width(rt) for rt in room_types), default=0.0)
+    min_d = _antre_height(zone_h) + iw + widest * TOLERANCE
+    checks.append(ConstraintCheck(
+        "zone_depth", apt_idx, zone_h, min_d,
+        f"{label}: derinlik {zone_h:.2f}m < {min_d:.2f}m (antre + en geniş oda)",
+    ))
+    return checks
+
+
+def check_feasibility(
+    building: BuildingInput,
+    room_counts: RoomCountInput | list[UnitTypeInput],
+    codes: BuildingCodes,
+    zones: BuildingZones | None = None,
+    engine: str = "strip",
+    typology: str = "end_core",
+    zone_room_types: list[list[RoomType]] | None = None,
+) -> FeasibilityReport:
+    """
+    Bina ve daire programı için analitik alt sınırları kontrol et.
+
+    zones verilmezse bina düzeni (typology) hesaplanır. zone_room_types
+    (bölge sırasıyla oda listeleri, ör. tip ataması sonrası) verilmezse
+    daire tipleri bölgelere sayılarına göre sırayla dağıtılır.
+    Hiçbir oda yerleştirilmez; rapor bağlayıcı kısıtları döndürür.
+    """
+    report = FeasibilityReport()
+    if zone_room_types is None:
+        units = as_unit_types(room_counts)
+        try:
+            counts = resolve_unit_counts(units, building.apartments_per_floor)
+        except ValueError as exc:
+            report.checks.append(ConstraintCheck("unit_counts", -1, 0.0, 1.0, str(exc)))
+            return report
+        zone_room_types = [
+            units[t].rooms.to_room_list() for t, c in enumerate(counts) for _ in range(c)
+        ]
+
+    if zones is None:
+        zones = compute_building_layout(building, codes, strategy=typology)
+
+    corr = zones.corridor_rect
+    checks = report.checks
+    checks.append(ConstraintCheck(
+        "corridor_length", -1, corr.w, codes.building_corridor_width,
+        f"Bina koridoru boyu {corr.w:.2f}m çekirdekten sonra yetersiz",
+    ))
+    n_placed = len(zones.apartment_zones)
+    checks.append(ConstraintCheck(
+        "apartment_count", -1, n_placed, building.apartments_per_floor,
+        f"{building.apartments_per_floor} dairenin yalnızca {n_placed} tanesi "
+        f"{zones.strategy} düzenine sığıyor",
+    ))
+
+    for apt_idx, (zone, room_types) in enumerate(zip(zones.apartment_zones, zone_room_types)):
+        checks.extend(_zone_checks(apt_idx, zone.w, zone.h, room_types, codes, engine))
+    return report
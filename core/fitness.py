@@ -5,8 +5,11 @@ Her plan alternatifinin kalitesini 0-1 arası puanlama.
 
 from __future__ import annotations
 
-from .models import Rect, RoomType, PlacedRoom, FloorPlan
+import numpy as np
+
+from .models import Rect, RoomType, PlacedRoom, FloorPlan, CompassDirection
 from .building_codes import BuildingCodes
+from .envelope import get_compass_edges, edge_to_wall_side
 
 
 def evaluate_fitness(
@@ -14,9 +17,15 @@ def evaluate_fitness(
     building_rect: Rect,
     target_areas: list[float],
     codes: BuildingCodes,
+    north_facing: CompassDirection | None = None,
+    orientation: float | None = None,
 ) -> float:
     """
     Plan kalitesini 0-1 arası puanla.
+
+    north_facing verilirse (ya da toplu yoldan hazır `orientation` skoru
+    gelirse) yönlenme / gün ışığı bileşeni eklenir ve ağırlıklar yeniden
+    normalize edilir; verilmezse skor eskisiyle aynıdır.
     
     Bileşenler:
     1. Alan dağılımı skoru (hedef alanlara yakınlık)
@@ -24,6 +33,7 @@ def evaluate_fitness(
     3. Dış duvar erişimi skoru
     4. Komşuluk skoru
     5. Kompaktlık (toplam alan verimliliği)
+    6. Yönlenme (isteğe bağlı, bkz. orientation_scores)
     """
     if not rooms:
         return 0.0
@@ -56,7 +66,16 @@ def evaluate_fitness(
     scores.append(compact_score)
     weights.append(0.10)
 
+    # 6. Yönlenme (ağırlık: 0.10, isteğe bağlı)
+    if orientation is None and north_facing is not None:
+        orientation = orientation_score(rooms, building_rect, north_facing)
+    if orientation is not None:
+        scores.append(orientation)
+        weights.append(0.10)
+
     total = sum(s * w for s, w in zip(scores, weights))
+    if orientation is not None:
+        total /= sum(weights)
     return max(0.0, min(1.0, total))
 
 
@@ -121,7 +140,7 @@ def _exterior_access_score(
     for room in rooms:
         if codes.needs_exterior_wall(room.room_type):
             need_exterior += 1
-            touches = room.rect.touches_edge(building_rect, tolerance=0.05)
+            touches = room.rect.touches_edge(building_rect, tol=0.05)
             if any(touches.values()):
                 has_exterior += 1
 
@@ -201,3 +220,93 @@ def _compactness_score(rooms: list[PlacedRoom], building_rect: Rect) -> float:
         return (efficiency - 0.60) / 0.30
     else:
         return efficiency / 0.60 * 0.5
+
+
+# ── Yönlenme / Gün Işığı ─────────────────────────────────────────────────────
+
+# Yaşam mahalleri için pusula yönü tercihleri (kuzey, doğu, güney, batı).
+# Salon güneyi, yatak odası sabah güneşini (doğu), mutfak serin cepheyi sever.
+_COMPASS = (CompassDirection.NORTH, CompassDirection.EAST, CompassDirection.SOUTH, CompassDirection.WEST)
+_DIRECTION_PREFS: dict[RoomType, tuple[float, float, float, float]] = {
+    RoomType.SALON: (0.2, 0.6, 1.0, 0.7),
+    RoomType.YATAK_ODASI: (0.4, 1.0, 0.8, 0.5),
+    RoomType.ODA: (0.4, 0.9, 0.9, 0.6),
+    RoomType.MUTFAK: (0.8, 1.0, 0.5, 0.3),
+}
+HABITABLE = tuple(_DIRECTION_PREFS)
+
+# Plan kenarları (rect wall_side sırası); tablolar bu sütun sırasıyla
+PLAN_SIDES = ("north", "east", "south", "west")
+ROOM_TYPE_INDEX = {rt: i for i, rt in enumerate(RoomType)}
+
+
+def _orientation_table(north_facing: CompassDirection) -> np.ndarray:
+    """(oda tipi, plan kenarı) ağırlık tablosu; yaşam mahali olmayan satırlar 0."""
+    edges = get_compass_edges(Rect(x=0, y=0, w=1, h=1), north_facing)
+    side_to_compass = {edge_to_wall_side(edge): compass for compass, edge in edges.items()}
+    table = np.zeros((len(RoomType), len(PLAN_SIDES)))
+    for rt, prefs in _DIRECTION_PREFS.items():
+        by_compass = dict(zip((c.value for c in _COMPASS), prefs))
+        table[ROOM_TYPE_INDEX[rt]] = [by_compass[side_to_compass[side]] for side in PLAN_SIDES]
+    return table
+
+
+# north_facing başına önceden hesaplanmış tablolar
+ORIENTATION_TABLES: dict[CompassDirection, np.ndarray] = {
+    direction: _orientation_table(direction) for direction in CompassDirection
+}
+_HABITABLE_MASK = np.array([rt in _DIRECTION_PREFS for rt in RoomType])
+
+EXTERIOR_TOL = 0.5      # Dış duvar kalınlığını aşan cephe toleransı
+
+
+def facade_contact(bounds: np.ndarray, building_rect: Rect, tol: float = EXTERIOR_TOL) -> np.ndarray:
+    """
+    Dış cephe teması: bounds (..., 4) = (x, y, x2, y2) → (..., 4) bool,
+    sütunlar PLAN_SIDES sırasıyla (Rect.touches_edge'in vektörel karşılığı).
+    """
+    br = building_rect
+    return np.stack([
+        np.abs(bounds[..., 3] - br.y2) < tol,
+        np.abs(bounds[..., 2] - br.x2) < tol,
+        np.abs(bounds[..., 1] - br.y) < tol,
+        np.abs(bounds[..., 0] - br.x) < tol,
+    ], axis=-1)
+
+
+def orientation_scores(
+    facades: np.ndarray,
+    type_idx: np.ndarray,
+    north_facing: CompassDirection,
+) -> np.ndarray:
+    """
+    Toplu yönlenme skoru (0-1): facades (P, n, 4) pencere açılabilen cepheler,
+    type_idx (n,) ROOM_TYPE_INDEX. Her yaşam mahalli en iyi cephesinin
+    ağırlığını alır (cephesi yoksa 0); skor yaşam mahallerinin ortalamasıdır.
+    """
+    weights = ORIENTATION_TABLES[north_facing][type_idx]          # (n, 4)
+    best = np.where(facades, weights, 0.0).max(axis=-1)           # (P, n)
+    habitable = _HABITABLE_MASK[type_idx]
+    if not habitable.any():
+        return np.ones(facades.shape[0])
+    return best[:, habitable].mean(axis=-1)
+
+
+def orientation_score(
+    rooms: list[PlacedRoom],
+    building_rect: Rect,
+    north_facing: CompassDirection,
+) -> float:
+    """
+    Tek plan için yönlenme skoru. Penceresi olan odalarda pencerelerin
+    baktığı kenarlar, olmayanlarda (arama bireyleri) dış cephe teması kullanılır.
+    """
+    if not rooms:
+        return 0.0
+    bounds = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms])
+    facades = facade_contact(bounds, building_rect)
+    for i, room in enumerate(rooms):
+        if room.windows:
+            facades[i] = [any(w.wall_side == side for w in room.windows) for side in PLAN_SIDES]
+    type_idx = np.array([ROOM_TYPE_INDEX[r.room_type] for r in rooms])
+    return float(orientation_scores(facades[None], type_idx, north_facing)[0])
@@ -1,19 +1,26 @@
 """
 Mobilya tanımları ve otomatik yerleştirme.
 Her oda tipine uygun şematik mobilyalar standart boyutlarda.
+
+Yerleşimler yalnızca oda tipi ve boyutuna bağlıdır; room_furniture
+(room_type, 1 cm'ye yuvarlanmış w, h) anahtarıyla sınırlı bir LRU
+önbellekten değiştirilemez tuple döndürür. Aynı ölçülü odalar (ör. çok
+katlı paftalarda yüzlerce yatak odası) bir kez hesaplanır.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import Callable
 
 from .models import Rect, RoomType
 
 
-@dataclass
+@dataclass(frozen=True)
 class FurnitureItem:
-    """Tek mobilya parçası."""
+    """Tek mobilya parçası (değiştirilemez; önbellekteki yerleşimler paylaşılır)."""
     name: str
     width: float   # metre
     height: float  # metre (plandaki uzunluk)
@@ -93,33 +100,28 @@ def _layout_bedroom(w: float, h: float, m: float) -> list[FurnitureItem]:
 
     if w >= 3.0 and h >= 3.0:
         # Yatak üst duvara yaslanmış, ortada
-        bed.x = (w - bed.width) / 2
-        bed.y = h - bed.height - m
+        bed = replace(bed, x=(w - bed.width) / 2, y=h - bed.height - m)
         items.append(bed)
 
         # Komodinler yatağın iki yanında
         ns1 = FurnitureItem("Komodin", 0.45, 0.45)
-        ns1.x = bed.x - ns1.width - 0.05
-        ns1.y = bed.y + bed.height - ns1.height
+        ns1 = replace(ns1, x=bed.x - ns1.width - 0.05, y=bed.y + bed.height - ns1.height)
         if ns1.x >= m:
             items.append(ns1)
 
         ns2 = FurnitureItem("Komodin", 0.45, 0.45)
-        ns2.x = bed.x + bed.width + 0.05
-        ns2.y = bed.y + bed.height - ns2.height
+        ns2 = replace(ns2, x=bed.x + bed.width + 0.05, y=bed.y + bed.height - ns2.height)
         if ns2.x + ns2.width <= w - m:
             items.append(ns2)
 
         # Dolap karşı duvarda
         wardrobe = FurnitureItem("Dolap", min(1.80, w * 0.4), 0.60)
-        wardrobe.x = m
-        wardrobe.y = m
+        wardrobe = replace(wardrobe, x=m, y=m)
         items.append(wardrobe)
     else:
         # Küçük oda: tek kişilik yatak
         bed = FurnitureItem("Yatak", 0.90, 2.00)
-        bed.x = m
-        bed.y = h - bed.height - m
+        bed = replace(bed, x=m, y=h - bed.height - m)
         items.append(bed)
 
     return items
@@ -130,21 +132,18 @@ def _layout_room(w: float, h: float, m: float) -> list[FurnitureItem]:
     items = []
     # Çalışma masası
     desk = FurnitureItem("Masa", min(1.20, w * 0.5), 0.60)
-    desk.x = m
-    desk.y = h - desk.height - m
+    desk = replace(desk, x=m, y=h - desk.height - m)
     items.append(desk)
 
     # Sandalye
     chair = FurnitureItem("Sandalye", 0.45, 0.45, shape="circle")
-    chair.x = desk.x + desk.width / 2 - chair.width / 2
-    chair.y = desk.y - chair.height - 0.2
+    chair = replace(chair, x=desk.x + desk.width / 2 - chair.width / 2, y=desk.y - chair.height - 0.2)
     items.append(chair)
 
     # Tek yatak veya koltuk
     if h > 3.5:
         bed = FurnitureItem("Yatak", 0.90, 2.00)
-        bed.x = w - bed.width - m
-        bed.y = m
+        bed = replace(bed, x=w - bed.width - m, y=m)
         items.append(bed)
 
     return items
@@ -156,39 +155,33 @@ def _layout_living(w: float, h: float, m: float) -> list[FurnitureItem]:
 
     # Koltuk grubu
     sofa = FurnitureItem("Koltuk", min(2.10, w * 0.5), 0.85)
-    sofa.x = m
-    sofa.y = h - sofa.height - m
+    sofa = replace(sofa, x=m, y=h - sofa.height - m)
     items.append(sofa)
 
     # Sehpa
     table = FurnitureItem("Sehpa", 1.10, 0.55)
-    table.x = sofa.x + (sofa.width - table.width) / 2
-    table.y = sofa.y - table.height - 0.5
+    table = replace(table, x=sofa.x + (sofa.width - table.width) / 2, y=sofa.y - table.height - 0.5)
     if table.y > m:
         items.append(table)
 
     # TV ünitesi karşıda
     tv = FurnitureItem("TV", min(1.60, w * 0.4), 0.40)
-    tv.x = sofa.x + (sofa.width - tv.width) / 2
-    tv.y = m
+    tv = replace(tv, x=sofa.x + (sofa.width - tv.width) / 2, y=m)
     items.append(tv)
 
     # Yemek masası (eğer alan yetiyorsa)
     if w > 4.5:
         dtable = FurnitureItem("Yemek Masası", 1.20, 0.80)
-        dtable.x = w - dtable.width - m
-        dtable.y = h - dtable.height - m - 0.3
+        dtable = replace(dtable, x=w - dtable.width - m, y=h - dtable.height - m - 0.3)
         items.append(dtable)
 
         # Sandalyeler
         for i in range(4):
             ch = FurnitureItem("Sandalye", 0.38, 0.38)
             if i < 2:
-                ch.x = dtable.x + 0.15 + i * 0.55
-                ch.y = dtable.y - ch.height - 0.05
+                ch = replace(ch, x=dtable.x + 0.15 + i * 0.55, y=dtable.y - ch.height - 0.05)
             else:
-                ch.x = dtable.x + 0.15 + (i - 2) * 0.55
-                ch.y = dtable.y + dtable.height + 0.05
+                ch = replace(ch, x=dtable.x + 0.15 + (i - 2) * 0.55, y=dtable.y + dtable.height + 0.05)
             items.append(ch)
 
     return items
@@ -202,34 +195,29 @@ def _layout_kitchen(w: float, h: float, m: float) -> list[FurnitureItem]:
     # Alt tezgah (sol duvar boyunca)
     counter_len = min(h - 2 * m, h * 0.7)
     counter = FurnitureItem("Tezgah", counter_depth, counter_len)
-    counter.x = m
-    counter.y = h - counter_len - m
+    counter = replace(counter, x=m, y=h - counter_len - m)
     items.append(counter)
 
     # Üst tezgah (üst duvar boyunca)
     top_len = min(w - counter_depth - 2 * m, w * 0.5)
     if top_len > 0.5:
         top_counter = FurnitureItem("Tezgah", top_len, counter_depth)
-        top_counter.x = counter.x + counter_depth
-        top_counter.y = h - counter_depth - m
+        top_counter = replace(top_counter, x=counter.x + counter_depth, y=h - counter_depth - m)
         items.append(top_counter)
 
     # Buzdolabı
     fridge = FurnitureItem("Buzdolabı", 0.65, 0.70)
-    fridge.x = w - fridge.width - m
-    fridge.y = h - fridge.height - m
+    fridge = replace(fridge, x=w - fridge.width - m, y=h - fridge.height - m)
     items.append(fridge)
 
     # Ocak (tezgah üzerinde simge)
     stove = FurnitureItem("Ocak", 0.55, 0.55, shape="circle")
-    stove.x = counter.x + 0.03
-    stove.y = counter.y + counter_len * 0.4
+    stove = replace(stove, x=counter.x + 0.03, y=counter.y + counter_len * 0.4)
     items.append(stove)
 
     # Evye (tezgah üzerinde simge)
     sink = FurnitureItem("Evye", 0.45, 0.40, shape="arc")
-    sink.x = counter.x + 0.08
-    sink.y = counter.y + counter_len * 0.7
+    sink = replace(sink, x=counter.x + 0.08, y=counter.y + counter_len * 0.7)
     items.append(sink)
 
     return items
@@ -242,32 +230,27 @@ def _layout_bathroom(w: float, h: float, m: float) -> list[FurnitureItem]:
     # Duş/küvet
     if w >= 2.5 and h >= 2.5:
         tub = FurnitureItem("Küvet", 0.75, 1.70)
-        tub.x = m
-        tub.y = h - tub.height - m
+        tub = replace(tub, x=m, y=h - tub.height - m)
         items.append(tub)
     else:
         shower = FurnitureItem("Duş", 0.85, 0.85)
-        shower.x = m
-        shower.y = h - shower.height - m
+        shower = replace(shower, x=m, y=h - shower.height - m)
         items.append(shower)
 
     # Lavabo
     sink = FurnitureItem("Lavabo", 0.50, 0.40, shape="arc")
-    sink.x = w - sink.width - m
-    sink.y = h - sink.height - m
+    sink = replace(sink, x=w - sink.width - m, y=h - sink.height - m)
     items.append(sink)
 
     # Klozet
     toilet = FurnitureItem("Klozet", 0.40, 0.65)
-    toilet.x = w - toilet.width - m
-    toilet.y = m
+    toilet = replace(toilet, x=w - toilet.width - m, y=m)
     items.append(toilet)
 
     # Çamaşır makinesi (eğer alan yetiyorsa)
     if w > 2.2 and h > 2.5:
         wm = FurnitureItem("Çam.Mak.", 0.60, 0.60)
-        wm.x = m
-        wm.y = m
+        wm = replace(wm, x=m, y=m)
         items.append(wm)
 
     return items
@@ -279,14 +262,91 @@ def _layout_wc(w: float, h: float, m: float) -> list[FurnitureItem]:
 
     # Klozet
     toilet = FurnitureItem("Klozet", 0.38, 0.55)
-    toilet.x = (w - toilet.width) / 2
-    toilet.y = m
+    toilet = replace(toilet, x=(w - toilet.width) / 2, y=m)
     items.append(toilet)
 
     # Küçük lavabo
     sink = FurnitureItem("Lavabo", 0.35, 0.30, shape="arc")
-    sink.x = (w - sink.width) / 2
-    sink.y = h - sink.height - m
+    sink = replace(sink, x=(w - sink.width) / 2, y=h - sink.height - m)
     items.append(sink)
 
     return items
+
+
+# ── Yerleşim Önbelleği ───────────────────────────────────────────────────────
+
+class FurnitureCache:
+    """
+    Sınırlı (LRU) (oda tipi, w, h) → mobilya yerleşimi önbelleği.
+
+    Boyutlar 1 cm'ye yuvarlanır ve yerleşim yuvarlanmış boyutlarla hesaplanır;
+    sonuç, ilk isteyen odanın tam ölçüsünden bağımsızdır. Girdiler
+    değiştirilemez (FurnitureItem tuple'ı) olduğundan render ve dışa aktarma
+    arasında ve iş parçacıkları arasında paylaşılabilir.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple, tuple[FurnitureItem, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(room_type: RoomType, room_w: float, room_h: float) -> tuple:
+        return (room_type, round(room_w, 2), round(room_h, 2))
+
+    def get(self, room_type: RoomType, room_w: float, room_h: float) -> tuple[FurnitureItem, ...]:
+        key = self.key(room_type, room_w, room_h)
+        with self._lock:
+            items = self._data.get(key)
+            if items is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return items
+            self.misses += 1
+        items = tuple(get_room_furniture(*key))
+        with self._lock:
+            self._data[key] = items
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# Render ve dışa aktarıcıların paylaştığı varsayılan önbellek
+FURNITURE_CACHE = FurnitureCache()
+
+
+def room_furniture(
+    room_type: RoomType,
+    room_w: float,
+    room_h: float,
+    cache: FurnitureCache | None = None,
+) -> tuple[FurnitureItem, ...]:
+    """get_room_furniture'ın önbellekli karşılığı (varsayılan: FURNITURE_CACHE)."""
+    return (cache if cache is not None else FURNITURE_CACHE).get(room_type, room_w, room_h)
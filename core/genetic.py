@@ -1,24 +1,108 @@
 """
 Plan üretim motoru v2.
 Bina düzeni + daire yerleşimi + 4 alternatif seçimi.
+
+İki daire yerleşim motoru:
+  - "strip": koridor-şerit yerleşimi (apartment_layout)
+  - "slicing": slicing tree genomları üzerinde genetik arama
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
 from .models import (
-    BuildingInput, RoomCountInput, RoomType, Rect,
-    PlacedRoom, FloorPlan, WallSegment, Point,
+    BuildingInput, RoomCountInput, UnitTypeInput, RoomType, Rect,
+    PlacedRoom, FloorPlan, CompassDirection,
 )
 from .building_codes import BuildingCodes
-from .building_layout import compute_building_layout
-from .apartment_layout import generate_apartment_variants
+from .building_layout import compute_building_layout, evaluate_layout_strategies
+from .apartment_layout import (
+    ApartmentPlan, generate_apartment_variants, make_entry, translate_plan,
+)
+from .fitness import evaluate_fitness, facade_contact, orientation_scores, ROOM_TYPE_INDEX
+from .corridor import count_unreachable
+from .walls import place_openings, _generate_walls
+from .room_defaults import compute_room_target_areas
+from .unit_mix import as_unit_types, resolve_unit_counts, assign_unit_types
+from .assignment import solve_assignment
+from .feasibility import check_feasibility
+from .slicing_tree import (
+    SlicingGenome, GenomeCache, PopulationBuffers, population_keys, genome_from_key,
+    randomize_population, mutate_population, crossover_population,
+    population_entropy, repair_population, room_minimums, adapt_genome,
+)
+
+
+@dataclass
+class WarmStart:
+    """
+    generate_plans çağrıları arasında taşınan önceki sonuçlar.
+
+    Küçük girdi değişikliklerinde (ör. uzun kenar +1 m, bir yatak odası
+    fazla) arama baştan yapılmaz:
+      - şekli değişmeyen bölgeler (program, koridor tarafı, ölçüler, cepheye
+        göre konum) önceki varyantları kaydırarak aynen kullanır;
+      - şekli değişen bölgelerde slicing araması önceki en iyi genomlardan
+        (program farklıysa adapt_genome ile uyarlanarak) başlar.
+    Şerit motoru deterministik ve ucuz olduğundan yalnızca ilkinden yararlanır.
+    Aynı nesne ardışık çağrılara verilir; her çağrı sonunda güncellenir.
+    Yönetmelik parametreleri (BuildingCodes) değişirse yeni nesne kullanılmalı.
+    """
+    variants: dict[tuple, tuple[Rect, list[ApartmentPlan]]] = field(default_factory=dict)
+    genomes: dict[tuple[str, ...], list[SlicingGenome]] = field(default_factory=dict)
+    max_programs: int = 16          # Saklanan en fazla oda programı (genom listesi)
+    reused: int = 0                 # Son çağrıda aynen kullanılan bölge şekli
+    seeded: int = 0                 # Son çağrıda tohumlanan arama
+
+    def seeds_for(
+        self,
+        search_types: list[RoomType],
+        rng: np.random.Generator,
+    ) -> list[SlicingGenome] | None:
+        """Program için tohum genomları; tam eşleşme yoksa en yakın programdan uyarla."""
+        program = tuple(rt.value for rt in search_types)
+        if program in self.genomes:
+            return list(self.genomes[program])
+        if not self.genomes:
+            return None
+
+        def _distance(other: tuple[str, ...]) -> int:
+            a, b = list(program), list(other)
+            common = sum(min(a.count(v), b.count(v)) for v in set(a))
+            return len(a) + len(b) - 2 * common
+
+        nearest = min(self.genomes, key=_distance)
+        old_types = [RoomType(v) for v in nearest]
+        return [adapt_genome(g, old_types, search_types, rng) for g in self.genomes[nearest]]
+
+    def remember_genomes(self, search_types: list[RoomType], genomes: list[SlicingGenome]) -> None:
+        program = tuple(rt.value for rt in search_types)
+        self.genomes.pop(program, None)
+        self.genomes[program] = genomes
+        while len(self.genomes) > self.max_programs:
+            self.genomes.pop(next(iter(self.genomes)))
+
+
+# Karma katta aşağı akışta denenen en iyi bölge bölümlemesi sayısı
+ZONE_ALTERNATIVES = 2
 
 
 def generate_plans(
     building: BuildingInput,
-    room_counts: RoomCountInput,
+    room_counts: RoomCountInput | list[UnitTypeInput],
     codes: BuildingCodes,
     n_alternatives: int = 4,
+    engine: str = "strip",
+    genome_cache: GenomeCache | None = None,
+    seed: int | np.random.SeedSequence | None = None,
+    workers: int = 1,
+    typology: str = "end_core",
+    precheck: bool = True,
+    warm_start: WarmStart | None = None,
 ) -> list[FloorPlan]:
     """
     Ana giriş noktası: 4 alternatif kat planı üret.
@@ -28,34 +112,188 @@ def generate_plans(
     2. Her daire bölgesi için oda yerleşimi üret
     3. Farklı varyantları birleştirerek 4 alternatif oluştur
     4. Duvarları ve doğrulamayı ekle
+
+    room_counts tek bir RoomCountInput (tüm daireler aynı) ya da karma kat
+    için UnitTypeInput listesi olabilir; tipler bölgelere atama problemiyle
+    dağıtılır (assign_unit_types), bölge genişlikleri tiplere göre seçilir.
+    Karma katta en iyi ZONE_ALTERNATIVES bölge bölümlemesinin (uygun
+    olanların) hepsi denenir; alternatifler tüm bölümlemelerin kat
+    seçimlerinden daire skoru ortalamasına göre alınır. Varyantlar
+    (tip, bölge şekli) başına bir kez üretilir; aynı şekilli bölgeler
+    (bölümlemeler arasında da) kaydırılmış kopyaları kullanır.
+
+    typology: bina düzeni stratejisi (LAYOUT_STRATEGIES); "auto" ise
+    tüm tipolojiler evaluate_layout_strategies ile paralel değerlendirilir
+    ve net/brüt verimliliği en yüksek uygun olan seçilir.
+
+    precheck=True ise daireler yerleştirilmeden önce check_feasibility
+    alt sınırları kontrol edilir; girdi uygun değilse boş liste döner
+    (nedenler için check_feasibility raporuna bakılır).
+
+    engine="slicing" ise daireler genetik arama ile yerleştirilir;
+    genome_cache verilirse daireler (ve çağrılar) arasında paylaşılır.
+    seed verilirse sonuç tekrarlanabilir: her daire SeedSequence.spawn ile
+    kendi rastgele akışını alır, bu yüzden workers sayısı çıktıyı değiştirmez.
+
+    warm_start verilirse önceki çağrının varyantları ve genomları yeniden
+    kullanılır (bkz. WarmStart) ve nesne bu çağrının sonuçlarıyla güncellenir.
     """
-    room_types = room_counts.to_room_list()
+    units = as_unit_types(room_counts)
+    counts = resolve_unit_counts(units, building.apartments_per_floor)
+    unit_rooms = [u.rooms.to_room_list() for u in units]
+
+    # 1. Bina düzeni: tipleri eşit bölgelere ata, genişlikleri tiplere göre yeniden seç
+    if typology == "auto":
+        typology = evaluate_layout_strategies(
+            building, codes,
+            unit_room_types=[unit_rooms[t] for t, c in enumerate(counts) for _ in range(c)],
+            workers=max(1, workers),
+        )[0].name
+    zone_types = [0] * building.apartments_per_floor
+    if len(units) > 1:
+        zone_types = assign_unit_types(
+            unit_rooms, counts, compute_building_layout(building, codes, strategy=typology), codes,
+        )
+    zones = compute_building_layout(
+        building, codes,
+        unit_room_types=[unit_rooms[t] for t in zone_types],
+        top_n=ZONE_ALTERNATIVES if len(units) > 1 else 1,
+        strategy=typology,
+    )
+    # Karma katta en iyi birkaç bölge bölümlemesi de aşağı akışta denenir
+    partitions = zones.zone_alternatives or [zones.apartment_zones]
 
-    # 1. Bina düzeni
-    zones = compute_building_layout(building, codes)
+    if precheck:
+        partitions = [
+            part for part in partitions
+            if check_feasibility(
+                building, room_counts, codes,
+                zones=replace(zones, apartment_zones=part), engine=engine,
+                zone_room_types=[unit_rooms[t] for t in zone_types],
+            ).feasible
+        ]
+        if not partitions:
+            return []
 
     # 2. Her daire için varyantlar üret
-    all_apt_variants: list[list] = []  # [daire_idx][varyant_idx]
-    for apt_idx, (zone, side) in enumerate(
-        zip(zones.apartment_zones, zones.apartment_corridor_sides)
-    ):
-        variants = generate_apartment_variants(
+    if engine == "slicing" and genome_cache is None:
+        genome_cache = GenomeCache()
+
+    n_zones = len(zones.apartment_zones)
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    apt_streams = seed_seq.spawn(n_zones)
+
+    n_variants = max(4, n_alternatives * 2)
+    br = zones.building_rect
+
+    def _shape_key(zone: Rect, apt_idx: int) -> tuple:
+        return (
+            engine, n_variants,
+            tuple(rt.value for rt in unit_rooms[zone_types[apt_idx]]),
+            zones.apartment_corridor_sides[apt_idx],
+            round(zone.w, 6), round(zone.h, 6), round(zone.y - br.y, 6),
+            round(min(zone.x - br.x, 1.0), 6), round(min(br.x2 - zone.x2, 1.0), 6),
+            round(min(br.y2 - zone.y2, 1.0), 6),
+            building.north_facing.value,
+        )
+
+    def _variants_for(key: tuple) -> list[ApartmentPlan]:
+        zone, apt_idx = shape_owner[key]
+        side = zones.apartment_corridor_sides[apt_idx]
+        room_types = unit_rooms[zone_types[apt_idx]]
+        if warm_start is not None and key in warm_start.variants:
+            prev_zone, prev_variants = warm_start.variants[key]
+            return [
+                translate_plan(v, zone.x - prev_zone.x, zone.y - prev_zone.y, apt_idx)
+                for v in prev_variants
+            ]
+        if engine == "slicing":
+            rng = np.random.default_rng(apt_streams[apt_idx])
+            seeds = None
+            if warm_start is not None:
+                seeds = warm_start.seeds_for(list(room_types) + [RoomType.KORIDOR_DAIRE], rng)
+            return generate_slicing_variants(
+                zone=zone,
+                room_types=room_types,
+                building_rect=zones.building_rect,
+                corridor_side=side,
+                apartment_id=apt_idx,
+                codes=codes,
+                n_variants=n_variants,
+                cache=genome_cache,
+                rng=rng,
+                seeds=seeds,
+                north_facing=building.north_facing,
+            )
+        return generate_apartment_variants(
             zone=zone,
             room_types=room_types,
             building_rect=zones.building_rect,
             corridor_side=side,
             apartment_id=apt_idx,
             codes=codes,
-            n_variants=max(4, n_alternatives * 2),
+            n_variants=n_variants,
+            north_facing=building.north_facing,
         )
-        all_apt_variants.append(variants)
 
-    # 3. Varyant kombinasyonlarından alternatif planlar oluştur
+    # (tip, bölge şekli) → ilk bölge; diğerleri onun varyantlarını kaydırarak
+    # kullanır (bölümlemeler arasında da)
+    shape_owner: dict[tuple, tuple[Rect, int]] = {}
+    partition_keys = []
+    for part in partitions:
+        keys = [_shape_key(zone, i) for i, zone in enumerate(part)]
+        for i, key in enumerate(keys):
+            shape_owner.setdefault(key, (part[i], i))
+        partition_keys.append(keys)
+    unique = list(shape_owner)
+
+    if workers > 1 and len(unique) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            computed = dict(zip(unique, pool.map(_variants_for, unique)))
+    else:
+        computed = {key: _variants_for(key) for key in unique}
+
+    if warm_start is not None:
+        warm_start.reused = sum(1 for key in unique if key in warm_start.variants)
+        warm_start.seeded = 0 if engine != "slicing" else len(unique) - warm_start.reused
+        warm_start.variants = {key: (shape_owner[key][0], computed[key]) for key in unique}
+        for key in unique:
+            genomes = [v.genome for v in computed[key] if v.genome is not None]
+            if genomes:
+                warm_start.remember_genomes(
+                    list(unit_rooms[zone_types[shape_owner[key][1]]]) + [RoomType.KORIDOR_DAIRE],
+                    genomes,
+                )
+
+    # 3. Her bölümlemede varyant kombinasyonlarından alternatifler; tüm
+    # bölümlemelerin alternatifleri daire skoru ortalamasına göre birleştirilir
+    candidates: list[tuple[float, list[ApartmentPlan]]] = []
+    for part, keys in zip(partitions, partition_keys):
+        # [daire_idx][varyant_idx]
+        all_apt_variants: list[list[ApartmentPlan]] = []
+        for apt_idx, (zone, key) in enumerate(zip(part, keys)):
+            owner_zone, owner = shape_owner[key]
+            if owner_zone is zone:
+                all_apt_variants.append(computed[key])
+                continue
+            dx, dy = zone.x - owner_zone.x, zone.y - owner_zone.y
+            all_apt_variants.append([
+                translate_plan(v, dx, dy, apt_idx) for v in computed[key]
+            ])
+        selection = select_floor_variants(
+            all_apt_variants, part, zones.apartment_corridor_sides, n_alternatives, codes,
+        )
+        for row in selection:
+            chosen = [variants[k] for variants, k in zip(all_apt_variants, row)]
+            score = sum(v.score for v in chosen) / max(1, len(chosen))
+            candidates.append((score, chosen))
+    # Kararlı sıralama: eşit skorda en düşük maliyetli bölümleme önce kalır
+    candidates.sort(key=lambda c: -c[0])
+
     plans: list[FloorPlan] = []
 
-    for alt_idx in range(n_alternatives):
+    for alt_idx, (avg_score, chosen) in enumerate(candidates[:n_alternatives]):
         plan_rooms: list[PlacedRoom] = []
-        total_score = 0.0
 
         # Ortak alanlar
         plan_rooms.append(PlacedRoom(
@@ -81,24 +319,20 @@ def generate_plans(
                 apartment_id=-1,
             ))
 
-        plan_rooms.append(PlacedRoom(
-            room_type=RoomType.KORIDOR_BINA,
-            room_id="koridor_bina_0",
-            rect=zones.corridor_rect,
-            apartment_id=-1,
-        ))
-
-        # Her daire için varyant seç
-        for apt_idx, variants in enumerate(all_apt_variants):
-            v_idx = alt_idx % len(variants)
-            apt_plan = variants[v_idx]
-
-            plan_rooms.extend(apt_plan.rooms)
-            plan_rooms.append(apt_plan.corridor)
-            plan_rooms.append(apt_plan.entry)
-            total_score += apt_plan.score
+        for corr_idx, corr_rect in enumerate([zones.corridor_rect, *zones.extra_corridor_rects]):
+            plan_rooms.append(PlacedRoom(
+                room_type=RoomType.KORIDOR_BINA,
+                room_id=f"koridor_bina_{corr_idx}",
+                rect=corr_rect,
+                apartment_id=-1,
+            ))
 
-        avg_score = total_score / max(1, len(all_apt_variants))
+        # Her daire için seçilen varyant
+        for apt_plan in chosen:
+            # Açıklıklar plan başına yeniden yerleştirilir: alternatifler odaları paylaşmasın
+            plan_rooms.extend(r.model_copy(deep=True) for r in apt_plan.rooms)
+            plan_rooms.append(apt_plan.corridor.model_copy(deep=True))
+            plan_rooms.append(apt_plan.entry.model_copy(deep=True))
 
         # Duvarları oluştur
         walls = _generate_walls(plan_rooms, zones.building_rect, codes)
@@ -110,70 +344,414 @@ def generate_plans(
             walls=walls,
             fitness_score=avg_score,
             apartments_per_floor=building.apartments_per_floor,
+            apartment_units=[units[t].code for t in zone_types[:n_zones]],
         )
+        # Kapı ve pencereler tüm kat için tek geçişte
+        place_openings(plan, codes, north_facing=building.north_facing)
 
         plans.append(plan)
 
     return plans
 
 
-def _generate_walls(
-    rooms: list[PlacedRoom],
+# ── Kat Düzeyinde Varyant Seçimi ─────────────────────────────────────────────
+
+def _facade_signature(plan: ApartmentPlan, zone: Rect, side: str) -> tuple:
+    """Dış cepheye bakan odaların soldan sağa (tip, genişlik) dizisi."""
+    if side == "north":
+        facing = [r for r in plan.rooms if zone.y2 - r.rect.y2 < 0.5]
+    else:
+        facing = [r for r in plan.rooms if r.rect.y - zone.y < 0.5]
+    facing.sort(key=lambda r: r.rect.x)
+    return tuple((r.room_type, round(r.rect.w, 1)) for r in facing)
+
+
+def _wet_edges(plan: ApartmentPlan, zone: Rect, codes: BuildingCodes) -> tuple[list, list]:
+    """Bölgenin sol ve sağ sınırına değen ıslak hacimlerin y aralıkları."""
+    tol = codes.inner_wall + 0.05
+    left, right = [], []
+    for r in plan.rooms:
+        if not codes.is_wet_area(r.room_type):
+            continue
+        if r.rect.x - zone.x < tol:
+            left.append((r.rect.y, r.rect.y2))
+        if zone.x2 - r.rect.x2 < tol:
+            right.append((r.rect.y, r.rect.y2))
+    return left, right
+
+
+def _overlap(a: list, b: list) -> float:
+    return sum(max(0.0, min(a2, b2) - max(a1, b1)) for a1, a2 in a for b1, b2 in b)
+
+
+def select_floor_variants(
+    all_apt_variants: list[list[ApartmentPlan]],
+    apt_zones: list[Rect],
+    apt_sides: list[str],
+    n_alternatives: int,
+    codes: BuildingCodes,
+    wet_weight: float = 0.1,
+    variety_weight: float = 0.05,
+) -> list[list[int]]:
+    """
+    Her alternatif için daire başına varyant indisi seç: [alternatif][daire].
+
+    Her bölge için (alternatif × varyant) atama problemi Macar algoritmasıyla
+    çözülür; böylece alternatifler aynı bölgede farklı varyantlar kullanır
+    (varyant sayısı yetmezse tekrar, artan cezayla). Maliyet:
+      - varyant skoru (−)
+      - koridor boyunca soldaki komşuyla ortak duvardaki ıslak hacim
+        örtüşmesi (tesisat şaftı paylaşımı, −wet_weight × örtüşme / yükseklik)
+      - komşuyla aynı cephe dizisi (+variety_weight)
+    Bölgeler kenar kenar soldan sağa işlendiğinden komşu terimi bir önceki
+    bölgenin seçimine göre doğrusaldır; toplam O(bölge · (alt + varyant)³).
+    Alternatifler son olarak toplam amaca göre iyiden kötüye sıralanır.
+    """
+    n_zones = len(all_apt_variants)
+    selection = [[0] * n_zones for _ in range(n_alternatives)]
+    objective = np.zeros(n_alternatives)
+    if n_zones == 0 or n_alternatives == 0:
+        return selection
+
+    signatures = [
+        [_facade_signature(v, apt_zones[z], apt_sides[z]) for v in variants]
+        for z, variants in enumerate(all_apt_variants)
+    ]
+    wet = [
+        [_wet_edges(v, apt_zones[z], codes) for v in variants]
+        for z, variants in enumerate(all_apt_variants)
+    ]
+
+    order = sorted(range(n_zones), key=lambda z: (apt_sides[z], apt_zones[z].x))
+    prev_zone: int | None = None
+    for z in order:
+        variants = all_apt_variants[z]
+        n_var = len(variants)
+        neighbour = (
+            prev_zone
+            if prev_zone is not None
+            and apt_sides[prev_zone] == apt_sides[z]
+            and abs(apt_zones[prev_zone].x2 - apt_zones[z].x) < 0.01
+            else None
+        )
+        repeats = -(-n_alternatives // n_var)
+        cost = np.empty((n_alternatives, n_var * repeats))
+        for a in range(n_alternatives):
+            for v, plan in enumerate(variants):
+                c = -plan.score
+                if neighbour is not None:
+                    nv = selection[a][neighbour]
+                    shared = _overlap(wet[neighbour][nv][1], wet[z][v][0])
+                    c -= wet_weight * shared / max(apt_zones[z].h, 1e-6)
+                    if signatures[neighbour][nv] == signatures[z][v]:
+                        c += variety_weight
+                for rep in range(repeats):
+                    cost[a, rep * n_var + v] = c + rep * 1.0
+        rows, cols = solve_assignment(cost)
+        for a, col in zip(rows, cols):
+            selection[a][z] = int(col % n_var)
+            objective[a] -= cost[a, col] - (col // n_var) * 1.0
+        prev_zone = z
+
+    ranked = np.argsort(-objective, kind="stable")
+    return [selection[a] for a in ranked]
+
+
+# ── Slicing Tree Genetik Arama ───────────────────────────────────────────────
+
+@dataclass
+class ConvergenceTrace:
+    """Nesil başına arama istatistikleri (ayar için)."""
+    best: list[float] = field(default_factory=list)
+    mean: list[float] = field(default_factory=list)
+    diversity: list[float] = field(default_factory=list)   # Genom entropisi (0-1)
+    stagnation: list[int] = field(default_factory=list)    # İyileşmesiz nesil sayısı
+    restarts: list[int] = field(default_factory=list)      # Yeniden başlatılan nesiller
+    stop_reason: str = ""                                  # "converged" / "max_generations"
+
+    @property
+    def generations(self) -> int:
+        return len(self.best)
+
+
+@dataclass
+class SearchResult:
+    """Genetik arama sonucu: en iyiden kötüye benzersiz bireyler."""
+    genomes: list[SlicingGenome]
+    scores: list[float]
+    rects: list[list[Rect]]
+    evaluations: int = 0                 # Gerçek (önbellek dışı) değerlendirme sayısı
+    cache_stats: dict[str, float] = field(default_factory=dict)
+    trace: ConvergenceTrace = field(default_factory=ConvergenceTrace)
+
+
+def evolve_layout(
+    container: Rect,
+    room_types: list[RoomType],
     building_rect: Rect,
     codes: BuildingCodes,
-) -> list[WallSegment]:
-    """Tüm duvar segmentlerini oluştur."""
-    walls: list[WallSegment] = []
-    ow = codes.outer_wall
+    population_size: int = 24,
+    generations: int = 200,
+    elite: int = 2,
+    mutation_rate: float = 0.2,
+    top_k: int = 4,
+    cache: GenomeCache | None = None,
+    rng: np.random.Generator | int | None = None,
+    tolerance: float = 1e-4,
+    window: int = 10,
+    min_generations: int = 10,
+    max_restarts: int = 1,
+    repair: bool = True,
+    initial: list[SlicingGenome] | None = None,
+    entry: PlacedRoom | None = None,
+    north_facing: CompassDirection | None = None,
+) -> SearchResult:
+    """
+    Konteyner içindeki odaları slicing tree genomları üzerinde evrimleştir.
+
+    Her birey dikdörtgenlere çözülüp evaluate_fitness ile puanlanır.
+    Nicemlenmiş genom anahtarı önbellekte varsa değerlendirme atlanır;
+    anahtarın değeri nicemlenmiş genomdan hesaplandığından sonuç önbellek
+    durumundan bağımsızdır ve aynı rng ile bire bir tekrarlanır.
+
+    Erken durdurma: en iyi skor `window` nesil boyunca `tolerance`'tan fazla
+    iyileşmezse popülasyon elitler dışında yeniden başlatılır (en fazla
+    `max_restarts` kez), sonra arama durur. `generations` yalnızca üst sınırdır;
+    küçük girdiler birkaç nesilde, büyükler iyileştikçe daha uzun çalışır.
+
+    repair=True ise her yeni birey değerlendirmeden önce onarılır
+    (repair_population): kesimler, her yaprak PAİY minimumlarını
+    karşılayacak şekilde itilir, böylece arama uygun bireyler üzerinde yürür.
+
+    initial verilirse (warm start) popülasyonun ilk satırları bu genomlarla
+    (n_rooms eşleşmeli, bkz. adapt_genome) doldurulur, kalanı rastgele.
+
+    entry (antre) verilirse erişilebilirlik sert kısıttır: kapı grafiğinde
+    antreden ulaşılamayan her oda skordan 1 düşer (count_unreachable).
+    Fitness 0-1 aralığında olduğundan tüm odaları erişilebilir her birey,
+    erişilemeyen odası olan her bireyin önünde sıralanır.
+
+    north_facing verilirse yönlenme skoru önbellekte olmayan tüm bireyler
+    için tek vektörel çağrıyla (orientation_scores) hesaplanıp
+    evaluate_fitness'a hazır verilir.
+    """
+    n = len(room_types)
+    if cache is None:
+        cache = GenomeCache()
+    rng = np.random.default_rng(rng)
+    # Önbelleklenen skor bina dikdörtgenine (dış cephe teması, yönlenme) ve
+    # yönetmeliğe (minimumlar) bağlıdır: paylaşılan önbellekte ikisi de anahtarda
+    context = tuple(rt.value for rt in room_types) + (
+        ("bina", round(building_rect.x, 2), round(building_rect.y, 2),
+         round(building_rect.w, 2), round(building_rect.h, 2)),
+        ("yonetmelik", codes.fingerprint),
+    )
+    if entry is not None:
+        # Ceza skora girdiğinden önbellek anahtarı antre konumunu da içerir
+        entry = entry.model_copy(update={"apartment_id": 0})
+        context += (("antre", round(entry.rect.x, 2), round(entry.rect.y, 2),
+                     round(entry.rect.w, 2), round(entry.rect.h, 2)),)
+    if north_facing is not None:
+        context += (("yon", north_facing.value),)
+    target_areas = compute_room_target_areas(room_types, container.area, codes)
+    type_idx = np.array([ROOM_TYPE_INDEX[rt] for rt in room_types])
+    evaluations = 0
+
+    def _evaluate(buf: PopulationBuffers) -> np.ndarray:
+        nonlocal evaluations
+        scores = np.empty(buf.size)
+        misses: dict[tuple, list] = {}
+        keys = population_keys(buf, container, context)
+        for i, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is not None:
+                scores[i] = cached[0]
+            elif key not in misses:
+                misses[key] = genome_from_key(key, container).to_rects(container)
+
+        if misses:
+            orientation = [None] * len(misses)
+            if north_facing is not None:
+                bounds = np.array([
+                    [(r.x, r.y, r.x2, r.y2) for r in rects] for rects in misses.values()
+                ])
+                facades = facade_contact(bounds, building_rect)
+                orientation = orientation_scores(facades, type_idx, north_facing).tolist()
+            computed = {}
+            for (key, rects), orient in zip(misses.items(), orientation):
+                rooms = _rooms_from_rects(room_types, rects, codes)
+                score = evaluate_fitness(
+                    rooms, building_rect, target_areas, codes, orientation=orient,
+                )
+                if entry is not None:
+                    score -= count_unreachable(rooms + [entry])
+                evaluations += 1
+                cache.put(key, score, rects)
+                computed[key] = score
+            for i, key in enumerate(keys):
+                if key in computed:
+                    scores[i] = computed[key]
+        return scores
+
+    # Çift tampon: ebeveynler ve yavrular nesiller boyunca yeniden kullanılır
+    population = PopulationBuffers.empty(population_size, n)
+    offspring = PopulationBuffers.empty(population_size, n)
+    randomize_population(population, rng)
+    for i, genome in enumerate((initial or [])[:population_size]):
+        population.set_genome(i, genome)
+    elite = min(elite, population_size)
+    children = slice(elite, population_size)
+    n_children = population_size - elite
+
+    min_w, min_a = room_minimums(room_types, codes)
+
+    def _repair(buf: PopulationBuffers, rows: slice = slice(None)) -> None:
+        if repair:
+            repair_population(buf, container, min_w, min_a, codes.inner_wall, rows)
+
+    _repair(population)
+
+    trace = ConvergenceTrace()
+    best_so_far = -np.inf
+    stagnation = 0
+
+    while True:
+        scores = _evaluate(population)
+        order = np.argsort(-scores, kind="stable")
+        best = float(scores[order[0]])
+        if best > best_so_far + tolerance:
+            stagnation = 0
+        else:
+            stagnation += 1
+        best_so_far = max(best_so_far, best)
+
+        trace.best.append(best)
+        trace.mean.append(float(scores.mean()))
+        trace.diversity.append(population_entropy(population))
+        trace.stagnation.append(stagnation)
+
+        if trace.generations >= generations:
+            trace.stop_reason = "max_generations"
+            break
+        if trace.generations >= min_generations and stagnation >= window:
+            if len(trace.restarts) >= max_restarts:
+                trace.stop_reason = "converged"
+                break
+            # Yeniden başlat: elitleri koru, kalanları rastgele üret
+            trace.restarts.append(trace.generations)
+            offspring.copy_rows(population, order[:elite], slice(0, elite))
+            randomize_population(offspring, rng, rows=children)
+            _repair(offspring, children)
+            population, offspring = offspring, population
+            stagnation = 0
+            continue
+
+        offspring.copy_rows(population, order[:elite], slice(0, elite))
+        idx_a = _tournament(scores, n_children, rng)
+        idx_b = _tournament(scores, n_children, rng)
+        crossover_population(population, idx_a, idx_b, offspring, rng, rows=children)
+        mutate_population(offspring, rng, mutation_rate, rows=children)
+        _repair(offspring, children)
+        population, offspring = offspring, population
+
+    # Son popülasyondan benzersiz en iyi bireyler
+    keys = population_keys(population, container, context)
+    seen: set[tuple] = set()
+    result = SearchResult(genomes=[], scores=[], rects=[], trace=trace)
+    for i in np.argsort(-scores, kind="stable"):
+        if keys[i] in seen:
+            continue
+        seen.add(keys[i])
+        genome = genome_from_key(keys[i], container)
+        result.genomes.append(genome)
+        result.scores.append(float(scores[i]))
+        result.rects.append(genome.to_rects(container))
+        if len(result.genomes) >= top_k:
+            break
+
+    result.evaluations = evaluations
+    result.cache_stats = cache.stats()
+    return result
+
+
+def _tournament(
+    scores: np.ndarray,
+    n_winners: int,
+    rng: np.random.Generator,
+    size: int = 3,
+) -> np.ndarray:
+    """Vektörel turnuva seçimi: her kazanan rastgele `size` bireyin en iyisi."""
+    contenders = rng.integers(0, len(scores), size=(n_winners, size))
+    best = np.argmax(scores[contenders], axis=1)
+    return contenders[np.arange(n_winners), best]
+
+
+def _rooms_from_rects(
+    room_types: list[RoomType],
+    rects: list[Rect] | tuple[Rect, ...],
+    codes: BuildingCodes,
+    apartment_id: int = 0,
+) -> list[PlacedRoom]:
+    """Çözülmüş dikdörtgenleri (net alanlı) PlacedRoom listesine çevir."""
     iw = codes.inner_wall
+    counter: dict[RoomType, int] = {}
+    rooms = []
+    for rt, rect in zip(room_types, rects):
+        idx = counter.get(rt, 0)
+        counter[rt] = idx + 1
+        rooms.append(PlacedRoom(
+            room_type=rt,
+            room_id=f"{rt.value}_{idx}",
+            rect=rect,
+            apartment_id=apartment_id,
+            net_area=round(max(0, (rect.w - iw) * (rect.h - iw)), 1),
+        ))
+    return rooms
 
-    # Dış duvarlar
-    bx, by = building_rect.x, building_rect.y
-    bx2, by2 = building_rect.x2, building_rect.y2
 
-    walls.append(WallSegment(start=Point(x=bx, y=by), end=Point(x=bx2, y=by), thickness=ow, is_exterior=True))
-    walls.append(WallSegment(start=Point(x=bx, y=by2), end=Point(x=bx2, y=by2), thickness=ow, is_exterior=True))
-    walls.append(WallSegment(start=Point(x=bx, y=by), end=Point(x=bx, y=by2), thickness=ow, is_exterior=True))
-    walls.append(WallSegment(start=Point(x=bx2, y=by), end=Point(x=bx2, y=by2), thickness=ow, is_exterior=True))
+def generate_slicing_variants(
+    zone: Rect,
+    room_types: list[RoomType],
+    building_rect: Rect,
+    corridor_side: str,
+    apartment_id: int,
+    codes: BuildingCodes,
+    n_variants: int = 8,
+    cache: GenomeCache | None = None,
+    rng: np.random.Generator | int | None = None,
+    seeds: list[SlicingGenome] | None = None,
+    north_facing: CompassDirection | None = None,
+) -> list[ApartmentPlan]:
+    """
+    Daire varyantlarını slicing tree genetik aramasıyla üret.
+    Antre giriş tarafına sabitlenir; daire koridoru kalan blokta bir yaprak olur.
 
-    # İç duvarlar: odalar arası paylaşılan kenarlar
-    processed = set()
-    for i, ra in enumerate(rooms):
-        for j, rb in enumerate(rooms):
-            if i >= j:
-                continue
-            key = (min(ra.room_id, rb.room_id), max(ra.room_id, rb.room_id))
-            if key in processed:
-                continue
+    seeds (önceki aramanın genomları, KORIDOR_DAIRE dahil) verilirse arama
+    onlardan başlar ve yeniden başlatma yapılmaz: tohumlar zaten yakınsamış
+    bir popülasyondan geldiği için durgunluk penceresi dolunca biter.
+    """
+    entry, block = make_entry(zone, corridor_side, apartment_id, codes)
+    search_types = list(room_types) + [RoomType.KORIDOR_DAIRE]
 
-            shared = ra.rect.shared_edge_length(rb.rect, tol=0.05)
-            if shared < 0.1:
-                continue
+    result = evolve_layout(
+        block, search_types, building_rect, codes,
+        top_k=n_variants, cache=cache, rng=rng,
+        initial=seeds, max_restarts=0 if seeds else 1, entry=entry,
+        north_facing=north_facing,
+    )
 
-            processed.add(key)
-            wall = _find_shared_wall(ra.rect, rb.rect, iw)
-            if wall:
-                walls.append(wall)
-
-    return walls
-
-
-def _find_shared_wall(a: Rect, b: Rect, thickness: float) -> WallSegment | None:
-    tol = 0.05
-    if abs(a.x2 - b.x) < tol:
-        ys, ye = max(a.y, b.y), min(a.y2, b.y2)
-        if ye > ys:
-            return WallSegment(start=Point(x=a.x2, y=ys), end=Point(x=a.x2, y=ye), thickness=thickness)
-    if abs(b.x2 - a.x) < tol:
-        ys, ye = max(a.y, b.y), min(a.y2, b.y2)
-        if ye > ys:
-            return WallSegment(start=Point(x=a.x, y=ys), end=Point(x=a.x, y=ye), thickness=thickness)
-    if abs(a.y2 - b.y) < tol:
-        xs, xe = max(a.x, b.x), min(a.x2, b.x2)
-        if xe > xs:
-            return WallSegment(start=Point(x=xs, y=a.y2), end=Point(x=xe, y=a.y2), thickness=thickness)
-    if abs(b.y2 - a.y) < tol:
-        xs, xe = max(a.x, b.x), min(a.x2, b.x2)
-        if xe > xs:
-            return WallSegment(start=Point(x=xs, y=a.y), end=Point(x=xe, y=a.y), thickness=thickness)
-    return None
+    variants = []
+    for score, rects, genome in zip(result.scores, result.rects, result.genomes):
+        placed = _rooms_from_rects(search_types, rects, codes, apartment_id)
+        corridor = placed.pop()
+        corridor.room_id = f"koridor_daire_{apartment_id}"
+        corridor.net_area = None
+        variants.append(ApartmentPlan(
+            rooms=placed,
+            corridor=corridor,
+            entry=entry.model_copy(deep=True),
+            score=max(0.0, score),
+            search_trace=result.trace,
+            genome=genome,
+        ))
+    return variants
@@ -62,6 +62,9 @@ class BuildingInput(BaseModel):
     num_floors: int = Field(default=1, ge=1)
     has_elevator: bool = Field(default=True)
     apartments_per_floor: int = Field(default=2, ge=1, le=10)
+    column_grid: Optional[float] = Field(
+        default=None, gt=0, description="Kolon aks aralığı (metre); daire sınırları akslara oturur",
+    )
 
     @property
     def width(self) -> float:
@@ -99,6 +102,25 @@ class RoomCountInput(BaseModel):
         return rooms
 
 
+class UnitTypeInput(BaseModel):
+    """
+    Kattaki bir daire tipi (ör. 2×3+1 + 4×2+1 karışımı için iki tip).
+    count verilirse o kadar daire; yoksa share (0-1) ile kalan daireler
+    paylaştırılır. İkisi de yoksa kalan daireler eşit paylaşılır.
+    """
+    rooms: RoomCountInput = Field(default_factory=RoomCountInput)
+    label: str = ""
+    count: Optional[int] = Field(default=None, ge=0)
+    share: Optional[float] = Field(default=None, gt=0, le=1)
+
+    @property
+    def code(self) -> str:
+        """Türk usulü daire tipi: (oda sayısı)+(salon sayısı), ör. 3+1."""
+        if self.label:
+            return self.label
+        return f"{self.rooms.yatak_odasi + self.rooms.oda}+{self.rooms.salon}"
+
+
 class UserInput(BaseModel):
     building: BuildingInput
     rooms: RoomCountInput
@@ -226,6 +248,7 @@ class FloorPlan(BaseModel):
     rooms: list[PlacedRoom] = Field(default_factory=list)
     walls: list[WallSegment] = Field(default_factory=list)
     apartments_per_floor: int = 1
+    apartment_units: list[str] = Field(default_factory=list)  # Daire tipi kodu (apartment_id sırasıyla)
 
     @property
     def total_room_area(self) -> float:
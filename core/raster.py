@@ -0,0 +1,432 @@
+"""
+Raster analiz: planı NumPy ızgarasına (5-10 cm hücre) çizip dizi
+indirgemeleriyle ölçer.
+
+Doluluk (occupancy): odaların tam dikdörtgenleri int16 ızgaraya yazılır;
+çakışma, atanmamış boşluk, daire başına kaplama ve net alan ikili
+dikdörtgen hesabı yerine bincount / maske indirgemeleriyle bulunur.
+Maliyet oda sayısından çok ızgara boyutuna bağlıdır (plan başına ~sabit).
+
+Oda etiketleri int16 ızgaraya yazılır (oda indisi, -1 = duvar/boşluk).
+Duvarlar, her odanın iç duvar kalınlığının yarısı kadar daraltılmasıyla
+engel olarak kalır; kapılar ve kapısız dolaşım geçişleri (bkz.
+corridor.door_adjacency) bu engeli delen açıklıklardır.
+
+Kaçış mesafesi: merdiven hücrelerinden çok kaynaklı chamfer (5-7) dalga
+cephesi, daire giriş kapısına (antre) kadar ölçülür; her adımda yalnızca cephe hücreleri işlenir (Dial kovaları).
+Çapraz adım 7/5 = 1.40 (gerçek √2'ye göre %1 hata), duvar köşesinden
+çapraz geçiş yoktur.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .models import Rect, RoomType, PlacedRoom, FloorPlan
+from .building_codes import BuildingCodes
+from .corridor import door_adjacency, shared_edge_matrix, _door_target, CIRCULATION, CORE, WALL_GAP
+
+DEFAULT_CELL = 0.10
+
+# Chamfer ağırlıkları: dik adım 5, çapraz adım 7 (birim = cell / 5)
+_ORTHO = 5
+_DIAG = 7
+
+
+@dataclass
+class PlanRaster:
+    """Planın ızgara karşılığı; hücre (r, c) merkezi (x0 + (c+½)·cell, y0 + (r+½)·cell)."""
+    labels: np.ndarray       # (H, W) int16 oda indisi, -1 = duvar/boşluk
+    walkable: np.ndarray     # (H, W) bool: oda içi + kapı/geçiş açıklıkları
+    x0: float
+    y0: float
+    cell: float
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.labels.shape
+
+    @property
+    def extent(self) -> tuple[float, float, float, float]:
+        """matplotlib imshow(origin="lower") için (x0, x1, y0, y1)."""
+        h, w = self.labels.shape
+        return (self.x0, self.x0 + w * self.cell, self.y0, self.y0 + h * self.cell)
+
+    def _span(self, lo: float, hi: float, origin: float, n: int) -> slice:
+        """Merkezi [lo, hi) aralığında kalan hücreler (bitişik odalar hücre paylaşmaz)."""
+        a = int(np.ceil(round((lo - origin) / self.cell - 0.5, 6)))
+        b = int(np.ceil(round((hi - origin) / self.cell - 0.5, 6)))
+        return slice(max(a, 0), min(max(b, 0), n))
+
+    def cells(self, x: float, y: float, x2: float, y2: float) -> tuple[slice, slice]:
+        """Dikdörtgenin (satır, sütun) dilimleri."""
+        h, w = self.labels.shape
+        return self._span(y, y2, self.y0, h), self._span(x, x2, self.x0, w)
+
+
+def rasterize(plan: FloorPlan, codes: BuildingCodes, cell: float = DEFAULT_CELL) -> PlanRaster:
+    """
+    Planı ızgaraya çiz: odalar iç duvarın yarısı kadar daraltılarak etiketlenir,
+    sonra kapı grafiğindeki her kenar için açıklık açılır.
+    """
+    raster = _empty_raster(plan, cell)
+    # Duvar en az bir hücre kalınlığında kalsın (dokunan odalar arasında ≥ 1.5 hücre)
+    half = _wall_inset(codes, cell)
+    _paint(raster, raster.labels, plan.rooms, -half)
+    raster.walkable[:] = raster.labels >= 0
+
+    for x, y, x2, y2 in _openings(plan.rooms, codes, half):
+        raster.walkable[raster.cells(x, y, x2, y2)] = True
+    return raster
+
+
+def _empty_raster(plan: FloorPlan, cell: float) -> PlanRaster:
+    br = plan.building_rect
+    w = int(np.ceil(br.w / cell))
+    h = int(np.ceil(br.h / cell))
+    return PlanRaster(
+        labels=np.full((h, w), -1, dtype=np.int16),
+        walkable=np.zeros((h, w), dtype=bool),
+        x0=br.x, y0=br.y, cell=cell,
+    )
+
+
+def _wall_inset(codes: BuildingCodes, cell: float) -> float:
+    return max(codes.inner_wall / 2, 0.75 * cell)
+
+
+def _paint(raster: PlanRaster, grid: np.ndarray, rooms: list[PlacedRoom], grow: float, values=None) -> None:
+    """Oda dikdörtgenlerini (grow kadar büyütülmüş/daraltılmış) grid'e yaz; sonraki öncekini ezer."""
+    for i, room in enumerate(rooms):
+        r = room.rect
+        grid[raster.cells(r.x - grow, r.y - grow, r.x2 + grow, r.y2 + grow)] = i if values is None else values[i]
+
+
+def _openings(
+    rooms: list[PlacedRoom], codes: BuildingCodes, half: float,
+) -> list[tuple[float, float, float, float]]:
+    """
+    Kapı grafiği kenarlarının duvar açıklıkları (x, y, x2, y2).
+    Kapı: kapı genişliğinde; dolaşım ↔ dolaşım / çekirdek: paylaşılan kenarın
+    tamamı; kapısız oda ↔ dolaşım: paylaşılan kenarın ortasında kapı genişliği.
+    Açıklık, komşu duvarları delmemesi için daraltılmış oda sınırlarına kırpılır.
+    """
+    if not rooms:
+        return []
+    adj = door_adjacency(rooms)
+    shared = shared_edge_matrix(rooms)
+    open_types = CIRCULATION + CORE
+    depth = WALL_GAP + half
+
+    openings = []
+    for i, j in np.argwhere(np.triu(adj, 1)).tolist():
+        a, b = rooms[i], rooms[j]
+        span = _shared_span(a.rect, b.rect)
+        if span is None:
+            continue
+        axis, edge, span_lo, span_hi = span
+        lo, hi = span_lo, span_hi
+
+        door = _door_between(a, b, rooms, i, j, shared)
+        if door is not None:
+            lo, hi = door.position - door.width / 2, door.position + door.width / 2
+        elif not (a.room_type in open_types and b.room_type in open_types):
+            room = a if a.room_type not in open_types else b
+            mid, half_w = (lo + hi) / 2, codes.door_width(room.room_type) / 2
+            lo, hi = mid - half_w, mid + half_w
+        lo, hi = max(lo, span_lo + half), min(hi, span_hi - half)
+        if hi <= lo:
+            continue
+
+        if axis == "x":       # Dikey duvar (x = edge), açıklık y boyunca
+            openings.append((edge - depth, lo, edge + depth, hi))
+        else:                 # Yatay duvar (y = edge), açıklık x boyunca
+            openings.append((lo, edge - depth, hi, edge + depth))
+    return openings
+
+
+def _shared_span(a: Rect, b: Rect) -> tuple[str, float, float, float] | None:
+    """Komşu iki odanın ortak duvarı: (eksen, duvar ortası, aralık başı, sonu)."""
+    for a1, a2, b1, b2, lo, hi, axis in (
+        (a.x2, a.x, b.x, b.x2, max(a.y, b.y), min(a.y2, b.y2), "x"),
+        (a.y2, a.y, b.y, b.y2, max(a.x, b.x), min(a.x2, b.x2), "y"),
+    ):
+        if hi <= lo:
+            continue
+        if abs(b1 - a1) < WALL_GAP:
+            return axis, (a1 + b1) / 2, lo, hi
+        if abs(a2 - b2) < WALL_GAP:
+            return axis, (a2 + b2) / 2, lo, hi
+    return None
+
+
+def _door_between(a: PlacedRoom, b: PlacedRoom, rooms: list[PlacedRoom], i: int, j: int, shared: np.ndarray):
+    """a ile b arasındaki kapı (varsa)."""
+    for room, k, other in ((a, i, j), (b, j, i)):
+        candidates = np.array([other]) if shared[k, other] > 0 else np.zeros(0, dtype=np.int64)
+        for door in room.doors:
+            if _door_target(room, door, rooms, candidates, WALL_GAP) == other:
+                return door
+    return None
+
+
+# ── Kaçış Mesafesi ───────────────────────────────────────────────────────────
+
+def geodesic_distance(
+    walkable: np.ndarray,
+    sources: np.ndarray,
+    cell: float,
+    targets: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Kaynak hücrelerden yürünebilir hücreler üzerinden chamfer (5-7) mesafesi (m).
+    Ulaşılamayan ve engel hücreler inf.
+
+    targets (H, W) grup etiketleri (-1 = hedef değil) verilirse her gruptan
+    bir hücre kesinleştiğinde dalga durur: grup başına en kısa mesafe
+    doğrudur, daha uzak hücreler inf kalabilir.
+    """
+    h, w = walkable.shape
+    # Kenar kontrolü gerekmesin diye bir hücrelik engel çerçevesi
+    free = np.zeros((h + 2, w + 2), dtype=bool)
+    free[1:-1, 1:-1] = walkable
+    free = free.ravel()
+    stride = w + 2
+    steps = (
+        (1, _ORTHO, 0, 0), (-1, _ORTHO, 0, 0),
+        (stride, _ORTHO, 0, 0), (-stride, _ORTHO, 0, 0),
+        # Çapraz: iki dik komşu da serbest olmalı (köşeden geçiş yok)
+        (stride + 1, _DIAG, stride, 1), (stride - 1, _DIAG, stride, -1),
+        (-stride + 1, _DIAG, -stride, 1), (-stride - 1, _DIAG, -stride, -1),
+    )
+
+    padded = np.zeros((h + 2, w + 2), dtype=bool)
+    padded[1:-1, 1:-1] = sources & walkable
+    start = np.flatnonzero(padded)
+
+    unreached = np.iinfo(np.int64).max
+    dist = np.full(free.size, unreached, dtype=np.int64)
+    dist[start] = 0
+    group = None
+    if targets is not None:
+        group = np.full((h + 2, w + 2), -1, dtype=np.int64)
+        group[1:-1, 1:-1] = np.where(walkable, targets, -1)
+        group = group.ravel()
+        pending = set(np.unique(group[group >= 0]).tolist())
+    buckets: dict[int, list[np.ndarray]] = {0: [start]}
+    level = 0
+    while buckets:
+        parts = buckets.pop(level, None)
+        if parts is not None:
+            idx = np.unique(np.concatenate(parts))
+            idx = idx[dist[idx] == level]       # Daha kısa yolla güncellenmişleri at
+            if group is not None:
+                pending -= set(group[idx].tolist())
+                if not pending:
+                    break
+            for offset, cost, side_a, side_b in steps:
+                nb = idx + offset
+                ok = free[nb] & (dist[nb] > level + cost)
+                if side_a:
+                    ok &= free[idx + side_a] & free[idx + side_b]
+                nb = nb[ok]
+                if nb.size:
+                    dist[nb] = level + cost
+                    buckets.setdefault(level + cost, []).append(nb)
+        level += 1
+
+    out = np.where(dist == unreached, np.inf, dist * (cell / _ORTHO))
+    return out.reshape(h + 2, w + 2)[1:-1, 1:-1]
+
+
+@dataclass
+class EgressResult:
+    """Merdivene yürüme mesafesi haritası ve daire başına giriş mesafesi."""
+    distance: np.ndarray             # (H, W) m; engel / ulaşılamaz = inf
+    raster: PlanRaster
+    per_apartment: dict[int, float]  # apartment_id → daire girişinden (antre) merdivene (m)
+    limit: float                     # Yönetmelik üst sınırı (m)
+    farthest: dict[int, float] = field(default_factory=dict)  # Daire içi en uzak hücre (full_map)
+
+    @property
+    def max_distance(self) -> float:
+        return max(self.per_apartment.values(), default=0.0)
+
+    @property
+    def violations(self) -> list[int]:
+        """Girişi sınırı aşan (veya merdivene ulaşamayan) daireler."""
+        return [apt for apt, d in self.per_apartment.items() if d > self.limit]
+
+    @property
+    def heatmap(self) -> np.ndarray:
+        """Çizim katmanı: yürünemeyen / ulaşılamayan hücreler NaN."""
+        return np.where(np.isfinite(self.distance), self.distance, np.nan)
+
+
+def compute_egress(
+    plan: FloorPlan,
+    codes: BuildingCodes,
+    cell: float = DEFAULT_CELL,
+    full_map: bool = True,
+) -> EgressResult:
+    """
+    Merdiven evinden (MERDIVEN) yürüme mesafesi.
+
+    Konut kaçış mesafesi daire giriş kapısında başlar: daire başına değer,
+    antre hücrelerinin (giriş kapısının hemen içi) en yakınının mesafesidir;
+    antresi olmayan dairede dairenin en yakın hücresi. full_map=False ise
+    dalga yalnızca ortak alanlar ve antreler üzerinde yürür ve son daire
+    girişine varınca durur (doğrulama için hızlı yol; ısı haritası kısmi,
+    farthest boş kalır).
+    """
+    raster = rasterize(plan, codes, cell)
+    rooms = plan.rooms
+    stair_ids = [i for i, r in enumerate(rooms) if r.room_type == RoomType.MERDIVEN]
+    sources = np.isin(raster.labels, stair_ids)
+
+    apt_of = np.array([r.apartment_id for r in rooms] + [-1])
+    cell_apt = apt_of[raster.labels]          # -1 etiketi son elemana (-1) düşer
+    apartments = sorted({r.apartment_id for r in rooms if r.apartment_id >= 0})
+    with_entry = {r.apartment_id for r in rooms if r.room_type == RoomType.ANTRE}
+    entry_ids = [
+        i for i, r in enumerate(rooms)
+        if r.room_type == RoomType.ANTRE or (r.apartment_id >= 0 and r.apartment_id not in with_entry)
+    ]
+    entry_cells = np.isin(raster.labels, entry_ids)
+
+    walkable = raster.walkable
+    targets = None
+    if not full_map:
+        walkable = walkable & ((cell_apt < 0) | entry_cells)
+        targets = np.where(entry_cells, cell_apt, -1)
+    distance = geodesic_distance(walkable, sources, cell, targets)
+
+    per_apartment = {}
+    farthest = {}
+    for apt in apartments:
+        d = distance[entry_cells & (cell_apt == apt)]
+        per_apartment[apt] = float(d.min()) if d.size else 0.0
+        if full_map:
+            d = distance[cell_apt == apt]
+            farthest[apt] = float(d.max()) if d.size else 0.0
+    return EgressResult(
+        distance=distance,
+        raster=raster,
+        per_apartment=per_apartment,
+        limit=codes.max_escape_distance,
+        farthest=farthest,
+    )
+
+
+# ── Doluluk (Occupancy) ──────────────────────────────────────────────────────
+
+# Bu alandan küçük atanmamış boşluklar raporlanmaz (m²)
+MIN_GAP_AREA = 0.5
+
+
+@dataclass
+class Occupancy:
+    """Oda doluluk ızgarası ve ondan türetilen alan ölçüleri."""
+    raster: PlanRaster         # labels: tam oda dikdörtgenleri (-1 = atanmamış)
+    count: np.ndarray          # (H, W) int16: hücreyi kaplayan oda sayısı
+    gap: np.ndarray            # (H, W) bool: duvar kalınlığından geniş atanmamış alan
+    zone: np.ndarray           # (H, W) int16: hücrenin dairesi (oda kapsayan kutu), -1 = ortak
+    net_labels: np.ndarray     # (H, W) int16: iç duvarın yarısı düşülmüş oda etiketleri
+    apartment_of: np.ndarray   # (n_rooms,) oda → apartment_id
+
+    @property
+    def cell_area(self) -> float:
+        return self.raster.cell ** 2
+
+    @property
+    def overlap(self) -> np.ndarray:
+        return self.count > 1
+
+    @property
+    def overlap_area(self) -> float:
+        return float(self.overlap.sum()) * self.cell_area
+
+    @property
+    def gap_area(self) -> float:
+        return float(self.gap.sum()) * self.cell_area
+
+    def _per_apartment(self, values: np.ndarray) -> dict[int, float]:
+        """Daire indisli bincount sonucunu {apartment_id: değer} sözlüğüne çevir (-1 hariç)."""
+        apts = np.unique(self.apartment_of[self.apartment_of >= 0])
+        return {int(a): float(values[a + 1]) if a + 1 < len(values) else 0.0 for a in apts}
+
+    def _bincount_apartments(self, apt_grid: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        n_apts = int(self.apartment_of.max(initial=-1)) + 2
+        return np.bincount(apt_grid[mask].astype(np.int64) + 1, minlength=n_apts)
+
+    @property
+    def gap_by_apartment(self) -> dict[int, float]:
+        """Daire kutusu içindeki atanmamış boşluk (m²); -1 anahtarı ortak alan."""
+        counts = self._bincount_apartments(self.zone, self.gap) * self.cell_area
+        result = self._per_apartment(counts)
+        result[-1] = float(counts[0])
+        return result
+
+    @property
+    def coverage(self) -> dict[int, float]:
+        """Daire kutusunun odalar + duvarlarla kaplanan oranı (1 = boşluksuz)."""
+        inside = self._bincount_apartments(self.zone, self.zone >= 0)
+        gaps = self._bincount_apartments(self.zone, self.gap)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = np.where(inside > 0, 1.0 - gaps / np.maximum(inside, 1), 0.0)
+        return self._per_apartment(ratio)
+
+    @property
+    def net_area(self) -> dict[int, float]:
+        """Daire başına net alan (m², iç duvar yarıları düşülmüş, çakışma bir kez sayılır)."""
+        labelled = self.net_labels >= 0
+        apt_grid = np.where(labelled, self.apartment_of[self.net_labels], -1)
+        counts = self._bincount_apartments(apt_grid, labelled) * self.cell_area
+        return self._per_apartment(counts)
+
+    @property
+    def room_net_area(self) -> np.ndarray:
+        """Oda başına net alan (m²); üst üste binen odalarda sonra çizilen sayılır."""
+        labelled = self.net_labels[self.net_labels >= 0].astype(np.int64)
+        return np.bincount(labelled, minlength=len(self.apartment_of)) * self.cell_area
+
+
+def compute_occupancy(plan: FloorPlan, codes: BuildingCodes, cell: float = DEFAULT_CELL) -> Occupancy:
+    """
+    Planın doluluk ızgarası. Boşluk: dış duvar içinde kalıp hiçbir odanın
+    duvar payı kadar (WALL_GAP / 2) büyütülmüş dikdörtgenine girmeyen hücreler;
+    odalar arasındaki iç duvar aralıkları böylece boşluk sayılmaz.
+    """
+    raster = _empty_raster(plan, cell)
+    rooms = plan.rooms
+    _paint(raster, raster.labels, rooms, 0.0)
+
+    count = np.zeros(raster.shape, dtype=np.int16)
+    for room in rooms:
+        r = room.rect
+        count[raster.cells(r.x, r.y, r.x2, r.y2)] += 1
+
+    covered = np.full(raster.shape, -1, dtype=np.int16)
+    _paint(raster, covered, rooms, WALL_GAP / 2)
+    interior = np.zeros(raster.shape, dtype=bool)
+    br, ow = plan.building_rect, codes.outer_wall
+    interior[raster.cells(br.x + ow, br.y + ow, br.x2 - ow, br.y2 - ow)] = True
+    gap = interior & (covered < 0)
+
+    apartment_of = np.array([r.apartment_id for r in rooms], dtype=np.int64)
+    zone = np.full(raster.shape, -1, dtype=np.int16)
+    for apt in np.unique(apartment_of[apartment_of >= 0]).tolist():
+        members = [r.rect for r in rooms if r.apartment_id == apt]
+        x, y = min(m.x for m in members), min(m.y for m in members)
+        x2, y2 = max(m.x2 for m in members), max(m.y2 for m in members)
+        zone[raster.cells(x, y, x2, y2)] = apt
+
+    net_labels = np.full(raster.shape, -1, dtype=np.int16)
+    _paint(raster, net_labels, rooms, -_wall_inset(codes, cell))
+
+    return Occupancy(
+        raster=raster, count=count, gap=gap, zone=zone,
+        net_labels=net_labels, apartment_of=apartment_of,
+    )
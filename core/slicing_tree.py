@@ -12,11 +12,15 @@ Genom temsili:
 
 from __future__ import annotations
 
-import random
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from .models import Rect
+from .building_codes import BuildingCodes
 
 
 @dataclass
@@ -165,19 +169,29 @@ class SlicingGenome:
         return rects
 
 
-def random_genome(n_rooms: int) -> SlicingGenome:
+def _as_rng(rng: np.random.Generator | None) -> np.random.Generator:
+    return rng if rng is not None else np.random.default_rng()
+
+
+def random_genome(n_rooms: int, rng: np.random.Generator | None = None) -> SlicingGenome:
     """Rastgele bir genom üret."""
+    rng = _as_rng(rng)
     n_cuts = max(0, n_rooms - 1)
     return SlicingGenome(
         n_rooms=n_rooms,
-        orientations=[random.randint(0, 1) for _ in range(n_cuts)],
-        ratios=[random.uniform(0.25, 0.75) for _ in range(n_cuts)],
-        room_order=random.sample(range(n_rooms), n_rooms),
+        orientations=rng.integers(0, 2, size=n_cuts).tolist(),
+        ratios=rng.uniform(0.25, 0.75, size=n_cuts).tolist(),
+        room_order=rng.permutation(n_rooms).tolist(),
     )
 
 
-def mutate_genome(genome: SlicingGenome, mutation_rate: float = 0.2) -> SlicingGenome:
+def mutate_genome(
+    genome: SlicingGenome,
+    mutation_rate: float = 0.2,
+    rng: np.random.Generator | None = None,
+) -> SlicingGenome:
     """Genomda küçük değişiklikler yap."""
+    rng = _as_rng(rng)
     n_cuts = max(0, genome.n_rooms - 1)
 
     new_orientations = list(genome.orientations)
@@ -185,14 +199,14 @@ def mutate_genome(genome: SlicingGenome, mutation_rate: float = 0.2) -> SlicingG
     new_order = list(genome.room_order)
 
     for i in range(n_cuts):
-        if random.random() < mutation_rate:
+        if rng.random() < mutation_rate:
             new_orientations[i] = 1 - new_orientations[i]  # flip
-        if random.random() < mutation_rate:
-            new_ratios[i] = max(0.2, min(0.8, new_ratios[i] + random.gauss(0, 0.1)))
+        if rng.random() < mutation_rate:
+            new_ratios[i] = max(0.2, min(0.8, new_ratios[i] + rng.normal(0, 0.1)))
 
     # Oda sırası mutasyonu: iki odayı yer değiştir
-    if random.random() < mutation_rate and len(new_order) >= 2:
-        i, j = random.sample(range(len(new_order)), 2)
+    if rng.random() < mutation_rate and len(new_order) >= 2:
+        i, j = rng.choice(len(new_order), size=2, replace=False).tolist()
         new_order[i], new_order[j] = new_order[j], new_order[i]
 
     return SlicingGenome(
@@ -203,13 +217,18 @@ def mutate_genome(genome: SlicingGenome, mutation_rate: float = 0.2) -> SlicingG
     )
 
 
-def crossover_genomes(a: SlicingGenome, b: SlicingGenome) -> SlicingGenome:
+def crossover_genomes(
+    a: SlicingGenome,
+    b: SlicingGenome,
+    rng: np.random.Generator | None = None,
+) -> SlicingGenome:
     """İki genomu çaprazla."""
+    rng = _as_rng(rng)
     n_cuts = max(0, a.n_rooms - 1)
 
     # Tek nokta çaprazlama (orientations + ratios)
     if n_cuts > 0:
-        cx = random.randint(0, n_cuts - 1)
+        cx = int(rng.integers(0, n_cuts))
         new_o = a.orientations[:cx] + b.orientations[cx:]
         new_r = a.ratios[:cx] + b.ratios[cx:]
     else:
@@ -217,7 +236,7 @@ def crossover_genomes(a: SlicingGenome, b: SlicingGenome) -> SlicingGenome:
         new_r = []
 
     # Order çaprazlama: Order Crossover (OX)
-    new_order = _order_crossover(a.room_order, b.room_order)
+    new_order = _order_crossover(a.room_order, b.room_order, rng)
 
     return SlicingGenome(
         n_rooms=a.n_rooms,
@@ -227,21 +246,29 @@ def crossover_genomes(a: SlicingGenome, b: SlicingGenome) -> SlicingGenome:
     )
 
 
-def _order_crossover(parent_a: list[int], parent_b: list[int]) -> list[int]:
+def _order_crossover(
+    parent_a: list[int],
+    parent_b: list[int],
+    rng: np.random.Generator | None = None,
+) -> list[int]:
     """Order Crossover (OX1) for permutations."""
     n = len(parent_a)
     if n <= 2:
         return list(parent_a)
 
-    start = random.randint(0, n - 2)
-    end = random.randint(start + 1, n - 1)
+    rng = _as_rng(rng)
+    start = int(rng.integers(0, n - 1))
+    end = int(rng.integers(start + 1, n))
 
     child = [-1] * n
     # A'dan bir dilimi kopyala
     child[start:end + 1] = parent_a[start:end + 1]
 
-    # B'den kalanları sırayla doldur
-    b_remaining = [x for x in parent_b if x not in child]
+    # B'den kalanları sırayla doldur (boolean maske ile O(n))
+    taken = [False] * n
+    for x in parent_a[start:end + 1]:
+        taken[x] = True
+    b_remaining = [x for x in parent_b if not taken[x]]
     fill_idx = 0
     for i in range(n):
         if child[i] == -1:
@@ -249,3 +276,487 @@ def _order_crossover(parent_a: list[int], parent_b: list[int]) -> list[int]:
             fill_idx += 1
 
     return child
+
+
+# ── Dizi Tabanlı Popülasyon Operatörleri ────────────────────────────────────
+
+@dataclass
+class PopulationBuffers:
+    """
+    Önceden ayrılmış NumPy popülasyon tamponları (satır = birey).
+    Operatörler tamponları yerinde günceller; nesil başına yeni liste veya
+    SlicingGenome oluşturulmaz.
+    """
+    orientations: np.ndarray   # (P, n_rooms - 1) int8
+    ratios: np.ndarray         # (P, n_rooms - 1) float64
+    room_order: np.ndarray     # (P, n_rooms) int32
+
+    @classmethod
+    def empty(cls, size: int, n_rooms: int) -> "PopulationBuffers":
+        n_cuts = max(0, n_rooms - 1)
+        return cls(
+            orientations=np.zeros((size, n_cuts), dtype=np.int8),
+            ratios=np.full((size, n_cuts), 0.5),
+            room_order=np.tile(np.arange(n_rooms, dtype=np.int32), (size, 1)),
+        )
+
+    @property
+    def size(self) -> int:
+        return self.room_order.shape[0]
+
+    @property
+    def n_rooms(self) -> int:
+        return self.room_order.shape[1]
+
+    def genome(self, i: int) -> SlicingGenome:
+        """i. satırı SlicingGenome olarak döndür (kopya)."""
+        return SlicingGenome(
+            n_rooms=self.n_rooms,
+            orientations=self.orientations[i].tolist(),
+            ratios=self.ratios[i].tolist(),
+            room_order=self.room_order[i].tolist(),
+        )
+
+    def set_genome(self, i: int, genome: SlicingGenome) -> None:
+        self.orientations[i] = genome.orientations
+        self.ratios[i] = genome.ratios
+        self.room_order[i] = genome.room_order
+
+    def copy_rows(self, src: "PopulationBuffers", src_rows, dst_rows) -> None:
+        self.orientations[dst_rows] = src.orientations[src_rows]
+        self.ratios[dst_rows] = src.ratios[src_rows]
+        self.room_order[dst_rows] = src.room_order[src_rows]
+
+
+def randomize_population(
+    buf: PopulationBuffers,
+    rng: np.random.Generator,
+    rows: slice = slice(None),
+) -> None:
+    """Seçili satırları rastgele genomlarla doldur (random_genome ile aynı dağılım)."""
+    o = buf.orientations[rows]
+    o[...] = rng.integers(0, 2, size=o.shape)
+    r = buf.ratios[rows]
+    r[...] = rng.uniform(0.25, 0.75, size=r.shape)
+    order = buf.room_order[rows]
+    rng.permuted(order, axis=1, out=order)
+
+
+def mutate_population(
+    buf: PopulationBuffers,
+    rng: np.random.Generator,
+    mutation_rate: float = 0.2,
+    rows: slice = slice(None),
+) -> None:
+    """mutate_genome'un tüm matris üzerinde yerinde karşılığı."""
+    o = buf.orientations[rows]
+    r = buf.ratios[rows]
+    order = buf.room_order[rows]
+    m, n = order.shape
+    if m == 0:
+        return
+
+    if o.shape[1] > 0:
+        o ^= (rng.random(o.shape) < mutation_rate).astype(np.int8)
+        jitter = rng.normal(0.0, 0.1, size=r.shape)
+        mutated = rng.random(r.shape) < mutation_rate
+        # Yalnızca değişen oranlar kırpılır (mutate_genome gibi); onarımın
+        # [0.2, 0.8] dışına taşıdığı oranlar korunur
+        r[mutated] = np.clip(r[mutated] + jitter[mutated], 0.2, 0.8)
+
+    # Oda sırası mutasyonu: seçilen satırlarda iki odayı yer değiştir
+    if n >= 2:
+        swap_rows = np.flatnonzero(rng.random(m) < mutation_rate)
+        i = rng.integers(0, n, size=swap_rows.size)
+        j = (i + rng.integers(1, n, size=swap_rows.size)) % n
+        vi = order[swap_rows, i]
+        order[swap_rows, i] = order[swap_rows, j]
+        order[swap_rows, j] = vi
+
+
+def crossover_population(
+    parents: PopulationBuffers,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    out: PopulationBuffers,
+    rng: np.random.Generator,
+    rows: slice = slice(None),
+) -> None:
+    """
+    crossover_genomes'un vektörel karşılığı: out[rows] = çaprazla(A, B).
+    Kesimler için tek nokta, oda sırası için OX1. OX1 her satırda O(n):
+    A diliminin değerleri boolean maskeyle işaretlenir, B'nin kalanları
+    kümülatif toplam sıralarıyla boş konumlara dağıtılır.
+    """
+    a_o, b_o = parents.orientations[idx_a], parents.orientations[idx_b]
+    a_r, b_r = parents.ratios[idx_a], parents.ratios[idx_b]
+    a_ord, b_ord = parents.room_order[idx_a], parents.room_order[idx_b]
+    m, n = a_ord.shape
+    n_cuts = a_o.shape[1]
+
+    # Tek nokta çaprazlama (orientations + ratios)
+    if n_cuts > 0:
+        cx = rng.integers(0, n_cuts, size=m)
+        take_a = np.arange(n_cuts) < cx[:, None]
+        out.orientations[rows] = np.where(take_a, a_o, b_o)
+        out.ratios[rows] = np.where(take_a, a_r, b_r)
+
+    if n <= 2:
+        out.room_order[rows] = a_ord
+        return
+
+    # Order Crossover (OX1)
+    start = rng.integers(0, n - 1, size=m)
+    end = rng.integers(start + 1, n)
+    cols = np.arange(n)
+    in_slice = (cols >= start[:, None]) & (cols <= end[:, None])
+    row_idx = np.broadcast_to(np.arange(m)[:, None], (m, n))
+
+    taken = np.zeros((m, n), dtype=bool)
+    taken[row_idx, a_ord] = in_slice
+    b_keep = ~taken[row_idx, b_ord]
+
+    fill = np.empty((m, n), dtype=a_ord.dtype)
+    fill_rank = np.cumsum(b_keep, axis=1) - 1
+    fill[row_idx[b_keep], fill_rank[b_keep]] = b_ord[b_keep]
+
+    child = np.where(in_slice, a_ord, 0)
+    empty = ~in_slice
+    slot_rank = np.cumsum(empty, axis=1) - 1
+    child[empty] = fill[row_idx[empty], slot_rank[empty]]
+    out.room_order[rows] = child
+
+
+# ── Kısıt Onarımı ───────────────────────────────────────────────────────────
+
+def room_minimums(room_types: list, codes: BuildingCodes) -> tuple[np.ndarray, np.ndarray]:
+    """Oda başına PAİY minimum dar kenar ve minimum alan dizileri."""
+    min_w = np.array([codes.min_width(rt) for rt in room_types], dtype=float)
+    min_a = np.array([codes.min_area(rt) for rt in room_types], dtype=float)
+    return min_w, min_a
+
+
+def _min_extent(
+    n_leaves: int, p: int, leaf0: int, axis: int, cross: float,
+    orientations, ratios, room_order, min_w, min_a, iw: float,
+) -> float:
+    """
+    Alt ağacın `axis` boyunca (0=x, 1=y) ihtiyaç duyduğu en küçük uzunluk.
+    cross: diğer eksendeki kullanılabilir uzunluk. Net alan (duvar düşülmüş)
+    kontrolüyle tutarlı olması için iç duvar payı eklenir.
+    """
+    if n_leaves == 1:
+        room = room_order[leaf0]
+        need = min_w[room]
+        if min_a[room] > 0:
+            need = max(need, min_a[room] / max(cross - iw, 0.05) + iw)
+        return need
+
+    left_count = n_leaves // 2
+    right_count = n_leaves - left_count
+    lp = p + 1
+    rp = p + 1 + max(0, left_count - 1)
+    args = (orientations, ratios, room_order, min_w, min_a, iw)
+
+    if orientations[p] == axis:
+        # Aynı eksende kesim: çocukların uzunlukları toplanır
+        return (
+            _min_extent(left_count, lp, leaf0, axis, cross, *args)
+            + _min_extent(right_count, rp, leaf0 + left_count, axis, cross, *args)
+        )
+    # Dik kesim: çocuklar aynı uzunluğu paylaşır, karşı ekseni bölüşür
+    r = ratios[p]
+    return max(
+        _min_extent(left_count, lp, leaf0, axis, cross * r, *args),
+        _min_extent(right_count, rp, leaf0 + left_count, axis, cross * (1 - r), *args),
+    )
+
+
+def _repair_node(
+    n_leaves: int, p: int, leaf0: int,
+    x: float, y: float, w: float, h: float,
+    orientations, ratios, room_order, min_w, min_a, iw: float,
+) -> bool:
+    """Düğümün kesimini, iki çocuk da minimumlarını karşılayacak şekilde it."""
+    if n_leaves == 1:
+        room = room_order[leaf0]
+        net = max(0.0, w - iw) * max(0.0, h - iw)
+        return min(w, h) >= min_w[room] - 1e-6 and net >= min_a[room] - 1e-6
+
+    left_count = n_leaves // 2
+    right_count = n_leaves - left_count
+    lp = p + 1
+    rp = p + 1 + max(0, left_count - 1)
+    args = (orientations, ratios, room_order, min_w, min_a, iw)
+
+    def _needs(axis: int) -> tuple[float, float, float]:
+        length, cross = (w, h) if axis == 0 else (h, w)
+        need_l = _min_extent(left_count, lp, leaf0, axis, cross, *args)
+        need_r = _min_extent(right_count, rp, leaf0 + left_count, axis, cross, *args)
+        return length, need_l, need_r
+
+    o = int(orientations[p])
+    length, need_l, need_r = _needs(o)
+    if need_l + need_r > length:
+        # Bu yönde sığmıyorsa diğer yönü dene, daha az aşan yönü seç
+        length2, need_l2, need_r2 = _needs(1 - o)
+        if (need_l2 + need_r2) / max(length2, 1e-9) < (need_l + need_r) / max(length, 1e-9):
+            o = 1 - o
+            orientations[p] = o
+            length, need_l, need_r = length2, need_l2, need_r2
+
+    if need_l + need_r <= length:
+        # Kesimi büyük kardeşe doğru, iki taraf da sığana kadar it
+        ratios[p] = min(max(float(ratios[p]), need_l / length), 1 - need_r / length)
+    # Hiçbir yönde sığmıyorsa kesim aramaya bırakılır: açığı her iki tarafa
+    # yaymak, ihlali tek odada toplamaktan daha çok oda ihlal eder.
+    r = float(ratios[p])
+
+    if o == 0:
+        left = (x, y, w * r, h)
+        right = (x + w * r, y, w * (1 - r), h)
+    else:
+        left = (x, y, w, h * r)
+        right = (x, y + h * r, w, h * (1 - r))
+
+    ok_l = _repair_node(left_count, lp, leaf0, *left, *args)
+    ok_r = _repair_node(right_count, rp, leaf0 + left_count, *right, *args)
+    return ok_l and ok_r
+
+
+def repair_population(
+    buf: PopulationBuffers,
+    container: Rect,
+    min_w: np.ndarray,
+    min_a: np.ndarray,
+    iw: float = 0.0,
+    rows: slice = slice(None),
+) -> np.ndarray:
+    """
+    Seçili satırları yerinde onar; satır başına uygunluk (bool) döndürür.
+
+    Ağaç yukarıdan aşağı gezilir: her düğümde iki çocuğun kesim ekseni
+    boyunca minimum ihtiyacı hesaplanır ve kesim, ikisi de sığana kadar
+    büyük kardeşe doğru itilir. Bu yönde sığmıyorsa kesim yönü çevrilir.
+    """
+    indices = range(buf.size)[rows]
+    feasible = np.zeros(len(indices), dtype=bool)
+    n = buf.n_rooms
+    if n == 0:
+        return feasible
+    for k, i in enumerate(indices):
+        feasible[k] = _repair_node(
+            n, 0, 0, container.x, container.y, container.w, container.h,
+            buf.orientations[i], buf.ratios[i], buf.room_order[i], min_w, min_a, iw,
+        )
+    return feasible
+
+
+def repair_genome(
+    genome: SlicingGenome,
+    container: Rect,
+    room_types: list,
+    codes: BuildingCodes,
+) -> SlicingGenome:
+    """repair_population'ın tek genom karşılığı (kopya döndürür)."""
+    buf = PopulationBuffers.empty(1, genome.n_rooms)
+    buf.set_genome(0, genome)
+    min_w, min_a = room_minimums(room_types, codes)
+    repair_population(buf, container, min_w, min_a, codes.inner_wall)
+    return buf.genome(0)
+
+
+def adapt_genome(
+    genome: SlicingGenome,
+    old_types: list,
+    new_types: list,
+    rng: np.random.Generator | None = None,
+) -> SlicingGenome:
+    """
+    Önceki oda programının genomunu yeni programa uyarla (warm start).
+
+    Oranlar konteynere göreli olduğundan bölge ölçüsü değişikliği için
+    uyarlama gerekmez. Oda sayısı değişirse ortak kesim öneki korunur,
+    eksik kesimler rastgele üretilir; her yeni oda aynı tipteki aynı sıradaki
+    eski odanın yaprak sırasını devralır, karşılığı olmayan odalar sona eklenir.
+    Sonuç repair_population ile onarılmak üzere tohum olarak kullanılır.
+    """
+    rng = _as_rng(rng)
+    n = len(new_types)
+    n_cuts = max(0, n - 1)
+    keep = min(n_cuts, len(genome.orientations))
+    orientations = list(genome.orientations[:keep]) + rng.integers(0, 2, size=n_cuts - keep).tolist()
+    ratios = list(genome.ratios[:keep]) + rng.uniform(0.25, 0.75, size=n_cuts - keep).tolist()
+
+    old_leaf = {room: leaf for leaf, room in enumerate(genome.room_order)}
+    old_by_type: dict = {}
+    for i, rt in enumerate(old_types):
+        old_by_type.setdefault(rt, []).append(i)
+    seen: dict = {}
+    slots = []
+    for j, rt in enumerate(new_types):
+        k = seen.get(rt, 0)
+        seen[rt] = k + 1
+        olds = old_by_type.get(rt, [])
+        leaf = old_leaf[olds[k]] if k < len(olds) else len(old_types) + rng.random()
+        slots.append((leaf, j))
+
+    return SlicingGenome(
+        n_rooms=n,
+        orientations=orientations,
+        ratios=ratios,
+        room_order=[j for _, j in sorted(slots)],
+    )
+
+
+def population_entropy(buf: PopulationBuffers, ratio_bins: int = 10) -> float:
+    """
+    Popülasyon çeşitliliği: gen başına normalize Shannon entropisinin ortalaması.
+    0 = tüm bireyler aynı, 1 = her gen tamamen dağınık.
+    Oranlar [0.2, 0.8] aralığında `ratio_bins` kutuya ayrılır.
+    """
+    size, n = buf.room_order.shape
+    if size == 0 or n <= 1:
+        return 0.0
+
+    def _entropy(probs: np.ndarray, n_symbols: int) -> np.ndarray:
+        p = np.where(probs > 0, probs, 1.0)
+        return -(probs * np.log(p)).sum(axis=-1) / np.log(n_symbols)
+
+    # Kesim yönleri: ikili
+    p1 = buf.orientations.mean(axis=0)
+    orient_h = _entropy(np.stack([p1, 1.0 - p1], axis=-1), 2)
+
+    # Kesim oranları: kutulanmış
+    bins = np.clip(((buf.ratios - 0.2) / 0.6 * ratio_bins).astype(np.int64), 0, ratio_bins - 1)
+    ratio_p = (bins[:, :, None] == np.arange(ratio_bins)).mean(axis=0)
+    ratio_h = _entropy(ratio_p, ratio_bins)
+
+    # Oda sırası: konum başına oda dağılımı
+    order_p = (buf.room_order[:, :, None] == np.arange(n)).mean(axis=0)
+    order_h = _entropy(order_p, n)
+
+    return float(np.concatenate([orient_h, ratio_h, order_h]).mean())
+
+
+# ── Genom Önbelleği ──────────────────────────────────────────────────────────
+
+def ratio_step(container: Rect) -> float:
+    """
+    1 cm çözünürlüğe karşılık gelen kesim oranı adımı.
+
+    Herhangi bir düğümün kesim konumu en fazla oran * max(w, h) kadar
+    kayabileceği için adım 0.01 / max(w, h) seçilir.
+    """
+    return 0.01 / max(container.w, container.h, 0.01)
+
+
+def genome_key(genome: SlicingGenome, container: Rect, context: tuple = ()) -> tuple:
+    """
+    Genomun nicemlenmiş parmak izi.
+    Yalnızca 1 cm'den küçük farklarla ayrışan bireyler aynı anahtarı paylaşır.
+    """
+    step = ratio_step(container)
+    return (
+        context,
+        round(container.x, 2), round(container.y, 2),
+        round(container.w, 2), round(container.h, 2),
+        tuple(int(o) for o in genome.orientations),
+        tuple(int(round(r / step)) for r in genome.ratios),
+        tuple(int(i) for i in genome.room_order),
+    )
+
+
+def population_keys(
+    buf: PopulationBuffers,
+    container: Rect,
+    context: tuple = (),
+) -> list[tuple]:
+    """genome_key'in tampon satırları için toplu hesaplanmış karşılığı."""
+    step = ratio_step(container)
+    head = (
+        context,
+        round(container.x, 2), round(container.y, 2),
+        round(container.w, 2), round(container.h, 2),
+    )
+    q_ratios = np.rint(buf.ratios / step).astype(np.int64).tolist()
+    orients = buf.orientations.tolist()
+    orders = buf.room_order.tolist()
+    return [
+        head + (tuple(o), tuple(r), tuple(order))
+        for o, r, order in zip(orients, q_ratios, orders)
+    ]
+
+
+def genome_from_key(key: tuple, container: Rect) -> SlicingGenome:
+    """
+    Anahtarın temsil ettiği nicemlenmiş genomu kur.
+    Önbelleğe bu genomun değeri yazılır; böylece bir anahtarın değeri
+    hangi bireyin önce değerlendirildiğinden bağımsızdır.
+    """
+    orientations, q_ratios, room_order = key[-3:]
+    step = ratio_step(container)
+    return SlicingGenome(
+        n_rooms=len(room_order),
+        orientations=list(orientations),
+        ratios=[q * step for q in q_ratios],
+        room_order=list(room_order),
+    )
+
+
+class GenomeCache:
+    """
+    Sınırlı (LRU) genom → (fitness, dikdörtgenler) önbelleği.
+
+    GA popülasyonlarında çaprazlama/mutasyon sıkça var olan bireyleri yeniden
+    üretir; aynı anahtarlı birey tekrar değerlendirilmez. İş parçacıkları
+    arasında paylaşılabilir.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple, tuple[float, tuple[Rect, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: tuple) -> tuple[float, tuple[Rect, ...]] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple, fitness: float, rects: list[Rect]) -> None:
+        with self._lock:
+            self._data[key] = (fitness, tuple(rects))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,128 @@
+"""
+Karma daire tipleri: tip sayılarının çözülmesi ve tiplerin daire
+bölgelerine atanması.
+
+Kat, farklı oda programlarına sahip daire tiplerinden oluşabilir
+(ör. 2×3+1 + 4×2+1). Tip → bölge eşlemesi atama problemi olarak
+çözülür (solve_assignment); maliyet bölge alanının tipin alan payına
+uzaklığı, min genişlik uygunluğu ve cephe ihtiyacıdır.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .models import Rect, RoomType, RoomCountInput, UnitTypeInput
+from .building_codes import BuildingCodes
+from .building_layout import BuildingZones, min_zone_width
+from .assignment import solve_assignment
+
+
+def as_unit_types(
+    room_counts: RoomCountInput | list[UnitTypeInput],
+) -> list[UnitTypeInput]:
+    """Tek tip girdiyi (RoomCountInput) tek elemanlı tip listesine çevir."""
+    if isinstance(room_counts, RoomCountInput):
+        return [UnitTypeInput(rooms=room_counts)]
+    return list(room_counts)
+
+
+def resolve_unit_counts(units: list[UnitTypeInput], n_apartments: int) -> list[int]:
+    """
+    Her tipin daire sayısını belirle.
+    Sabit sayılar önce ayrılır; kalan daireler share oranlarıyla en büyük
+    kalan yöntemiyle paylaştırılır (share'i olmayan tipler eşit pay alır).
+    """
+    if not units:
+        raise ValueError("En az bir daire tipi gerekli")
+    fixed = sum(u.count for u in units if u.count is not None)
+    if fixed > n_apartments:
+        raise ValueError(
+            f"Daire tipi sayıları ({fixed}) kattaki daire sayısını "
+            f"({n_apartments}) aşıyor"
+        )
+    counts = [u.count or 0 for u in units]
+    flexible = [i for i, u in enumerate(units) if u.count is None]
+    remaining = n_apartments - fixed
+    if remaining and not flexible:
+        raise ValueError(
+            f"Daire tipi sayıları ({fixed}) kattaki daire sayısına "
+            f"({n_apartments}) eşit olmalı"
+        )
+    if flexible:
+        given = [units[i].share for i in flexible if units[i].share is not None]
+        default_share = (
+            max(0.0, 1.0 - sum(given)) / (len(flexible) - len(given))
+            if len(given) < len(flexible) else 0.0
+        )
+        shares = np.array([
+            units[i].share if units[i].share is not None else default_share
+            for i in flexible
+        ])
+        if shares.sum() <= 0:
+            shares = np.ones(len(flexible))
+        quota = shares / shares.sum() * remaining
+        alloc = np.floor(quota).astype(int)
+        # En büyük kalan; eşitlikte listedeki sıra
+        order = np.argsort(-(quota - alloc), kind="stable")
+        alloc[order[:remaining - alloc.sum()]] += 1
+        for i, a in zip(flexible, alloc):
+            counts[i] = int(a)
+    return counts
+
+
+def _facade_lengths(zones: list[Rect], building_rect: Rect) -> np.ndarray:
+    """Bölgelerin dış cephe uzunluğu: uzun cephe + (uçtaysa) yan cephe."""
+    facade = []
+    for z in zones:
+        length = z.w
+        if building_rect.x2 - z.x2 < 1.0 or z.x - building_rect.x < 1.0:
+            length += z.h
+        facade.append(length)
+    return np.array(facade)
+
+
+def assign_unit_types(
+    unit_rooms: list[list[RoomType]],
+    counts: list[int],
+    zones: BuildingZones,
+    codes: BuildingCodes,
+) -> list[int]:
+    """
+    Daire tiplerini bölgelere ata; bölge sırasıyla tip indisleri döndür.
+
+    Satırlar daire örnekleri (tip sayısı kadar tekrar), sütunlar bölgeler.
+    Maliyet:
+      - ((bölge alanı - hedef) / hedef)², hedef = toplam alan × tip payı
+        (payı min oda alanları toplamıyla orantılı)
+      - bölge min_zone_width'i karşılamıyorsa +1
+      - dış duvar isteyen oda sayısı × cephe uzunluğu ile ters orantılı
+        küçük bir ödül (geniş cepheli uç bölgeler kalabalık tiplere)
+    """
+    apt_zones = zones.apartment_zones
+    instances = [t for t, c in enumerate(counts) for _ in range(c)]
+    if len(unit_rooms) == 1 or len(set(instances)) <= 1:
+        return [instances[0] if instances else 0] * len(apt_zones)
+
+    weights = np.array([
+        max(sum(codes.min_area(rt) for rt in rooms), 1e-6) for rooms in unit_rooms
+    ])[instances]
+    areas = np.array([z.area for z in apt_zones])
+    widths = np.array([z.w for z in apt_zones])
+    demand = areas.sum() * weights / weights.sum()
+
+    min_ws = np.array([min_zone_width(rooms, codes) for rooms in unit_rooms])[instances]
+    ext_need = np.array([
+        sum(1 for rt in rooms if codes.needs_exterior_wall(rt)) for rooms in unit_rooms
+    ], dtype=float)[instances]
+    facade = _facade_lengths(apt_zones, zones.building_rect)
+
+    cost = ((areas[None, :] - demand[:, None]) / demand[:, None]) ** 2
+    cost += (widths[None, :] < min_ws[:, None] - 1e-9) * 1.0
+    cost -= 0.1 * (ext_need[:, None] / max(ext_need.max(), 1.0)) * (facade[None, :] / facade.max())
+
+    rows, cols = solve_assignment(cost)
+    zone_types = [0] * len(apt_zones)
+    for r, c in zip(rows, cols):
+        zone_types[c] = instances[r]
+    return zone_types
@@ -5,11 +5,16 @@ Adım 9: Plan doğrulama motoru.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .models import Rect, RoomType, PlacedRoom, FloorPlan
 from .building_codes import BuildingCodes
-from .corridor import check_connectivity, find_neighbors
+from .corridor import find_neighbors, compute_reachability, WALL_GAP
+from .raster import compute_occupancy, compute_egress, MIN_GAP_AREA
+from .walls import EXTERIOR_TOL
 
 
 @dataclass
@@ -18,6 +23,8 @@ class ValidationResult:
     is_valid: bool = True
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)   # Kontrol başına süre (s)
+    fail_fast: bool = False                                    # İlk hatada dur ("fast" modu)
 
     def add_error(self, msg: str) -> None:
         self.errors.append(msg)
@@ -26,83 +33,218 @@ class ValidationResult:
     def add_warning(self, msg: str) -> None:
         self.warnings.append(msg)
 
+    @property
+    def stopped(self) -> bool:
+        """fail_fast açıkken bir hata bulunduysa kalan kontroller atlanır."""
+        return self.fail_fast and not self.is_valid
 
-def validate_plan(plan: FloorPlan, codes: BuildingCodes) -> ValidationResult:
-    """Planı tüm kurallara karşı doğrula."""
-    result = ValidationResult()
 
-    _check_overlaps(plan, result)
-    _check_bounds(plan, result)
-    _check_min_areas(plan, codes, result)
-    _check_min_widths(plan, codes, result)
-    _check_connectivity(plan, result)
-    _check_exterior_access(plan, codes, result)
+# Mod başına kontroller (çalışma sırasıyla):
+#   fast     — yalnızca sert kısıtlar (sınır, çakışma), ilk hatada durur;
+#              arama döngüsünde kabul/ret için
+#   standard — O(n) oda kontrolleri + sweep ile çakışma
+#   full     — standard + bağlantı + erişilebilirlik + boşluk (raster) +
+#              kapı/pencere + kaçış mesafesi (raster; son alternatifler için)
+VALIDATION_MODES: dict[str, tuple[str, ...]] = {
+    "fast": ("bounds", "overlaps"),
+    "standard": ("overlaps", "bounds", "min_areas", "min_widths", "exterior_access"),
+    "full": (
+        "overlaps", "bounds", "min_areas", "min_widths", "connectivity",
+        "reachability", "gaps", "exterior_access", "openings", "egress",
+    ),
+}
+
+
+def validate_plan(plan: FloorPlan, codes: BuildingCodes, mode: str = "full") -> ValidationResult:
+    """
+    Planı seçilen moddaki kurallara karşı doğrula (bkz. VALIDATION_MODES).
+    Her kontrolün süresi result.timings'e yazılır.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Bilinmeyen doğrulama modu: {mode}")
+    result = ValidationResult(fail_fast=(mode == "fast"))
+    for name in VALIDATION_MODES[mode]:
+        start = time.perf_counter()
+        _CHECKS[name](plan, codes, result)
+        result.timings[name] = time.perf_counter() - start
+        if result.stopped:
+            break
+    return result
+
 
+_NO_MIN_CHECK = (RoomType.KORIDOR_DAIRE, RoomType.KORIDOR_BINA, RoomType.MERDIVEN, RoomType.ASANSOR)
+
+
+def overlap_error(ri: PlacedRoom, rj: PlacedRoom) -> str | None:
+    """İki oda arasındaki çakışma hatası (yoksa None)."""
+    if not ri.rect.overlaps(rj.rect):
+        return None
+    # Komşu kenar teması OK, gerçek çakışma değil
+    # Küçük çakışmaları (< 0.01 m²) tolere et
+    ix1 = max(ri.rect.x, rj.rect.x)
+    iy1 = max(ri.rect.y, rj.rect.y)
+    ix2 = min(ri.rect.x2, rj.rect.x2)
+    iy2 = min(ri.rect.y2, rj.rect.y2)
+    overlap_area = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    if overlap_area > 0.05:
+        return (
+            f"Çakışma: {ri.room_id} ve {rj.room_id} "
+            f"({overlap_area:.2f} m² çakışma)"
+        )
+    return None
+
+
+def validate_room(
+    room: PlacedRoom,
+    building_rect: Rect,
+    codes: BuildingCodes,
+    others: list[PlacedRoom],
+) -> ValidationResult:
+    """
+    Tek odanın oda düzeyi kontrolleri (sınır, min alan/genişlik, bağlantı,
+    dış duvar, kapı/pencere — "full" modu). others: bağlantı için aday
+    komşular (tüm odalar da olabilir).
+    Artımlı düzenlemede yalnızca değişen odalar için çağrılır.
+    """
+    result = ValidationResult()
+    _room_bounds(room, building_rect, result)
+    _room_min_area(room, codes, result)
+    _room_min_width(room, codes, result)
+    if not _room_connected(room, others):
+        result.add_warning(f"{room.room_id}: hiçbir odaya bağlantısı yok")
+    _room_exterior_access(room, building_rect, codes, result)
+    _room_openings(room, building_rect, codes, result)
     return result
 
 
-def _check_overlaps(plan: FloorPlan, result: ValidationResult) -> None:
-    """Oda çakışması kontrolü."""
+def _check_overlaps(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
+    """Oda çakışması kontrolü: x aralıkları üzerinde sort-and-sweep."""
     rooms = plan.rooms
-    for i in range(len(rooms)):
-        for j in range(i + 1, len(rooms)):
-            ri, rj = rooms[i], rooms[j]
-            if ri.rect.overlaps(rj.rect):
-                # Komşu kenar teması OK, gerçek çakışma değil
-                # Küçük çakışmaları (< 0.01 m²) tolere et
-                ix1 = max(ri.rect.x, rj.rect.x)
-                iy1 = max(ri.rect.y, rj.rect.y)
-                ix2 = min(ri.rect.x2, rj.rect.x2)
-                iy2 = min(ri.rect.y2, rj.rect.y2)
-                overlap_area = max(0, ix2 - ix1) * max(0, iy2 - iy1)
-                if overlap_area > 0.05:
-                    result.add_error(
-                        f"Çakışma: {ri.room_id} ve {rj.room_id} "
-                        f"({overlap_area:.2f} m² çakışma)"
-                    )
-
-
-def _check_bounds(plan: FloorPlan, result: ValidationResult) -> None:
+    order = sorted(range(len(rooms)), key=lambda i: rooms[i].rect.x)
+    for k, i in enumerate(order):
+        x2 = rooms[i].rect.x2
+        for j in order[k + 1:]:
+            if rooms[j].rect.x >= x2:
+                break
+            a, b = min(i, j), max(i, j)
+            msg = overlap_error(rooms[a], rooms[b])
+            if msg:
+                result.add_error(msg)
+                if result.stopped:
+                    return
+
+
+def _check_bounds(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
     """Tüm odalar bina sınırı içinde mi?"""
-    br = plan.building_rect
     for room in plan.rooms:
-        r = room.rect
-        if r.x < br.x - 0.01 or r.y < br.y - 0.01:
-            result.add_error(f"{room.room_id} bina sınırı dışında (sol/alt)")
-        if r.x2 > br.x2 + 0.01 or r.y2 > br.y2 + 0.01:
-            result.add_error(f"{room.room_id} bina sınırı dışında (sağ/üst)")
+        _room_bounds(room, plan.building_rect, result)
+        if result.stopped:
+            return
+
+
+def _room_bounds(room: PlacedRoom, br: Rect, result: ValidationResult) -> None:
+    r = room.rect
+    if r.x < br.x - 0.01 or r.y < br.y - 0.01:
+        result.add_error(f"{room.room_id} bina sınırı dışında (sol/alt)")
+    if r.x2 > br.x2 + 0.01 or r.y2 > br.y2 + 0.01:
+        result.add_error(f"{room.room_id} bina sınırı dışında (sağ/üst)")
 
 
 def _check_min_areas(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
     """Minimum alan kontrolü."""
     for room in plan.rooms:
-        if room.room_type in (RoomType.KORIDOR_DAIRE, RoomType.KORIDOR_BINA, RoomType.MERDIVEN, RoomType.ASANSOR):
-            continue
-        min_a = codes.min_area(room.room_type)
-        if min_a > 0 and room.area < min_a * 0.85:  # %15 tolerans
-            result.add_warning(
-                f"{room.room_id}: alan {room.area:.1f} m² < min {min_a:.1f} m²"
-            )
+        _room_min_area(room, codes, result)
+
+
+def _room_min_area(room: PlacedRoom, codes: BuildingCodes, result: ValidationResult) -> None:
+    if room.room_type in _NO_MIN_CHECK:
+        return
+    min_a = codes.min_area(room.room_type)
+    if min_a > 0 and room.area < min_a * 0.85:  # %15 tolerans
+        result.add_warning(
+            f"{room.room_id}: alan {room.area:.1f} m² < min {min_a:.1f} m²"
+        )
 
 
 def _check_min_widths(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
     """Minimum genişlik kontrolü."""
     for room in plan.rooms:
-        if room.room_type in (RoomType.KORIDOR_DAIRE, RoomType.KORIDOR_BINA, RoomType.MERDIVEN, RoomType.ASANSOR):
-            continue
-        min_w = codes.min_width(room.room_type)
-        if min_w > 0 and room.rect.min_dim < min_w * 0.85:
-            result.add_warning(
-                f"{room.room_id}: min genişlik {room.rect.min_dim:.2f}m < {min_w:.2f}m"
-            )
+        _room_min_width(room, codes, result)
 
 
-def _check_connectivity(plan: FloorPlan, result: ValidationResult) -> None:
+def _room_min_width(room: PlacedRoom, codes: BuildingCodes, result: ValidationResult) -> None:
+    if room.room_type in _NO_MIN_CHECK:
+        return
+    min_w = codes.min_width(room.room_type)
+    if min_w > 0 and room.rect.min_dim < min_w * 0.85:
+        result.add_warning(
+            f"{room.room_id}: min genişlik {room.rect.min_dim:.2f}m < {min_w:.2f}m"
+        )
+
+
+def _check_connectivity(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
     """Her oda en az bir komşuya bağlı mı?"""
-    connectivity = check_connectivity(plan.rooms)
-    for room_id, connected in connectivity.items():
-        if not connected:
-            result.add_warning(f"{room_id}: hiçbir odaya bağlantısı yok")
+    for room in plan.rooms:
+        if not _room_connected(room, plan.rooms):
+            result.add_warning(f"{room.room_id}: hiçbir odaya bağlantısı yok")
+
+
+def _room_connected(room: PlacedRoom, others: list[PlacedRoom], tolerance: float = WALL_GAP) -> bool:
+    """
+    check_connectivity'nin tek oda karşılığı. Oda kimlikleri daireler arasında
+    tekrarlanabildiğinden (mutfak_0, ...) karşılaştırma nesne kimliğiyle yapılır.
+    Temas, kapı grafiği ve duvarlar gibi iç duvar boşluğu toleransıyla (WALL_GAP).
+    """
+    if room.room_type in (RoomType.MERDIVEN, RoomType.ASANSOR):
+        return True
+    return any(
+        other is not room
+        and room.rect.shared_edge_length(other.rect, tolerance) >= 0.7
+        for other in others
+    )
+
+
+def _check_reachability(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
+    """Kapı grafiğinde her odaya antreden / bina koridorundan ulaşılabiliyor mu?"""
+    reach = compute_reachability(plan.rooms)
+    for i in reach.unreachable:
+        result.add_error(f"{plan.rooms[i].room_id}: girişten ulaşılamıyor")
+
+
+def _check_gaps(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
+    """Hiçbir odaya atanmamış, duvar kalınlığından geniş boşluklar (raster doluluk)."""
+    for msg in gap_warnings(plan, codes):
+        result.add_warning(msg)
+
+
+def gap_warnings(plan: FloorPlan, codes: BuildingCodes) -> list[str]:
+    occupancy = compute_occupancy(plan, codes)
+    messages = []
+    for apt, area in occupancy.gap_by_apartment.items():
+        if area >= MIN_GAP_AREA:
+            owner = f"Daire {apt + 1}" if apt >= 0 else "Bina"
+            messages.append(f"{owner}: {area:.1f} m² atanmamış boşluk")
+    return messages
+
+
+def _check_egress(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
+    """Her dairenin giriş kapısından merdivene yürüme mesafesi sınırı aşıyor mu?"""
+    for msg in egress_errors(plan, codes):
+        result.add_error(msg)
+
+
+def egress_errors(plan: FloorPlan, codes: BuildingCodes) -> list[str]:
+    egress = compute_egress(plan, codes, full_map=False)
+    messages = []
+    for apt in egress.violations:
+        dist = egress.per_apartment[apt]
+        if np.isfinite(dist):
+            messages.append(
+                f"Daire {apt + 1}: girişten merdivene kaçış mesafesi {dist:.1f}m > {egress.limit:.0f}m"
+            )
+        else:
+            messages.append(f"Daire {apt + 1}: merdivene kaçış yolu yok")
+    return messages
 
 
 def _check_exterior_access(
@@ -110,9 +252,245 @@ def _check_exterior_access(
 ) -> None:
     """Dış duvar gerektiren odalar gerçekten dış duvarda mı?"""
     for room in plan.rooms:
-        if codes.needs_exterior_wall(room.room_type):
-            touches = room.rect.touches_edge(plan.building_rect, tolerance=0.05)
-            if not any(touches.values()):
-                result.add_warning(
-                    f"{room.room_id} ({room.room_type.value}): dış duvara erişimi yok"
-                )
+        _room_exterior_access(room, plan.building_rect, codes, result)
+
+
+def _room_exterior_access(
+    room: PlacedRoom, building_rect: Rect, codes: BuildingCodes, result: ValidationResult
+) -> None:
+    if codes.needs_exterior_wall(room.room_type):
+        touches = room.rect.touches_edge(building_rect, tol=0.05)
+        if not any(touches.values()):
+            result.add_warning(
+                f"{room.room_id} ({room.room_type.value}): dış duvara erişimi yok"
+            )
+
+
+# Kapısı olması gereken odalar (dolaşım ve çekirdek hariç)
+_NEEDS_DOOR = (
+    RoomType.SALON, RoomType.YATAK_ODASI, RoomType.ODA, RoomType.MUTFAK,
+    RoomType.BANYO, RoomType.TUVALET, RoomType.ANTRE,
+)
+
+
+def _check_openings(plan: FloorPlan, codes: BuildingCodes, result: ValidationResult) -> None:
+    """Kapı ve pencere kontrolü (Madde 39)."""
+    for room in plan.rooms:
+        _room_openings(room, plan.building_rect, codes, result)
+
+
+def _room_openings(
+    room: PlacedRoom, building_rect: Rect, codes: BuildingCodes, result: ValidationResult
+) -> None:
+    if room.room_type in _NEEDS_DOOR and not room.doors:
+        result.add_warning(f"{room.room_id}: kapısı yok")
+    if not codes.needs_window(room.room_type):
+        return
+    # Dış cephe teması: pencere yerleşimiyle aynı tolerans
+    if not any(room.rect.touches_edge(building_rect, tol=EXTERIOR_TOL).values()):
+        return
+    if not room.windows:
+        result.add_warning(f"{room.room_id}: penceresi yok")
+        return
+    win_area = sum(w.width * w.height for w in room.windows)
+    need = room.area * codes.window_min_area_ratio
+    if win_area < need - 1e-6:
+        result.add_warning(
+            f"{room.room_id}: pencere alanı {win_area:.2f} m² < {need:.2f} m² "
+            f"(oda alanının %{codes.window_min_area_ratio * 100:.0f}'u)"
+        )
+
+
+_CHECKS = {
+    "overlaps": _check_overlaps,
+    "bounds": _check_bounds,
+    "min_areas": _check_min_areas,
+    "min_widths": _check_min_widths,
+    "connectivity": _check_connectivity,
+    "reachability": _check_reachability,
+    "gaps": _check_gaps,
+    "exterior_access": _check_exterior_access,
+    "openings": _check_openings,
+    "egress": _check_egress,
+}
+
+
+# ── Toplu (Vektörel) Doğrulama ───────────────────────────────────────────────
+
+VIOLATION_CODES = ("overlap", "bounds", "min_area", "min_width", "connectivity", "exterior_access")
+_ERROR_CODES = {"overlap", "bounds"}
+
+
+@dataclass
+class Violation:
+    """Makine tarafından okunabilir ihlal kaydı (validate_plan mesajlarının karşılığı)."""
+    code: str         # VIOLATION_CODES
+    plan: int         # Plan indisi (validate_plans girdisinde)
+    room: int         # plan.rooms içindeki oda indisi
+    value: float      # Ölçülen değer (alan, genişlik, çakışma alanı, taşma, ...)
+    limit: float      # Karşılaştırılan sınır (toleranslar dahil)
+    is_error: bool    # False = uyarı
+    other: int = -1   # Çakışmada diğer oda indisi
+
+
+@dataclass
+class BatchValidation:
+    """validate_plans sonucu: ihlaller sütun dizileri halinde, (plan, oda) sıralı."""
+    n_plans: int
+    plan: np.ndarray      # int64
+    room: np.ndarray      # int64
+    other: np.ndarray     # int64 (-1 = yok)
+    code: np.ndarray      # int8, VIOLATION_CODES indisi
+    value: np.ndarray
+    limit: np.ndarray
+    is_error: np.ndarray  # bool
+
+    @property
+    def is_valid(self) -> np.ndarray:
+        """Plan başına: hata (çakışma / sınır dışı) yok mu? validate_plan().is_valid ile aynı."""
+        bad = np.zeros(self.n_plans, dtype=bool)
+        bad[self.plan[self.is_error]] = True
+        return ~bad
+
+    def counts(self) -> dict[str, int]:
+        """Kod başına ihlal sayısı."""
+        n = np.bincount(self.code, minlength=len(VIOLATION_CODES))
+        return {c: int(k) for c, k in zip(VIOLATION_CODES, n)}
+
+    def violations(self, plan: int | None = None) -> list[Violation]:
+        """Kayıtları Violation listesi olarak döndür (plan verilirse yalnızca o plan)."""
+        idx = np.arange(len(self.plan)) if plan is None else np.flatnonzero(self.plan == plan)
+        return [
+            Violation(
+                code=VIOLATION_CODES[self.code[i]], plan=int(self.plan[i]), room=int(self.room[i]),
+                value=float(self.value[i]), limit=float(self.limit[i]),
+                is_error=bool(self.is_error[i]), other=int(self.other[i]),
+            )
+            for i in idx
+        ]
+
+
+def _type_tables(codes: BuildingCodes) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """RoomType sırasıyla min alan, min genişlik, dış duvar ihtiyacı, her zaman bağlı."""
+    types = list(RoomType)
+    skip = np.array([rt in _NO_MIN_CHECK for rt in types])
+    min_a = np.where(skip, 0.0, [codes.min_area(rt) for rt in types])
+    min_w = np.where(skip, 0.0, [codes.min_width(rt) for rt in types])
+    exterior = np.array([codes.needs_exterior_wall(rt) for rt in types])
+    always = np.array([rt in (RoomType.MERDIVEN, RoomType.ASANSOR) for rt in types])
+    return min_a, min_w, exterior, always
+
+
+def _sweep_pairs(plan_idx: np.ndarray, x: np.ndarray, x2: np.ndarray, pad: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort-and-sweep: aynı plandaki, x aralıkları (pad kadar genişletilmiş)
+    kesişen tüm (i, j) çiftleri. Planlar tek eksende ayrık anahtarlara
+    kaydırılarak tek sıralamayla taranır.
+    """
+    if len(x) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    span = float(max(x2.max(), x.max()) - min(x.min(), x2.min())) + 2 * pad + 1.0
+    key = plan_idx * span + x
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    end = np.searchsorted(sorted_key, (plan_idx * span + x2 + pad)[order], side="left")
+    start = np.arange(len(order)) + 1
+    counts = np.maximum(end - start, 0)
+    first = np.repeat(start, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    a = np.repeat(order, counts)
+    b = order[first + offsets]
+    return a, b
+
+
+def validate_plans(plans: list[FloorPlan], codes: BuildingCodes) -> BatchValidation:
+    """
+    Çok sayıda planı tek seferde doğrula.
+
+    Tüm odalar dizilere paketlenir; sınır, min alan/genişlik ve dış duvar
+    kontrolleri NumPy ifadeleridir. Çakışma ve bağlantı (kenar teması)
+    adayları x aralıkları üzerinde sort-and-sweep ile bulunur (O(n log n + k)).
+    Eşikler validate_plan ile aynıdır; mesaj yerine yapılandırılmış kayıt döner.
+    """
+    type_idx = {rt: k for k, rt in enumerate(RoomType)}
+    n_rooms = np.array([len(p.rooms) for p in plans], dtype=np.int64)
+    plan_idx = np.repeat(np.arange(len(plans)), n_rooms)
+    local_idx = np.arange(n_rooms.sum()) - np.repeat(np.cumsum(n_rooms) - n_rooms, n_rooms)
+    geom = np.array(
+        [(r.rect.x, r.rect.y, r.rect.w, r.rect.h, r.area) for p in plans for r in p.rooms],
+        dtype=float,
+    ).reshape(-1, 5)
+    x, y, w, h, area = geom.T
+    x2, y2 = x + w, y + h
+    rtype = np.array([type_idx[r.room_type] for p in plans for r in p.rooms], dtype=np.int64)
+    br = np.array(
+        [(p.building_rect.x, p.building_rect.y, p.building_rect.x2, p.building_rect.y2) for p in plans],
+        dtype=float,
+    ).reshape(-1, 4)[plan_idx]
+    bx, by, bx2, by2 = br.T
+
+    min_a, min_w, needs_ext, always_connected = _type_tables(codes)
+    records: list[tuple] = []   # (satırlar, kod, değer, sınır, diğer oda)
+
+    def _emit(mask: np.ndarray, code: str, value: np.ndarray, limit: np.ndarray | float) -> None:
+        rows = np.flatnonzero(mask)
+        limit = np.broadcast_to(limit, mask.shape)
+        records.append((rows, code, value[rows], limit[rows], np.full(len(rows), -1)))
+
+    # Sınır: sol/alt ve sağ/üst taşma ayrı kayıtlar (validate_plan gibi)
+    low = np.maximum(bx - x, by - y)
+    high = np.maximum(x2 - bx2, y2 - by2)
+    _emit(low > 0.01, "bounds", low, 0.01)
+    _emit(high > 0.01, "bounds", high, 0.01)
+
+    # Min alan / genişlik (%15 tolerans)
+    a_lim = min_a[rtype] * 0.85
+    _emit((min_a[rtype] > 0) & (area < a_lim), "min_area", area, a_lim)
+    min_dim = np.minimum(w, h)
+    w_lim = min_w[rtype] * 0.85
+    _emit((min_w[rtype] > 0) & (min_dim < w_lim), "min_width", min_dim, w_lim)
+
+    # Dış duvar erişimi: en yakın bina kenarına uzaklık
+    edge_dist = np.min(np.abs(np.stack([y - by, y2 - by2, x - bx, x2 - bx2])), axis=0)
+    _emit(needs_ext[rtype] & ~(edge_dist < 0.05), "exterior_access", edge_dist, 0.05)
+
+    # Çift kontrolleri: x aralığı (iç duvar boşluğu payıyla) kesişen adaylar
+    tol = WALL_GAP
+    a, b = _sweep_pairs(plan_idx, x, x2, tol)
+
+    # Çakışma (Rect.overlaps + 0.05 m² eşiği)
+    ov_w = np.minimum(x2[a], x2[b]) - np.maximum(x[a], x[b])
+    ov_h = np.minimum(y2[a], y2[b]) - np.maximum(y[a], y[b])
+    ov_area = np.maximum(ov_w, 0) * np.maximum(ov_h, 0)
+    ov = (ov_w > 0) & (ov_h > 0) & (ov_area > 0.05)
+    lo, hi = np.minimum(a[ov], b[ov]), np.maximum(a[ov], b[ov])
+    records.append((lo, "overlap", ov_area[ov], np.full(lo.shape, 0.05), local_idx[hi]))
+
+    # Bağlantı: Rect.shared_edge_length(tol=WALL_GAP) >= 0.7 olan bir komşu
+    x_touch = (np.abs(x2[a] - x[b]) < tol) | (np.abs(x2[b] - x[a]) < tol)
+    y_touch = (np.abs(y2[a] - y[b]) < tol) | (np.abs(y2[b] - y[a]) < tol)
+    shared = np.where(
+        x_touch, np.maximum(ov_h, 0), np.where(y_touch, np.maximum(ov_w, 0), 0.0),
+    )
+    best = np.zeros(len(x))
+    np.maximum.at(best, a, shared)
+    np.maximum.at(best, b, shared)
+    _emit(~always_connected[rtype] & (best < 0.7), "connectivity", best, 0.7)
+
+    rows, names, values, limits, others = zip(*records)
+    room = np.concatenate(rows).astype(np.int64)
+    code = np.concatenate([
+        np.full(len(r), VIOLATION_CODES.index(c), dtype=np.int8) for r, c in zip(rows, names)
+    ])
+    order = np.lexsort((code, room))
+    error_codes = np.array([c in _ERROR_CODES for c in VIOLATION_CODES])
+    return BatchValidation(
+        n_plans=len(plans),
+        plan=plan_idx[room[order]],
+        room=local_idx[room[order]],
+        other=np.concatenate(others).astype(np.int64)[order],
+        code=code[order],
+        value=np.concatenate(values)[order],
+        limit=np.concatenate(limits)[order],
+        is_error=error_codes[code[order]],
+    )
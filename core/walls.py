@@ -4,47 +4,45 @@ Oda sınırları belirlenmiş plan üzerinde:
 - Duvarları çiz
 - Kapıları yerleştir
 - Pencereleri yerleştir
+
+Duvar ağı: oda çifti başına üretilen bölme duvarları (partition_walls;
+iç duvar boşluğu ortasında, daireler arası / ortak alan sınırında taşıyıcı)
+(eksen, koordinat, kalınlık) gruplarında aralık birleşimiyle tek segmentte
+toplanır (merge_walls); build_wall_graph düğüm/kenar grafiği ve L/T/X
+birleşimlerini çıkarır.
+
+Açıklıklar (place_openings) tek geçişte, oda başına döngü yerine dizi
+işlemleriyle hesaplanır: dış cephe teması bina dikdörtgenine karşı tek
+karşılaştırma (facade_contact), kapı kenarları paylaşılan kenar matrisinden
+öncelik argmax'ı ile seçilir, pencere genişlikleri window_min_area_ratio'dan.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import numpy as np
+
 from .models import (
-    Rect, RoomType, PlacedRoom, FloorPlan,
+    Rect, RoomType, PlacedRoom, FloorPlan, CompassDirection,
     WallSegment, DoorPlacement, WindowPlacement, Point,
 )
 from .building_codes import BuildingCodes
-from .envelope import get_exterior_walls
-from .corridor import find_neighbors
+from .corridor import WALL_GAP, CIRCULATION, ROOTS, hop_distances
+from .fitness import facade_contact, ORIENTATION_TABLES, ROOM_TYPE_INDEX, PLAN_SIDES, EXTERIOR_TOL
 
 
-def add_walls_and_openings(plan: FloorPlan, codes: BuildingCodes) -> FloorPlan:
+def add_walls_and_openings(
+    plan: FloorPlan,
+    codes: BuildingCodes,
+    north_facing: CompassDirection | None = None,
+) -> FloorPlan:
     """
     Plana duvar, kapı ve pencere ekle.
     Yerinde günceller ve geri döndürür.
     """
-    building_rect = plan.building_rect
-
-    # 1. Duvarları oluştur
-    plan.walls = _generate_walls(plan.rooms, building_rect, codes)
-
-    # 2. Komşuluk grafiği
-    neighbors = find_neighbors(plan.rooms)
-
-    # Oda lookup
-    room_map = {r.room_id: r for r in plan.rooms}
-
-    # 3. Kapıları yerleştir
-    for room in plan.rooms:
-        if room.room_type in (RoomType.MERDIVEN, RoomType.ASANSOR):
-            continue
-
-        room.doors = _place_doors(room, neighbors, room_map, codes)
-
-    # 4. Pencereleri yerleştir
-    for room in plan.rooms:
-        room.windows = _place_windows(room, building_rect, codes)
-
-    return plan
+    plan.walls = _generate_walls(plan.rooms, plan.building_rect, codes)
+    return place_openings(plan, codes, north_facing)
 
 
 def _generate_walls(
@@ -52,10 +50,9 @@ def _generate_walls(
     building_rect: Rect,
     codes: BuildingCodes,
 ) -> list[WallSegment]:
-    """Tüm duvar segmentlerini oluştur."""
+    """Tüm duvar segmentlerini oluştur: dış duvarlar + bölme duvarları, birleştirilmiş."""
     walls: list[WallSegment] = []
     ow = codes.outer_wall
-    iw = codes.inner_wall
 
     # Dış duvarlar
     bx, by = building_rect.x, building_rect.y
@@ -70,204 +67,482 @@ def _generate_walls(
     # Sağ duvar (doğu)
     walls.append(WallSegment(start=Point(x=bx2, y=by), end=Point(x=bx2, y=by2), thickness=ow, is_exterior=True))
 
-    # İç duvarlar: odalar arası paylaşılan kenarlar
-    processed = set()
-    for i, ra in enumerate(rooms):
-        for j, rb in enumerate(rooms):
-            if i >= j:
-                continue
-            key = (min(ra.room_id, rb.room_id), max(ra.room_id, rb.room_id))
-            if key in processed:
-                continue
-
-            shared = ra.rect.shared_edge_length(rb.rect)
-            if shared < 0.1:
-                continue
-
-            processed.add(key)
-
-            # Paylaşılan kenarı bul
-            wall = _find_shared_wall(ra.rect, rb.rect, iw)
-            if wall:
-                walls.append(wall)
-
-    return walls
-
-
-def _find_shared_wall(a: Rect, b: Rect, thickness: float) -> WallSegment | None:
-    """İki dikdörtgen arasındaki paylaşılan duvarı bul."""
-    tol = 0.05
-
-    # Sağ-Sol temas (a'nın sağı b'nin solu)
-    if abs(a.x2 - b.x) < tol:
-        ys = max(a.y, b.y)
-        ye = min(a.y2, b.y2)
-        if ye > ys:
-            return WallSegment(
-                start=Point(x=a.x2, y=ys),
-                end=Point(x=a.x2, y=ye),
-                thickness=thickness,
-            )
-
-    # Sol-Sağ temas
-    if abs(b.x2 - a.x) < tol:
-        ys = max(a.y, b.y)
-        ye = min(a.y2, b.y2)
-        if ye > ys:
-            return WallSegment(
-                start=Point(x=a.x, y=ys),
-                end=Point(x=a.x, y=ye),
-                thickness=thickness,
-            )
-
-    # Üst-Alt temas (a'nın üstü b'nin altı)
-    if abs(a.y2 - b.y) < tol:
-        xs = max(a.x, b.x)
-        xe = min(a.x2, b.x2)
-        if xe > xs:
-            return WallSegment(
-                start=Point(x=xs, y=a.y2),
-                end=Point(x=xe, y=a.y2),
-                thickness=thickness,
-            )
-
-    # Alt-Üst temas
-    if abs(b.y2 - a.y) < tol:
-        xs = max(a.x, b.x)
-        xe = min(a.x2, b.x2)
-        if xe > xs:
-            return WallSegment(
-                start=Point(x=xs, y=a.y),
-                end=Point(x=xe, y=a.y),
-                thickness=thickness,
-            )
-
-    return None
-
-
-def _place_doors(
-    room: PlacedRoom,
-    neighbors: dict[str, list[str]],
-    room_map: dict[str, PlacedRoom],
-    codes: BuildingCodes,
-) -> list[DoorPlacement]:
-    """Odaya kapı yerleştir. En az 1 kapı, koridora veya komşuya açılır."""
-    doors: list[DoorPlacement] = []
-    door_width = codes.door_width(room.room_type)
-    room_neighbors = neighbors.get(room.room_id, [])
-
-    if not room_neighbors:
-        return doors
-
-    # Öncelik: koridora açılsın, yoksa en büyük komşuya
-    best_neighbor = None
-    best_shared = 0.0
-
-    for nid in room_neighbors:
-        neighbor = room_map.get(nid)
-        if not neighbor:
-            continue
-
-        shared = room.rect.shared_edge_length(neighbor.rect)
+    # İç duvarlar: oda temasları (iç duvar boşluğu dahil)
+    walls.extend(partition_walls(rooms, codes))
 
-        # Koridor tercih edilir
-        is_corridor = neighbor.room_type == RoomType.KORIDOR
-        priority = shared + (10.0 if is_corridor else 0.0)
+    return merge_walls(walls)
 
-        if priority > best_shared:
-            best_shared = priority
-            best_neighbor = neighbor
 
-    if best_neighbor:
-        door = _create_door_on_shared_wall(room, best_neighbor, door_width)
-        if door:
-            door.connects_to = best_neighbor.room_id
-            doors.append(door)
+MIN_WALL = 0.10     # Bundan kısa temaslar duvar sayılmaz (m)
 
-    return doors
 
+def partition_walls(rooms: list[PlacedRoom], codes: BuildingCodes) -> list[WallSegment]:
+    """
+    Odalar arası bölme duvarları, temas eden çift başına bir segment.
 
-def _create_door_on_shared_wall(
-    room: PlacedRoom,
-    neighbor: PlacedRoom,
-    door_width: float,
-) -> DoorPlacement | None:
-    """Paylaşılan duvarda kapı oluştur."""
-    tol = 0.05
-    a = room.rect
-    b = neighbor.rect
-    margin = 0.30  # Köşeden min mesafe
-
-    # Sağ kenar
-    if abs(a.x2 - b.x) < tol or abs(b.x2 - a.x) < tol:
-        ys = max(a.y, b.y) + margin
-        ye = min(a.y2, b.y2) - margin
-        if ye - ys >= door_width:
-            pos = (ys + ye) / 2
-            side = "east" if abs(a.x2 - b.x) < tol else "west"
-            return DoorPlacement(wall_side=side, position=pos, width=door_width)
-
-    # Üst/Alt kenar
-    if abs(a.y2 - b.y) < tol or abs(b.y2 - a.y) < tol:
-        xs = max(a.x, b.x) + margin
-        xe = min(a.x2, b.x2) - margin
-        if xe - xs >= door_width:
-            pos = (xs + xe) / 2
-            side = "north" if abs(a.y2 - b.y) < tol else "south"
-            return DoorPlacement(wall_side=side, position=pos, width=door_width)
-
-    return None
+    Temaslar iç duvar boşluğu toleransıyla (WALL_GAP) bulunur: motorlar
+    odaları iç duvar kalınlığı kadar aralıklı yerleştirir. Duvar ekseni iki
+    oda kenarının ortasıdır. Farklı daireler arası ve ortak alan sınırı
+    taşıyıcı duvardır (codes.carrier_wall), diğerleri iç duvar.
+    """
+    return [wall for _, _, wall in _partition_wall_pairs(rooms, codes)]
 
 
-def _place_windows(
-    room: PlacedRoom,
-    building_rect: Rect,
-    codes: BuildingCodes,
-) -> list[WindowPlacement]:
-    """Dış duvardaki odalara pencere yerleştir."""
-    if not codes.needs_window(room.room_type):
+def _partition_wall_pairs(
+    rooms: list[PlacedRoom], codes: BuildingCodes,
+) -> list[tuple[int, int, WallSegment]]:
+    """partition_walls, oda indisi çiftleriyle (i < j): PlanEditor çift başına tutar."""
+    if len(rooms) < 2:
         return []
+    side, lo, hi = contact_matrices(rooms)
+    i, j = np.nonzero(np.triu((side >= 0) & (hi - lo >= MIN_WALL), 1))
+    b = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float)
+    apt = np.array([r.apartment_id for r in rooms])
 
-    windows: list[WindowPlacement] = []
-    exterior_sides = get_exterior_walls(room.rect, building_rect)
+    s = side[i, j]
+    # PLAN_SIDES = (north, east, south, west): i'nin j'ye bakan kenarı ve j'nin karşı kenarı
+    coord = (b[i, np.array([3, 2, 1, 0])[s]] + b[j, np.array([1, 0, 3, 2])[s]]) / 2
+    ai, aj = apt[i], apt[j]
+    carrier = ((ai != aj) & (ai >= 0) & (aj >= 0)) | ((ai < 0) != (aj < 0))
+    thickness = np.where(carrier, codes.carrier_wall, codes.inner_wall)
+    return [
+        (a, c, _segment(axis, x, lo_, hi_, t, False))
+        for a, c, axis, x, lo_, hi_, t in zip(
+            i.tolist(), j.tolist(), (s % 2).tolist(), coord.tolist(),
+            lo[i, j].tolist(), hi[i, j].tolist(), thickness.tolist(),
+        )
+    ]
 
-    if not exterior_sides:
-        return []
 
-    # İlk dış duvara pencere koy
-    side = exterior_sides[0]
-    win_height = codes.window_standard_height
-    min_win_w = codes.window_min_width
+# ── Duvar Ağı ────────────────────────────────────────────────────────────────
+
+SNAP = 1e-3     # Koordinat eşleme hassasiyeti (m)
 
-    # Pencere genişliği: oda alanının %10'u / pencere yüksekliği, min 0.6m
-    required_area = room.area * codes.window_min_area_ratio
-    win_w = max(min_win_w, required_area / win_height)
 
-    # Duvar genişliğine göre sınırla
-    if side in ("north", "south"):
-        max_w = room.rect.w - 0.6  # Kenarlarda 30cm boşluk
-        pos = room.rect.cx
+def wall_arrays(walls: list[WallSegment]) -> tuple[np.ndarray, ...]:
+    """
+    Segment dizileri: axis (0 = yatay, 1 = düşey), sabit koordinat,
+    aralık uçları lo / hi, kalınlık, dış duvar bayrağı.
+    """
+    pts = np.array([(w.start.x, w.start.y, w.end.x, w.end.y) for w in walls], dtype=float).reshape(-1, 4)
+    axis = (np.abs(pts[:, 0] - pts[:, 2]) < SNAP).astype(np.int64)
+    coord = np.where(axis == 0, pts[:, 1], pts[:, 0])
+    a = np.where(axis == 0, pts[:, 0], pts[:, 1])
+    b = np.where(axis == 0, pts[:, 2], pts[:, 3])
+    thickness = np.array([w.thickness for w in walls], dtype=float)
+    exterior = np.array([w.is_exterior for w in walls], dtype=bool)
+    return axis, coord, np.minimum(a, b), np.maximum(a, b), thickness, exterior
+
+
+def _segment(axis: int, coord: float, lo: float, hi: float, thickness: float, exterior: bool) -> WallSegment:
+    if axis == 0:
+        start, end = Point(x=lo, y=coord), Point(x=hi, y=coord)
     else:
-        max_w = room.rect.h - 0.6
-        pos = room.rect.cy
-
-    win_w = min(win_w, max(min_win_w, max_w))
-
-    windows.append(WindowPlacement(
-        wall_side=side,
-        position=pos,
-        width=win_w,
-        height=win_height,
-    ))
-
-    # Balkon: ek pencere (kapı görevi de görür)
-    if len(exterior_sides) > 1 and room.room_type == RoomType.SALON:
-        side2 = exterior_sides[1]
-        windows.append(WindowPlacement(
-            wall_side=side2,
-            position=room.rect.cx if side2 in ("north", "south") else room.rect.cy,
-            width=min_win_w,
-            height=win_height,
+        start, end = Point(x=coord, y=lo), Point(x=coord, y=hi)
+    return WallSegment(start=start, end=end, thickness=thickness, is_exterior=exterior)
+
+
+def merge_intervals(key: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Anahtar grupları içinde aralık birleşimi (interval union).
+
+    key (m, k) satırları aynı olan aralıklar lo'ya göre sıralanır, örtüşen ya
+    da uç uca eklenenler birikimli maksimumla tek aralıkta toplanır. Grup
+    kaydırması sayesinde tüm gruplar tek np.maximum.accumulate ile işlenir.
+    Birleşik aralık başına (ilk girdinin indisi, lo, hi) döndürür.
+    """
+    _, group = np.unique(key, axis=0, return_inverse=True)
+    group = group.reshape(-1)
+    order = np.lexsort((lo, group))
+    group, lo, hi = group[order], lo[order], hi[order]
+
+    # Grupları ayrık eksen aralıklarına kaydır: birikimli maksimum gruplar arası sızmaz
+    shift = group * (hi.max() - lo.min() + 1.0)
+    reach = np.maximum.accumulate(hi + shift)
+    starts = np.ones(len(lo), dtype=bool)
+    starts[1:] = (group[1:] != group[:-1]) | (lo[1:] + shift[1:] > reach[:-1] + SNAP)
+    idx = np.flatnonzero(starts)
+    return order[idx], lo[idx], np.maximum.reduceat(hi, idx)
+
+
+def merge_walls(walls: list[WallSegment]) -> list[WallSegment]:
+    """
+    Eş doğrusal, örtüşen ya da uç uca eklenen segmentleri birleştir.
+
+    Gruplar (axis, koordinat, kalınlık, dış duvar), birleşim merge_intervals
+    ile. Eksene paralel olmayan segmentler olduğu gibi bırakılır.
+    """
+    if not walls:
+        return []
+    pts = np.array([(w.start.x, w.start.y, w.end.x, w.end.y) for w in walls], dtype=float)
+    ortho = (np.abs(pts[:, 0] - pts[:, 2]) < SNAP) | (np.abs(pts[:, 1] - pts[:, 3]) < SNAP)
+    skew = [w for w, ok in zip(walls, ortho) if not ok]
+    walls = [w for w, ok in zip(walls, ortho) if ok]
+    if not walls:
+        return skew
+
+    axis, coord, lo, hi, thickness, exterior = wall_arrays(walls)
+    first, run_lo, run_hi = merge_intervals(
+        np.stack([axis, np.round(coord / SNAP), np.round(thickness / SNAP), exterior], axis=1), lo, hi,
+    )
+    return [
+        _segment(int(axis[k]), float(coord[k]), float(a), float(b), float(thickness[k]), bool(exterior[k]))
+        for k, a, b in zip(first, run_lo, run_hi)
+    ] + skew
+
+
+# Birleşim kolları (bit maskesi)
+ARM_N, ARM_E, ARM_S, ARM_W = 1, 2, 4, 8
+
+
+@dataclass
+class WallGraph:
+    """Düzlemsel duvar ağı: düğümler birleşimler ve uçlardır."""
+    nodes: np.ndarray       # (k, 2) düğüm koordinatları
+    edges: np.ndarray       # (m, 2) düğüm indisi çiftleri
+    thickness: np.ndarray   # (m,) kenar kalınlığı
+    exterior: np.ndarray    # (m,) dış duvar
+    arms: np.ndarray        # (k,) ARM_* bit maskesi
+
+    @property
+    def degree(self) -> np.ndarray:
+        return np.array([bin(a).count("1") for a in self.arms.tolist()], dtype=np.int64)
+
+    @property
+    def l_junctions(self) -> np.ndarray:
+        """Köşe: iki dik kol."""
+        straight = (self.arms == ARM_N | ARM_S) | (self.arms == ARM_E | ARM_W)
+        return np.flatnonzero((self.degree == 2) & ~straight)
+
+    @property
+    def t_junctions(self) -> np.ndarray:
+        return np.flatnonzero(self.degree == 3)
+
+    @property
+    def x_junctions(self) -> np.ndarray:
+        return np.flatnonzero(self.degree == 4)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        d = self.nodes[self.edges[:, 1]] - self.nodes[self.edges[:, 0]]
+        return np.abs(d).sum(axis=1)
+
+
+def build_wall_graph(walls: list[WallSegment]) -> WallGraph:
+    """
+    Birleştirilmiş segmentlerden düzlemsel duvar grafiği.
+
+    Yatay ve düşey segmentlerin kesişimleri (tüm çiftler tek dizi
+    karşılaştırmasıyla) düğüm olur. İki duvarın yüzleri kalın olanın
+    kalınlığı içinde buluşuyorsa kesişim sayılır: iç duvarlar oda kenarında
+    biter, dış duvar ekseni ise bir duvar kalınlığı dışarıdadır. Segment
+    ucu bu tolerans içinde bir kesişime yakınsa uç kesişime taşınır
+    (uzatılır ya da taşan kısmı kırpılır).
+    Segmentler durak noktalarında kenarlara bölünür; kollar kenar
+    yönlerinden hesaplanır (2 dik kol = L, 3 = T, 4 = X).
+    """
+    walls = merge_walls(walls)
+    axis, coord, lo, hi, thickness, exterior = wall_arrays(walls)
+    h = np.flatnonzero(axis == 0)
+    v = np.flatnonzero(axis == 1)
+
+    tol = np.maximum(thickness[h][:, None], thickness[v][None, :]) + 0.01
+    vx, hy = coord[v][None, :], coord[h][:, None]
+    meet = (
+        (vx >= lo[h][:, None] - tol) & (vx <= hi[h][:, None] + tol)
+        & (hy >= lo[v][None, :] - tol) & (hy <= hi[v][None, :] + tol)
+    )
+    hi_idx, vi_idx = np.nonzero(meet)
+    # Segment başına duraklar (kendi ekseni boyunca konum) ve uç toleransı
+    stops: list[list[float]] = [[] for _ in walls]
+    snap: list[float] = [0.0] * len(walls)
+    for a, b, t in zip(h[hi_idx].tolist(), v[vi_idx].tolist(), tol[hi_idx, vi_idx].tolist()):
+        stops[a].append(float(coord[b]))
+        stops[b].append(float(coord[a]))
+        snap[a] = max(snap[a], t)
+        snap[b] = max(snap[b], t)
+
+    points: list[tuple[float, float]] = []
+    seg_edges: list[tuple[int, int, int]] = []
+    for k, extra in enumerate(stops):
+        s_lo, s_hi = float(lo[k]), float(hi[k])
+        if extra and abs(min(extra) - s_lo) <= snap[k]:
+            s_lo = min(extra)
+        if extra and abs(max(extra) - s_hi) <= snap[k]:
+            s_hi = max(extra)
+        along = sorted({round(t / SNAP) * SNAP for t in [s_lo, s_hi, *extra] if s_lo - SNAP <= t <= s_hi + SNAP})
+        base = len(points)
+        points.extend((t, coord[k]) if axis[k] == 0 else (coord[k], t) for t in along)
+        seg_edges.extend((base + i, base + i + 1, k) for i in range(len(along) - 1))
+
+    xy = np.round(np.array(points, dtype=float).reshape(-1, 2) / SNAP) * SNAP
+    nodes, inverse = np.unique(xy, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    raw = np.array(seg_edges, dtype=np.int64).reshape(-1, 3)
+    edges = inverse[raw[:, :2]]
+    keep = edges[:, 0] != edges[:, 1]
+    edges, seg = edges[keep], raw[keep, 2]
+
+    # Kol maskeleri: her kenar iki ucuna karşıt yönlerde kol ekler
+    d = nodes[edges[:, 1]] - nodes[edges[:, 0]]
+    horizontal = np.abs(d[:, 1]) < SNAP
+    pos = np.where(horizontal, d[:, 0], d[:, 1]) > 0
+    out_arm = np.where(horizontal, np.where(pos, ARM_E, ARM_W), np.where(pos, ARM_N, ARM_S))
+    in_arm = np.where(horizontal, np.where(pos, ARM_W, ARM_E), np.where(pos, ARM_S, ARM_N))
+    arms = np.zeros(len(nodes), dtype=np.int64)
+    np.bitwise_or.at(arms, edges[:, 0], out_arm)
+    np.bitwise_or.at(arms, edges[:, 1], in_arm)
+
+    return WallGraph(
+        nodes=nodes,
+        edges=edges,
+        thickness=thickness[seg],
+        exterior=exterior[seg],
+        arms=arms,
+    )
+
+
+# ── Açıklıklar (Kapı + Pencere) ──────────────────────────────────────────────
+
+# Kapısı olan odalar (dolaşım ve çekirdek kapısız / açık geçişli)
+DOOR_ROOMS = (
+    RoomType.SALON, RoomType.YATAK_ODASI, RoomType.ODA, RoomType.MUTFAK,
+    RoomType.BANYO, RoomType.TUVALET,
+)
+# Kapı hedefi önceliği (paylaşılan kenar uzunluğuna eklenir); salon yalnızca
+# dolaşım komşusu olmayan odalar için yedek hedeftir
+_DOOR_TARGET_BONUS = {
+    RoomType.KORIDOR_DAIRE: 200.0,
+    RoomType.ANTRE: 100.0,
+    RoomType.SALON: 0.0,
+}
+# connects_to etiketleri (şerit motoru kuralı)
+_DOOR_LABELS = {RoomType.KORIDOR_DAIRE: "koridor", RoomType.KORIDOR_BINA: "bina_koridoru"}
+
+DOOR_MARGIN = 0.30      # Kapı ile köşe arası min mesafe
+WINDOW_MARGIN = 0.30    # Pencere ile duvar ucu arası
+
+
+def contact_matrices(rooms: list[PlacedRoom], tol: float = WALL_GAP):
+    """
+    Tüm çiftler için i'nin j'ye bakan kenarı ve paylaşılan aralık:
+    side (n, n) PLAN_SIDES indisi (-1 = temas yok), lo / hi aralık uçları.
+    """
+    b = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float).reshape(-1, 4)
+    x, y, x2, y2 = b.T
+    y_lo = np.maximum(y[:, None], y[None, :])
+    y_hi = np.minimum(y2[:, None], y2[None, :])
+    x_lo = np.maximum(x[:, None], x[None, :])
+    x_hi = np.minimum(x2[:, None], x2[None, :])
+
+    side = np.full((len(rooms), len(rooms)), -1, dtype=np.int64)
+    lo = np.zeros_like(y_lo)
+    hi = np.zeros_like(y_lo)
+    # PLAN_SIDES = (north, east, south, west); sonra yazılan öncekini ezer
+    for k, touch, span_lo, span_hi in (
+        (0, np.abs(y[None, :] - y2[:, None]) < tol, x_lo, x_hi),
+        (2, np.abs(y[:, None] - y2[None, :]) < tol, x_lo, x_hi),
+        (1, np.abs(x[None, :] - x2[:, None]) < tol, y_lo, y_hi),
+        (3, np.abs(x[:, None] - x2[None, :]) < tol, y_lo, y_hi),
+    ):
+        hit = touch & (span_hi > span_lo)
+        side[hit] = k
+        lo[hit] = span_lo[hit]
+        hi[hit] = span_hi[hit]
+    np.fill_diagonal(side, -1)
+    return side, lo, hi
+
+
+def _door_priority(rooms: list[PlacedRoom], codes: BuildingCodes, span: np.ndarray) -> np.ndarray:
+    """
+    Kapı hedefi önceliği (n×n): bonus + paylaşılan uzunluk; kapı ve köşe
+    paylarına sığan kenar sıkışık olana (yalnızca kapı genişliği) tercih
+    edilir. Geçersiz çiftler -inf.
+    """
+    types = [r.room_type for r in rooms]
+    apt = np.array([r.apartment_id for r in rooms])
+    door_w = np.array([codes.door_width(t) for t in types])
+    needs_door = np.array([t in DOOR_ROOMS for t in types])
+    is_antre = np.array([t == RoomType.ANTRE for t in types])
+    is_hall = np.array([t == RoomType.KORIDOR_BINA for t in types])
+    bonus = np.array([_DOOR_TARGET_BONUS.get(t, -np.inf) for t in types])
+
+    fits = span >= door_w[:, None]
+    room_target = np.where(needs_door[:, None] & (apt[:, None] == apt[None, :]), bonus[None, :], -np.inf)
+    entry_target = np.where(is_antre[:, None] & is_hall[None, :], 0.0, -np.inf)
+    priority = np.maximum(room_target, entry_target) + span
+    priority += np.where(span >= door_w[:, None] + 2 * DOOR_MARGIN, 1000.0, 0.0)
+    priority = np.where(fits, priority, -np.inf)
+    np.fill_diagonal(priority, -np.inf)
+    return priority
+
+
+def _assign_doors(rooms: list[PlacedRoom], priority: np.ndarray, span: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Kapılar (oda, hedef) çiftleri; girişten erişilebilirliği koruyarak.
+
+    Turlar halinde her oda yalnızca ulaşılmış bir hedefe (kökten açık
+    geçişle varılan dolaşım alanı ya da kapısı atanmış oda) açılır.
+    Hiçbir oda ilerleyemezse, ulaşılamayan bir dolaşım adasına (ör. antreye
+    değmeyen daire koridoru) ulaşılmış bir komşu odadan ikinci kapı açılır.
+    Kalan odalar erişim gözetmeden en iyi hedefe bağlanır.
+    """
+    n = len(rooms)
+    types = [r.room_type for r in rooms]
+    circ = np.array([t in CIRCULATION for t in types])
+    apt = np.array([r.apartment_id for r in rooms])
+    allowed = (apt[:, None] == apt[None, :]) | (apt[:, None] < 0) | (apt[None, :] < 0)
+    passage = circ[:, None] & circ[None, :] & allowed & (span >= 0.7)
+    door_room = np.array([t in DOOR_ROOMS for t in types])
+
+    reached = hop_distances(passage, np.array([t in ROOTS for t in types])) >= 0
+    pending = door_room.copy()
+    doors: list[tuple[int, int]] = [
+        (i, int(j)) for i, j in enumerate(priority.argmax(axis=1))
+        if types[i] == RoomType.ANTRE and np.isfinite(priority[i, j])
+    ]
+    rows = np.arange(n)
+    while pending.any():
+        masked = np.where(pending[:, None] & reached[None, :], priority, -np.inf)
+        best = masked.argmax(axis=1)
+        ok = np.isfinite(masked[rows, best])
+        if ok.any():
+            doors.extend(zip(rows[ok].tolist(), best[ok].tolist()))
+            pending &= ~ok
+            reached |= ok
+            continue
+        # Dolaşım adası: ulaşılmış kapılı odadan ikinci kapı
+        bridge = (door_room & reached & ~pending)[:, None] & (circ & ~reached)[None, :]
+        bridge = np.where(bridge & allowed, priority, -np.inf)
+        i, j = np.unravel_index(bridge.argmax(), bridge.shape)
+        if not np.isfinite(bridge[i, j]):
+            break
+        doors.append((int(i), int(j)))
+        seed = reached.copy()
+        seed[j] = True
+        reached = hop_distances(passage, seed) >= 0
+
+    best = priority.argmax(axis=1)
+    doors.extend(
+        (i, int(best[i])) for i in np.flatnonzero(pending).tolist()
+        if np.isfinite(priority[i, best[i]])
+    )
+    return doors
+
+
+def place_openings(
+    plan: FloorPlan,
+    codes: BuildingCodes,
+    north_facing: CompassDirection | None = None,
+) -> FloorPlan:
+    """
+    Tüm odaların kapı ve pencerelerini tek geçişte yeniden yerleştir (yerinde).
+
+    Kapılar: DOOR_ROOMS odaları aynı dairedeki daire koridoruna, yoksa
+    antreye, o da yoksa salona açılır (bkz. _assign_doors); antre bina
+    koridoruna açılır. Kapı paylaşılan aralığın ortasındadır. Pencereler:
+    pencere gerektiren odalarda kapı olmayan dış cephelerden yönlenme
+    tablosunda (north_facing verilirse) en iyi, yoksa en uzun olanına;
+    genişlik oda alanı × window_min_area_ratio / yükseklik; sığmayan kısım
+    sıradaki cepheye taşınır. Salon ikinci bir dış cepheye ek pencere alır.
+    """
+    rooms = plan.rooms
+    if not rooms:
+        return plan
+
+    side, lo, hi = contact_matrices(rooms)
+    span = np.where(side >= 0, hi - lo, 0.0)
+    priority = _door_priority(rooms, codes, span)
+
+    door_sides = np.zeros((len(rooms), len(PLAN_SIDES)), dtype=bool)
+    for room in rooms:
+        room.doors = []
+    for i, j in _assign_doors(rooms, priority, span):
+        other = rooms[j]
+        door_sides[i, side[i, j]] = True
+        rooms[i].doors.append(DoorPlacement(
+            wall_side=PLAN_SIDES[side[i, j]],
+            position=float((lo[i, j] + hi[i, j]) / 2),
+            width=codes.door_width(rooms[i].room_type),
+            swing_inside=True,
+            connects_to=_DOOR_LABELS.get(other.room_type, other.room_id),
         ))
 
-    return windows
+    for room, windows in zip(rooms, window_placements(rooms, plan.building_rect, codes, north_facing, door_sides)):
+        room.windows = windows
+    return plan
+
+
+def window_placements(
+    rooms: list[PlacedRoom],
+    building_rect: Rect,
+    codes: BuildingCodes,
+    north_facing: CompassDirection | None = None,
+    door_sides: np.ndarray | None = None,
+) -> list[list[WindowPlacement]]:
+    """
+    Odaların pencereleri (vektörel cephe seçimi ve boyutlandırma).
+    door_sides (n, 4): kapı bulunan kenarlar, pencere almaz.
+
+    Gerekli genişlik (window_min_area_ratio) sıralı cephelere dağıtılır:
+    bir cepheye sığmayan kısım sıradakine taşınır; yalnızca cephe
+    kalmadığında pencere alanı eksik kalır.
+    """
+    n = len(rooms)
+    if n == 0:
+        return []
+    bounds = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float)
+    facades = facade_contact(bounds, building_rect, tol=EXTERIOR_TOL)      # (n, 4)
+    if door_sides is not None:
+        facades &= ~door_sides
+    needs = np.array([codes.needs_window(r.room_type) for r in rooms])
+    facades &= needs[:, None]
+
+    w = bounds[:, 2] - bounds[:, 0]
+    h = bounds[:, 3] - bounds[:, 1]
+    side_len = np.stack([w, h, w, h], axis=1)                              # PLAN_SIDES sırası
+    if north_facing is not None:
+        type_idx = np.array([ROOM_TYPE_INDEX[r.room_type] for r in rooms])
+        rank = ORIENTATION_TABLES[north_facing][type_idx] * 1000.0 + side_len
+    else:
+        rank = side_len
+    rank = np.where(facades, rank, -np.inf)
+    order = np.argsort(-rank, axis=1, kind="stable")
+
+    height = codes.window_standard_height
+    min_w = codes.window_min_width
+    areas = np.array([r.area for r in rooms])
+    required = np.maximum(min_w, areas * codes.window_min_area_ratio / height)
+    centres = np.stack([(bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2], axis=1)
+
+    capacity = np.maximum(min_w, side_len - 2 * WINDOW_MARGIN)
+
+    result: list[list[WindowPlacement]] = []
+    for i, room in enumerate(rooms):
+        # Salon en az iki cepheden ışık alır; diğer odalar alan yetene kadar
+        min_windows = 2 if room.room_type == RoomType.SALON else 1
+        windows = []
+        remaining = required[i]
+        for k in order[i].tolist():
+            if not facades[i, k] or (remaining <= 1e-9 and len(windows) >= min_windows):
+                break
+            # Eksik alan sıradaki cepheye taşınır; cephe kalmazsa eksik kalır
+            width = min(max(remaining, min_w), capacity[i, k])
+            remaining -= width
+            windows.append(WindowPlacement(
+                wall_side=PLAN_SIDES[k],
+                position=float(centres[i, 0] if k in (0, 2) else centres[i, 1]),
+                width=float(width),
+                height=height,
+            ))
+        result.append(windows)
+    return result
+
+
+def _place_windows(
+    room: PlacedRoom,
+    building_rect: Rect,
+    codes: BuildingCodes,
+) -> list[WindowPlacement]:
+    """Tek oda için pencereler (window_placements)."""
+    return window_placements([room], building_rect, codes)[0]
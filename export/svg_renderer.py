@@ -17,7 +17,8 @@ from matplotlib.figure import Figure
 import numpy as np
 
 from core.models import FloorPlan, PlacedRoom, RoomType, ROOM_DISPLAY_NAMES
-from core.furniture import get_room_furniture, FurnitureItem
+from core.furniture import room_furniture, FurnitureItem
+from core.raster import EgressResult
 
 
 # ── Renk paleti (referans görsele uygun) ──────────────────────────────────────
@@ -49,8 +50,12 @@ def render_plan(
     plan: FloorPlan,
     figsize: tuple[float, float] = (14, 10),
     title: str | None = None,
+    egress: EgressResult | None = None,
 ) -> Figure:
-    """FloorPlan'ı mimari kalitede matplotlib Figure olarak çiz."""
+    """
+    FloorPlan'ı mimari kalitede matplotlib Figure olarak çiz.
+    egress verilirse oda zeminlerinin üstüne kaçış mesafesi ısı haritası eklenir.
+    """
     fig, ax = plt.subplots(1, 1, figsize=figsize)
     br = plan.building_rect
     ow = 0.25  # dış duvar kalınlığı
@@ -70,6 +75,10 @@ def render_plan(
         )
         ax.add_patch(room_patch)
 
+    # 2b. Kaçış mesafesi katmanı
+    if egress is not None:
+        _draw_egress_heatmap(fig, ax, egress)
+
     # 3. İç duvarlar (kalın çizgiler)
     _draw_inner_walls(ax, plan)
 
@@ -93,8 +102,7 @@ def render_plan(
                 _draw_elevator_symbol(ax, room.rect)
             continue
 
-        furniture = get_room_furniture(room.room_type, room.rect.w, room.rect.h)
-        for item in furniture:
+        for item in room_furniture(room.room_type, room.rect.w, room.rect.h):
             _draw_furniture(ax, room.rect, item)
 
     # 7. Etiketler
@@ -136,6 +144,25 @@ def render_plan_to_bytes(plan: FloorPlan, fmt: str = "png", **kwargs) -> bytes:
     return buf.getvalue()
 
 
+# ── Kaçış Mesafesi ────────────────────────────────────────────────────────────
+
+def _draw_egress_heatmap(fig, ax, egress: EgressResult):
+    """Merdivene yürüme mesafesi; sınırı aşan bölge çizgiyle ayrılır."""
+    raster = egress.raster
+    heat = egress.heatmap
+    im = ax.imshow(
+        heat, origin="lower", extent=raster.extent, cmap="RdYlGn_r",
+        vmin=0, vmax=egress.limit, alpha=0.55, interpolation="nearest", zorder=1.5,
+    )
+    if np.nanmax(heat, initial=0) > egress.limit:
+        h, w = heat.shape
+        xs = raster.x0 + (np.arange(w) + 0.5) * raster.cell
+        ys = raster.y0 + (np.arange(h) + 0.5) * raster.cell
+        ax.contour(xs, ys, np.nan_to_num(heat), levels=[egress.limit],
+                   colors="#B22222", linewidths=1.2, linestyles="--", zorder=1.6)
+    fig.colorbar(im, ax=ax, shrink=0.6, pad=0.02, label="Kaçış mesafesi (m)")
+
+
 # ── Duvarlar ──────────────────────────────────────────────────────────────────
 
 def _draw_thick_walls_outer(ax, br, thickness: float):
@@ -156,90 +183,30 @@ def _draw_thick_walls_outer(ax, br, thickness: float):
 def _draw_inner_walls(ax, plan: FloorPlan):
     """
     İç duvarları kalın dolgulu dikdörtgenler olarak çiz.
-    Gap-aware: odalar arası iw boşluğunu da duvar olarak çizer.
-    Daireler arası duvarlar daha kalın (taşıyıcı duvar).
+    Kaynak plan.walls (walls._generate_walls): eksen odalar arası iç duvar
+    boşluğunun ortasında, daireler arası / ortak alan sınırı taşıyıcı
+    duvar kalınlığında. Metraj ve düzenleyici aynı segmentleri kullanır.
     """
-    drawn = set()
-    rooms = plan.rooms
     br = plan.building_rect
     ow = 0.25  # dış duvar kalınlığı
     iw = 0.15  # iç duvar kalınlığı
-    cw = 0.20  # taşıyıcı duvar (daireler arası / ortak alan sınırı)
-    gap_tol = iw + 0.12  # Odalar arası bu mesafede ise duvar çiz
-
-    for i, ra in enumerate(rooms):
-        for j, rb in enumerate(rooms):
-            if i >= j:
-                continue
-            key = (min(ra.room_id, rb.room_id), max(ra.room_id, rb.room_id))
-            if key in drawn:
-                continue
-
-            a, b = ra.rect, rb.rect
-
-            # Duvar kalınlığı: farklı daireler arası daha kalın
-            diff_apt = (ra.apartment_id != rb.apartment_id
-                        and ra.apartment_id >= 0 and rb.apartment_id >= 0)
-            common_boundary = (ra.apartment_id == -1) != (rb.apartment_id == -1)
-            thickness = cw if (diff_apt or common_boundary) else iw
-
-            # --- Dikey duvar (odalar yan yana, x yönünde bitişik) ---
-
-            # a'nın sağ kenarı ~ b'nin sol kenarı
-            dx1 = b.x - a.x2
-            if -0.05 <= dx1 < gap_tol:
-                ys, ye = max(a.y, b.y), min(a.y2, b.y2)
-                if ye - ys > 0.1:
-                    cx = (a.x2 + b.x) / 2
-                    drawn.add(key)
-                    ax.add_patch(patches.Rectangle(
-                        (cx - thickness / 2, ys), thickness, ye - ys,
-                        fc=WALL_COLOR, ec="none", zorder=2,
-                    ))
-                    continue
-
-            # b'nin sağ kenarı ~ a'nın sol kenarı
-            dx2 = a.x - b.x2
-            if -0.05 <= dx2 < gap_tol:
-                ys, ye = max(a.y, b.y), min(a.y2, b.y2)
-                if ye - ys > 0.1:
-                    cx = (b.x2 + a.x) / 2
-                    drawn.add(key)
-                    ax.add_patch(patches.Rectangle(
-                        (cx - thickness / 2, ys), thickness, ye - ys,
-                        fc=WALL_COLOR, ec="none", zorder=2,
-                    ))
-                    continue
-
-            # --- Yatay duvar (odalar üst üste, y yönünde bitişik) ---
-
-            # a'nın üst kenarı ~ b'nin alt kenarı
-            dy1 = b.y - a.y2
-            if -0.05 <= dy1 < gap_tol:
-                xs, xe = max(a.x, b.x), min(a.x2, b.x2)
-                if xe - xs > 0.1:
-                    cy = (a.y2 + b.y) / 2
-                    drawn.add(key)
-                    ax.add_patch(patches.Rectangle(
-                        (xs, cy - thickness / 2), xe - xs, thickness,
-                        fc=WALL_COLOR, ec="none", zorder=2,
-                    ))
-                    continue
-
-            # b'nin üst kenarı ~ a'nın alt kenarı
-            dy2 = a.y - b.y2
-            if -0.05 <= dy2 < gap_tol:
-                xs, xe = max(a.x, b.x), min(a.x2, b.x2)
-                if xe - xs > 0.1:
-                    cy = (b.y2 + a.y) / 2
-                    drawn.add(key)
-                    ax.add_patch(patches.Rectangle(
-                        (xs, cy - thickness / 2), xe - xs, thickness,
-                        fc=WALL_COLOR, ec="none", zorder=2,
-                    ))
+
+    for wall in plan.walls:
+        if wall.is_exterior:
+            continue
+        t = wall.thickness
+        x0, x1 = sorted((wall.start.x, wall.end.x))
+        y0, y1 = sorted((wall.start.y, wall.end.y))
+        if y1 - y0 < x1 - x0:
+            # Yatay duvar
+            rect = (x0, y0 - t / 2), x1 - x0, t
+        else:
+            # Dikey duvar
+            rect = (x0 - t / 2, y0), t, y1 - y0
+        ax.add_patch(patches.Rectangle(*rect, fc=WALL_COLOR, ec="none", zorder=2))
 
     # Oda kenar duvarları: bina iç sınırına değmeyen kenarlarda duvar çiz
-    _draw_room_edge_walls(ax, rooms, br, ow, iw)
+    _draw_room_edge_walls(ax, plan.rooms, br, ow, iw)
 
 
 def _draw_room_edge_walls(ax, rooms, br, ow, iw):
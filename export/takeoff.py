@@ -0,0 +1,341 @@
+"""
+Metraj (quantity takeoff): duvar, kapı, pencere ve alan miktarları.
+
+Tüm alternatifler tek seferde, plan dizileri üzerinde NumPy indirgemeleriyle
+hesaplanır: odalar (plan, daire) anahtarına göre bincount ile toplanır,
+duvarlar planın birleştirilmiş duvar ağından (plan.walls) alınıp iki
+yanındaki odalara göre daireye / ortak alana atanır.
+Satırlar daire, ortak alan ve plan toplamı kapsamındadır; CSV / JSON olarak
+dışa aktarılır.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from core.models import FloorPlan
+from core.building_codes import BuildingCodes
+from core.corridor import CIRCULATION, CORE, WALL_GAP
+from core.fitness import facade_contact
+from core.walls import merge_intervals, wall_arrays, SNAP, EXTERIOR_TOL
+
+
+# Duvar türleri (sütun sırası)
+WALL_KINDS = ("exterior", "inner", "carrier")
+EXTERIOR, INNER, CARRIER = range(3)
+
+TOTAL = -2              # Plan toplamı satırının kapsam anahtarı
+
+
+@dataclass
+class TakeoffRow:
+    """Bir kapsamın (daire / ortak alan / plan toplamı) metrajı."""
+    plan_id: str
+    floor: int
+    apartment_id: int | None     # -1 = ortak alan, None = plan toplamı
+    wall_lengths: dict[str, float]   # "<tür>_<kalınlık cm>cm" → uzunluk (m)
+    wall_areas: dict[str, float]     # aynı anahtarlar → alan (m², kat yüksekliği ile)
+    doors: int
+    door_area: float
+    windows: int
+    window_area: float
+    net_area: float
+    gross_area: float
+    circulation_area: float
+    core_area: float
+
+    @property
+    def scope(self) -> str:
+        if self.apartment_id is None:
+            return "Toplam"
+        if self.apartment_id < 0:
+            return "Ortak alan"
+        return f"Daire {self.apartment_id + 1}"
+
+    @property
+    def circulation_share(self) -> float:
+        return self.circulation_area / self.gross_area if self.gross_area > 0 else 0.0
+
+    @property
+    def core_share(self) -> float:
+        return self.core_area / self.gross_area if self.gross_area > 0 else 0.0
+
+    def as_dict(self) -> dict:
+        """Düz sözlük (CSV / JSON satırı)."""
+        row = {
+            "plan_id": self.plan_id,
+            "floor": self.floor,
+            "scope": self.scope,
+        }
+        for key in sorted(self.wall_lengths, key=_wall_key_order):
+            row[f"wall_{key}_m"] = round(self.wall_lengths[key], 2)
+            row[f"wall_{key}_m2"] = round(self.wall_areas[key], 2)
+        row.update({
+            "doors": self.doors,
+            "door_area_m2": round(self.door_area, 2),
+            "windows": self.windows,
+            "window_area_m2": round(self.window_area, 2),
+            "net_area_m2": round(self.net_area, 2),
+            "gross_area_m2": round(self.gross_area, 2),
+            "circulation_area_m2": round(self.circulation_area, 2),
+            "core_area_m2": round(self.core_area, 2),
+            "circulation_share": round(self.circulation_share, 4),
+            "core_share": round(self.core_share, 4),
+        })
+        return row
+
+
+def _wall_key(kind: int, thickness: float) -> str:
+    return f"{WALL_KINDS[kind]}_{round(thickness * 100)}cm"
+
+
+def _wall_key_order(key: str) -> tuple[int, str]:
+    kind, cm = key.rsplit("_", 1)
+    return WALL_KINDS.index(kind), cm.zfill(8)
+
+
+# ── Duvarlar ─────────────────────────────────────────────────────────────────
+
+def _plan_walls(plan: FloorPlan) -> np.ndarray:
+    """
+    Plan duvarları (m, 7): axis, koordinat, lo, hi, kalınlık, tür, sahip.
+
+    Kaynak birleştirilmiş plan.walls (walls._generate_walls / PlanEditor);
+    çizim ve düzenleyiciyle aynı segmentler. Bir bölme duvarının yanındaki
+    odalar, yüzü eksenden en fazla iç duvar boşluğunun yarısı uzakta olup
+    segmentle örtüşenlerdir. İki yanında karşılıklı farklı daireler (ya da
+    daire ve ortak alan) olan segment taşıyıcıdır ve ortak alana (-1)
+    yazılır. İç duvar segmenti eş doğrusal birkaç dairenin duvarını
+    birleştirmiş olabilir: her daireye yanındaki odaların kapladığı aralık
+    (merge_intervals) yazılır. Dış duvarlar yalnızca plan toplamına.
+    """
+    walls = plan.walls
+    if not walls:
+        return np.zeros((0, 7))
+    axis, coord, lo, hi, thickness, exterior = wall_arrays(walls)
+    rooms = plan.rooms
+    b = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float).reshape(-1, 4)
+    apt = np.array([r.apartment_id for r in rooms])
+
+    # Segment × oda: segment boyunca örtüşme ve eksene dik yüzler
+    horizontal = (axis == 0)[:, None]
+    seg_lo = np.maximum(np.where(horizontal, b[None, :, 0], b[None, :, 1]), lo[:, None])
+    seg_hi = np.minimum(np.where(horizontal, b[None, :, 2], b[None, :, 3]), hi[:, None])
+    tol = WALL_GAP / 2 + SNAP
+    on = (seg_hi - seg_lo > SNAP) & ~exterior[:, None]
+    below = on & (np.abs(np.where(horizontal, b[None, :, 3], b[None, :, 2]) - coord[:, None]) <= tol)
+    above = on & (np.abs(np.where(horizontal, b[None, :, 1], b[None, :, 0]) - coord[:, None]) <= tol)
+
+    # Taşıyıcı: iki yandaki farklı kapsamlı odalar segment üzerinde karşılıklı
+    overlap = np.minimum(seg_hi[:, :, None], seg_hi[:, None, :]) - np.maximum(seg_lo[:, :, None], seg_lo[:, None, :])
+    facing = below[:, :, None] & above[:, None, :] & (apt[:, None] != apt[None, :]) & (overlap > SNAP)
+    carrier = facing.any(axis=(1, 2))
+
+    whole = exterior | carrier
+    rows = [np.stack([
+        axis[whole], coord[whole], lo[whole], hi[whole], thickness[whole],
+        np.where(exterior[whole], EXTERIOR, CARRIER), np.where(exterior[whole], TOTAL, -1),
+    ], axis=1)]
+    seg, room = np.nonzero((below | above) & ~whole[:, None])
+    if len(seg):
+        first, run_lo, run_hi = merge_intervals(
+            np.stack([seg, apt[room]], axis=1), seg_lo[seg, room], seg_hi[seg, room],
+        )
+        k, owner = seg[first], apt[room[first]]
+        rows.append(np.stack([
+            axis[k], coord[k], run_lo, run_hi, thickness[k], np.full(len(k), INNER), owner,
+        ], axis=1))
+    return np.concatenate(rows).astype(float)
+
+
+def _wall_totals(plans: list[FloorPlan]) -> dict[tuple[int, int], dict[tuple[int, float], float]]:
+    """
+    (plan, kapsam) → {(tür, kalınlık): uzunluk}. Tüm planların duvarları
+    tek dizide; uzunluklar (plan, kapsam, tür, kalınlık) başına bincount ile
+    toplanır.
+    """
+    parts = []
+    for p, plan in enumerate(plans):
+        w = _plan_walls(plan)
+        parts.append(np.column_stack([np.full(len(w), p), w]))
+    segs = np.concatenate(parts) if parts else np.zeros((0, 8))
+    if len(segs) == 0:
+        return {}
+
+    plan_idx, _, _, lo, hi, thickness, kind, owner = segs.T
+    key = np.stack([plan_idx, owner, kind, np.round(thickness / SNAP)], axis=1)
+    groups, inverse = np.unique(key, axis=0, return_inverse=True)
+    length = np.bincount(inverse.reshape(-1), weights=hi - lo, minlength=len(groups))
+
+    totals: dict[tuple[int, int], dict[tuple[int, float], float]] = {}
+    for (p, scope, k, t), value in zip(groups.tolist(), length.tolist()):
+        wall = (int(k), round(t * SNAP, 3))
+        for target in {int(scope), TOTAL}:
+            bucket = totals.setdefault((int(p), target), {})
+            bucket[wall] = bucket.get(wall, 0.0) + value
+    return totals
+
+
+# ── Odalar ───────────────────────────────────────────────────────────────────
+
+# Oda başına sütunlar
+_ROOM_COLUMNS = (
+    "doors", "door_area", "windows", "window_area", "net_area", "gross_area",
+    "circulation_area", "core_area", "facade",
+)
+
+
+def _room_table(plans: list[FloorPlan], codes: BuildingCodes) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tüm planların odaları: plan indisi, daire, (n, len(_ROOM_COLUMNS)) miktarlar."""
+    plan_idx, apt, rows = [], [], []
+    for p, plan in enumerate(plans):
+        rooms = plan.rooms
+        if not rooms:
+            continue
+        bounds = np.array([(r.rect.x, r.rect.y, r.rect.x2, r.rect.y2) for r in rooms], dtype=float)
+        w, h = bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1]
+        # Daire dış duvarı: odaların cephe teması (iç yüz) uzunluğu, PLAN_SIDES sırası
+        facade = (facade_contact(bounds, plan.building_rect, tol=EXTERIOR_TOL) * np.stack([w, h, w, h], axis=1)).sum(axis=1)
+        gross = w * h
+        circ = np.array([r.room_type in CIRCULATION for r in rooms])
+        core = np.array([r.room_type in CORE for r in rooms])
+        rows.append(np.column_stack([
+            [len(r.doors) for r in rooms],
+            [sum(d.width for d in r.doors) * codes.door_height(r.room_type) for r in rooms],
+            [len(r.windows) for r in rooms],
+            [sum(win.width * win.height for win in r.windows) for r in rooms],
+            [r.area for r in rooms],
+            gross,
+            np.where(circ, gross, 0.0),
+            np.where(core, gross, 0.0),
+            facade,
+        ]))
+        plan_idx.extend([p] * len(rooms))
+        apt.extend(r.apartment_id for r in rooms)
+    if not rows:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros((0, len(_ROOM_COLUMNS)))
+    return np.array(plan_idx), np.array(apt), np.concatenate(rows).astype(float)
+
+
+def _grouped_sums(keys: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """keys (n, k) satır grupları için values (n, c) sütun toplamları."""
+    groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    sums = np.stack([
+        np.bincount(inverse, weights=values[:, c], minlength=len(groups)) for c in range(values.shape[1])
+    ], axis=1)
+    return groups, sums
+
+
+# ── Metraj ───────────────────────────────────────────────────────────────────
+
+def compute_takeoff(
+    plans: Sequence[FloorPlan],
+    codes: BuildingCodes,
+    floors: Sequence[int] | None = None,
+) -> list[TakeoffRow]:
+    """
+    Planların metrajı: plan başına daire satırları, ortak alan ve toplam.
+
+    - Duvar uzunlukları tür ve kalınlığa göre; alan = uzunluk × kat
+      yüksekliği (brüt, açıklıklar düşülmeden). Daire satırında dış duvar
+      odaların cephe teması uzunluğu, toplam satırında planın dış duvar
+      segmentleridir (bina çevresi). Taşıyıcı duvarlar ortak alana yazılır.
+    - Kapı / pencere adet ve alanları, net / brüt oda alanları, dolaşım
+      (antre, koridorlar) ve çekirdek (merdiven, asansör) payları.
+
+    floors verilirse her plan bu katların her biri için (normal kat)
+    tekrarlanır; verilmezse plan.floor kullanılır. Hesap plan başına bir kez
+    yapılır.
+    """
+    plans = list(plans)
+    height = codes.floor_height
+    walls = _wall_totals(plans)
+    plan_idx, apt, values = _room_table(plans, codes)
+
+    by_scope, scope_sums = _grouped_sums(np.stack([plan_idx, apt], axis=1), values)
+    by_plan, plan_sums = _grouped_sums(plan_idx[:, None], values)
+    sums: dict[tuple[int, int], np.ndarray] = {
+        (int(p), int(a)): s for (p, a), s in zip(by_scope.tolist(), scope_sums)
+    }
+    sums.update({(int(p), TOTAL): s for (p,), s in zip(by_plan.tolist(), plan_sums)})
+
+    col = {name: k for k, name in enumerate(_ROOM_COLUMNS)}
+    rows: list[TakeoffRow] = []
+    for p, plan in enumerate(plans):
+        scopes = sorted(a for (q, a) in sums if q == p and a >= 0) + [-1, TOTAL]
+        plan_rows = []
+        for scope in scopes:
+            s = sums.get((p, scope), np.zeros(len(_ROOM_COLUMNS)))
+            lengths = dict(walls.get((p, scope), {}))
+            if scope != TOTAL and s[col["facade"]] > 0:
+                lengths[(EXTERIOR, codes.outer_wall)] = float(s[col["facade"]])
+            wall_lengths = {_wall_key(k, t): v for (k, t), v in lengths.items()}
+            plan_rows.append(TakeoffRow(
+                plan_id=plan.plan_id,
+                floor=plan.floor,
+                apartment_id=None if scope == TOTAL else scope,
+                wall_lengths=wall_lengths,
+                wall_areas={key: v * height for key, v in wall_lengths.items()},
+                doors=int(s[col["doors"]]),
+                door_area=float(s[col["door_area"]]),
+                windows=int(s[col["windows"]]),
+                window_area=float(s[col["window_area"]]),
+                net_area=float(s[col["net_area"]]),
+                gross_area=float(s[col["gross_area"]]),
+                circulation_area=float(s[col["circulation_area"]]),
+                core_area=float(s[col["core_area"]]),
+            ))
+        if floors is None:
+            rows.extend(plan_rows)
+        else:
+            rows.extend(replace(r, floor=f) for f in floors for r in plan_rows)
+    return rows
+
+
+# ── Dışa aktarma ─────────────────────────────────────────────────────────────
+
+def _columns(rows: list[dict]) -> list[str]:
+    """Tüm satırların sütunları; duvar sütunları tür ve kalınlığa göre sıralı."""
+    keys: list[str] = []
+    for row in rows:
+        keys.extend(k for k in row if k not in keys)
+    wall = sorted((k for k in keys if k.startswith("wall_")),
+                  key=lambda k: (_wall_key_order(k[5:].rsplit("_", 1)[0]), k.endswith("m2")))
+    return keys[:3] + wall + [k for k in keys[3:] if not k.startswith("wall_")]
+
+
+def takeoff_to_csv(rows: Sequence[TakeoffRow], filepath: str | Path | None = None) -> bytes | None:
+    """
+    Metraj satırlarını CSV'ye aktar (eksik duvar sütunları 0).
+    filepath verilirse dosyaya yazar, verilmezse bytes döndürür.
+    """
+    dicts = [r.as_dict() for r in rows]
+    stream = io.StringIO()
+    writer = csv.DictWriter(stream, fieldnames=_columns(dicts), restval=0)
+    writer.writeheader()
+    writer.writerows(dicts)
+    data = stream.getvalue().encode("utf-8")
+    if filepath:
+        Path(filepath).write_bytes(data)
+        return None
+    return data
+
+
+def takeoff_to_json(rows: Sequence[TakeoffRow], filepath: str | Path | None = None) -> bytes | None:
+    """
+    Metraj satırlarını JSON listesine aktar.
+    filepath verilirse dosyaya yazar, verilmezse bytes döndürür.
+    """
+    data = json.dumps([r.as_dict() for r in rows], ensure_ascii=False, indent=2).encode("utf-8")
+    if filepath:
+        Path(filepath).write_bytes(data)
+        return None
+    return data
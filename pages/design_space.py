@@ -0,0 +1,108 @@
+"""
+Tasarım Uzayı Sayfası - Ayak izi boyutlarına göre verimlilik haritası
+Uzun kenar × kısa kenar ızgarasında net/brüt, daire alanı ve uygunluk.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from core.models import RoomCountInput
+from core.building_codes import BuildingCodes
+from core.design_space import explore_design_space
+
+st.set_page_config(page_title="Tasarım Uzayı", page_icon="🗺️", layout="wide")
+
+st.title("🗺️ Tasarım Uzayı")
+st.caption(
+    "Uç çekirdekli çift yüklü koridor geometrisi tüm ızgara için tek seferde "
+    "hesaplanır; taralı hücreler ön kontrolden (min alan/genişlik) geçemez."
+)
+
+codes = BuildingCodes()
+
+# ── Girdiler ─────────────────────────────────────────────────────────────────
+
+with st.sidebar:
+    st.header("Izgara")
+    long_min, long_max = st.slider("Uzun kenar (m)", 10.0, 120.0, (20.0, 80.0), step=1.0)
+    short_min, short_max = st.slider("Kısa kenar (m)", 8.0, 40.0, (10.0, 30.0), step=1.0)
+    step = st.select_slider("Adım (m)", options=[0.1, 0.25, 0.5, 1.0], value=0.25)
+    apts_max = st.number_input("En fazla kat başı daire", min_value=1, max_value=20, value=8)
+
+    st.header("Program")
+    num_floors = st.number_input("Toplam kat (zemin dahil)", min_value=1, max_value=30, value=5)
+    has_elevator = st.checkbox("Asansör", value=True)
+    room_counts = RoomCountInput(
+        salon=st.number_input("Salon", min_value=0, max_value=5, value=1),
+        yatak_odasi=st.number_input("Yatak Odası", min_value=0, max_value=10, value=2),
+        mutfak=st.number_input("Mutfak", min_value=0, max_value=3, value=1),
+        banyo=st.number_input("Banyo", min_value=0, max_value=5, value=1),
+        tuvalet=st.number_input("WC", min_value=0, max_value=5, value=1),
+    )
+
+longs = np.arange(long_min, long_max + step / 2, step)
+shorts = np.arange(short_min, short_max + step / 2, step)
+apts = np.arange(1, int(apts_max) + 1)
+
+ds = explore_design_space(
+    longs, shorts, apts, codes,
+    room_counts=room_counts,
+    num_floors=int(num_floors),
+    has_elevator=has_elevator,
+)
+st.caption(f"{ds.size:,} konfigürasyon, %{100 * ds.feasible.mean():.0f} uygun")
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ISI HARİTASI
+# ══════════════════════════════════════════════════════════════════════════════
+
+METRICS = {
+    "Net/brüt": ds.net_to_gross,
+    "Daire alanı (m²)": ds.apartment_area,
+    "Koridor payı": ds.corridor_share,
+    "Çekirdek payı": ds.core_share,
+}
+
+col_a, col_b = st.columns([1, 3])
+with col_a:
+    n_sel = st.number_input("Kat başı daire", min_value=1, max_value=int(apts_max), value=min(4, int(apts_max)))
+    metric = st.radio("Metrik", list(METRICS))
+k = int(n_sel) - 1
+
+with col_b:
+    values = METRICS[metric][:, :, k].T
+    feasible = ds.feasible[:, :, k].T
+    extent = (longs[0], longs[-1], shorts[0], shorts[-1])
+    fig, ax = plt.subplots(figsize=(9, 4.5))
+    im = ax.imshow(
+        np.ma.masked_where(~feasible, values),
+        origin="lower", extent=extent, aspect="auto", cmap="viridis",
+    )
+    ax.contourf(
+        longs, shorts, (~feasible).astype(float), levels=[0.5, 1.5],
+        colors="none", hatches=["//"],
+    )
+    fig.colorbar(im, ax=ax, label=metric)
+    ax.set_xlabel("Uzun kenar (m)")
+    ax.set_ylabel("Kısa kenar (m)")
+    ax.set_title(f"{metric} — kat başı {int(n_sel)} daire")
+    st.pyplot(fig, use_container_width=True)
+    plt.close(fig)
+
+# ── En iyi konfigürasyonlar ──────────────────────────────────────────────────
+
+st.subheader("En yüksek net/brüt (uygun)")
+best = ds.best(10)
+if best:
+    st.table([
+        {"Uzun (m)": L, "Kısa (m)": S, "Daire/kat": n, "Net/brüt": f"{r:.3f}"}
+        for L, S, n, r in best
+    ])
+else:
+    st.warning("Izgarada uygun konfigürasyon yok.")
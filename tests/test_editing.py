@@ -0,0 +1,86 @@
+"""PlanEditor: şerit motoru planında bölme duvarı taşıma."""
+
+import pytest
+
+from core.building_codes import BuildingCodes
+from core.editing import PlanEditor
+from core.genetic import generate_plans
+from core.models import BuildingInput, RoomCountInput, RoomType
+from core.validator import validate_plan
+from core.walls import _generate_walls
+
+
+@pytest.fixture(scope="module")
+def codes():
+    return BuildingCodes()
+
+
+@pytest.fixture
+def strip_plan(codes):
+    building = BuildingInput(long_side=40, short_side=20, apartments_per_floor=2)
+    plans = generate_plans(building, RoomCountInput(), codes, engine="strip", seed=1, precheck=False)
+    return plans[0].model_copy(deep=True)
+
+
+def _corridor_wall(plan, codes):
+    """Daire 1 koridorunun batısındaki (sol şerit tarafı) bölme duvarı."""
+    corridor = next(
+        r for r in plan.rooms
+        if r.room_type == RoomType.KORIDOR_DAIRE and r.apartment_id == 0
+    )
+    axis = corridor.rect.x - codes.inner_wall / 2
+    return next(
+        w for w in plan.walls
+        if not w.is_exterior
+        and abs(w.start.x - w.end.x) < 1e-9 and abs(w.start.x - axis) < 1e-6
+        and min(w.start.y, w.end.y) < corridor.rect.y2 and max(w.start.y, w.end.y) > corridor.rect.y
+    )
+
+
+def _overlaps(plan, codes):
+    return [e for e in validate_plan(plan, codes, mode="fast").errors if e.startswith("Çakışma")]
+
+
+def test_move_strip_partition_resizes_both_sides(strip_plan, codes):
+    editor = PlanEditor(strip_plan, codes)
+    wall = _corridor_wall(strip_plan, codes)
+    before = {r.room_id: r.rect for r in strip_plan.rooms if r.apartment_id == 0}
+    assert not _overlaps(strip_plan, codes)
+
+    result = editor.move_wall(wall, 0.2)
+
+    rooms = {r.room_id: r.rect for r in strip_plan.rooms if r.apartment_id == 0}
+    assert "koridor_daire_0" in result.moved
+    assert len(result.moved) >= 2
+    for room_id in result.moved:
+        old, new = before[room_id], rooms[room_id]
+        if room_id == "koridor_daire_0":
+            assert new.x == pytest.approx(old.x + 0.2) and new.x2 == pytest.approx(old.x2)
+        else:
+            assert new.x2 == pytest.approx(old.x2 + 0.2) and new.x == pytest.approx(old.x)
+    assert not _overlaps(strip_plan, codes)
+
+
+def test_moved_walls_match_regenerated_walls(strip_plan, codes):
+    editor = PlanEditor(strip_plan, codes)
+    editor.move_wall(_corridor_wall(strip_plan, codes), -0.1)
+
+    def key(w):
+        return (round(w.start.x, 4), round(w.start.y, 4), round(w.end.x, 4), round(w.end.y, 4), w.thickness)
+
+    regenerated = _generate_walls(strip_plan.rooms, strip_plan.building_rect, codes)
+    assert sorted(map(key, strip_plan.walls)) == sorted(map(key, regenerated))
+    assert sorted(editor.validation.errors) == sorted(validate_plan(strip_plan, codes).errors)
+
+
+def test_common_area_wall_is_rejected(strip_plan, codes):
+    editor = PlanEditor(strip_plan, codes)
+    hall = next(r for r in strip_plan.rooms if r.room_type == RoomType.KORIDOR_BINA)
+    wall = next(
+        w for w in strip_plan.walls
+        if not w.is_exterior and w.thickness == codes.carrier_wall
+        and abs(w.start.y - w.end.y) < 1e-9
+        and abs(w.start.y - hall.rect.y2) <= codes.inner_wall
+    )
+    with pytest.raises(ValueError, match="Ortak alan"):
+        editor.move_wall(wall, 0.1)
@@ -0,0 +1,38 @@
+"""validate_plan: varsayılan (full) modda olağan planlar geçerli."""
+
+import pytest
+
+from core.building_codes import BuildingCodes
+from core.genetic import generate_plans
+from core.models import BuildingInput, RoomCountInput
+from core.raster import compute_egress
+from core.validator import validate_plan
+
+
+@pytest.fixture(scope="module")
+def codes():
+    return BuildingCodes()
+
+
+@pytest.mark.parametrize("engine", ["strip", "slicing"])
+def test_end_core_plan_validates(codes, engine):
+    building = BuildingInput(long_side=40, short_side=20, apartments_per_floor=2)
+    plan = generate_plans(building, RoomCountInput(), codes, engine=engine, seed=0, precheck=False)[0]
+
+    result = validate_plan(plan, codes)
+
+    assert result.is_valid, result.errors
+    assert "egress" in result.timings
+
+
+def test_egress_is_measured_from_the_entrance(codes):
+    building = BuildingInput(long_side=40, short_side=20, apartments_per_floor=2)
+    plan = generate_plans(building, RoomCountInput(), codes, seed=0, precheck=False)[0]
+
+    full = compute_egress(plan, codes)
+    fast = compute_egress(plan, codes, full_map=False)
+
+    assert fast.per_apartment == full.per_apartment
+    for apt, dist in full.per_apartment.items():
+        assert dist <= full.limit
+        assert dist < full.farthest[apt]